@@ -0,0 +1,57 @@
+import argparse
+import json
+from handlers.benchmarkHandler import runBenchmarks
+from helpers.benchmarkHelper import (
+    DEFAULT_SEED,
+    SCALING_SIZES,
+    compareResults,
+    saveResults,
+)
+
+GROUPS = ("catalog", "micro", "card", "batch", "scaling")
+DEFAULT_GROUPS = ("catalog", "micro", "card", "batch")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the card pipeline.")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per case")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--jobs", type=int, default=1, help="batch worker processes")
+    parser.add_argument(
+        "--limit", type=int, default=None, help="cards per batch (default: all)"
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=GROUPS,
+        default=list(DEFAULT_GROUPS),
+        help="case groups; 'scaling' is slow and only runs when selected",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=list(SCALING_SIZES),
+        help="synthetic catalog sizes of the scaling cases",
+    )
+    parser.add_argument("--output", default=None, help="results JSON path")
+    parser.add_argument("--compare", default=None, help="earlier results JSON")
+    args = parser.parse_args()
+
+    results = runBenchmarks(
+        args.repeat, args.seed, args.jobs, args.limit, args.only, args.sizes
+    )
+    for name, case in results["cases"].items():
+        print(
+            f"{name:<36} p50 {case['p50Ms']:>9.2f}ms  p95 {case['p95Ms']:>9.2f}ms  "
+            f"{case['itemsPerSec']:>9.1f}/s"
+        )
+    print(f"results written to {saveResults(results, args.output)}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        print("\n".join(compareResults(baseline, results)))
+
+
+if __name__ == "__main__":
+    main()
@@ -459,3 +459,11 @@ class Spell:
             "savingThrow": self.savingThrow.value if self.savingThrow else None,
             "areaOfEffect": self.areaOfEffect.value if self.areaOfEffect else None,
         }
+
+
+class NormalizedAsset(TypedDict):
+    source: list[int]  # [mtime_ns, size] of the original file
+    output: str  # normalized copy, relative to PATHS.ASSET_CACHE
+    size: list[int]  # original width and height
+    crop: list[int]  # opaque box (left, top, right, bottom) in original pixels
+    scale: float  # normalized pixels per original pixel
@@ -25,6 +25,12 @@ GAME = _GameConstants()
 class _CardConstants:
     def __init__(self) -> None:
         self.RESOLUTION: tuple[int, int] = (1780, 2485)  # (x, y)
+        self.PREVIEW_DIVISOR: int = 5
+        self.PREVIEW_RESOLUTION: tuple[int, int] = (
+            self.RESOLUTION[0] // self.PREVIEW_DIVISOR,
+            self.RESOLUTION[1] // self.PREVIEW_DIVISOR,
+        )
+        self.TEMPLATE: str = "default"  # card design in config/templates
 
 
 CARD = _CardConstants()
@@ -46,6 +52,8 @@ class _FontConstants:
         self.TITLE_PATH: str = self.PATHS.BOLD_ITALIC
         self.PRICE_PATH: str = self.PATHS.BOLD
         self.STATS_PATH: str = self.PATHS.BOLD
+        self.CACHE_SIZE: int = 256  # max (path, size) fonts kept in memory
+        self.METRICS_SIZE: int = 1000  # reference size of the scaled font metrics
 
 
 FONT = _FontConstants()
@@ -64,71 +72,15 @@ class _ImagePaths:
         self.APP_ICON: str = join(self.ASSETS, "logo.png")
 
 
-class _BackgroundImages:
-    def __init__(self) -> None:
-        bg_path = join(SRC, "assets", "background")
-        self.GOLD_ITEM: str = join(bg_path, "item_gold_template.png")
-        self.SILVER_ITEM: str = join(bg_path, "item_silver_template.png")
-        self.COPPER_ITEM: str = join(bg_path, "item_copper_template.png")
-        self.SPELL: str = join(bg_path, "spell_background.png")
-
-
-class _TargetIconPaths:
-    def __init__(self) -> None:
-        targets_path = join(SRC, "assets", "icons", "targets")
-        self.CONE: str = join(targets_path, "cone.png")
-        self.CREATURE: str = join(targets_path, "creature.png")
-        self.CUBE: str = join(targets_path, "cube.png")
-        self.CYLINDER: str = join(targets_path, "cylinder.png")
-        self.LINE: str = join(targets_path, "line.png")
-        self.OBJECT: str = join(targets_path, "object.png")
-        self.POINT: str = join(targets_path, "point.png")
-        self.RECTANGLE: str = join(targets_path, "rectangle.png")
-        self.SELF: str = join(targets_path, "self.png")
-        self.SPHERE: str = join(targets_path, "sphere.png")
-
-
-class _LevelIconPaths:
-    def __init__(self) -> None:
-        levels_path = join(SRC, "assets", "icons", "levels")
-        self.LEVEL_1: str = join(levels_path, "1seal.png")
-        self.LEVEL_2: str = join(levels_path, "2nature_seal.png")
-        self.LEVEL_3: str = join(levels_path, "3blue_seal.png")
-        self.LEVEL_4: str = join(levels_path, "4bronze_seal.png")
-        self.LEVEL_5: str = join(levels_path, "5silver_seal.png")
-        self.LEVEL_6: str = join(levels_path, "6gold_seal.png")
-        self.LEVEL_7: str = join(levels_path, "7dark_seal.png")
-        self.LEVEL_8: str = join(levels_path, "8enchanted_seal.png")
-        self.LEVEL_9: str = join(levels_path, "9molten_seal.png")
-
-
-class _IconPaths:
-    def __init__(self) -> None:
-        icons_path = join(SRC, "assets", "icons")
-        # Spell component and status icons
-        self.CONCENTRATION: str = join(icons_path, "concentration.png")
-        self.COOLDOWN: str = join(icons_path, "cooldown.png")
-        self.DAMAGE: str = join(icons_path, "damage.png")
-        self.DURATION: str = join(icons_path, "duration.png")
-        self.GESTURAL: str = join(icons_path, "gestural.png")
-        self.MATERIAL: str = join(icons_path, "material.png")
-        self.RANGE: str = join(icons_path, "range.png")
-        self.RITUAL: str = join(icons_path, "ritual.png")
-        self.SIGHT: str = join(icons_path, "sight.png")
-        self.SPOKEN: str = join(icons_path, "spoken.png")
-        self.STRIKE: str = join(icons_path, "strike.png")
-        # Target icons
-        self.TARGETS: _TargetIconPaths = _TargetIconPaths()
-        # Level icons
-        self.LEVELS: _LevelIconPaths = _LevelIconPaths()
-
-
 class _ImageConstants:
     def __init__(self) -> None:
         self.FORMAT: str = "png"
         self.PATHS: _ImagePaths = _ImagePaths()
-        self.BACKGROUNDS: _BackgroundImages = _BackgroundImages()
-        self.ICONS: _IconPaths = _IconPaths()
+        self.ART_CACHE_BYTES: int = 256 * 1024 * 1024  # decoded/transformed art
+        self.ANGLE_STEP: float = 0.1  # artwork rotation is quantized to this
+        self.MIP_MAX_LEVEL: int = 5  # smallest pyramid level is 1/32 of the source
+        self.MIP_DISK_CACHE: bool = True  # keep pyramid levels under cache/mips
+        self.MIP_CACHE_BYTES: int = 512 * 1024 * 1024  # on disk, least recently used go first
 
 
 IMAGE = _ImageConstants()
@@ -152,7 +104,19 @@ DATA = _DataPaths()
 # = Output & Cache Paths =
 class _PathConstants:
     def __init__(self) -> None:
-        output = join(ROOT, "output")
+        self.setOutput(join(ROOT, "output"))
+        self.CACHE: str = join(ROOT, "cache")
+        self.ITEM_CACHE: str = join(self.CACHE, "itemCache.json")
+        self.SPELL_CACHE: str = join(self.CACHE, "spellCache.json")
+        self.MIP_CACHE: str = join(self.CACHE, "mips")
+        self.ASSET_CACHE: str = join(self.CACHE, "assets")
+        self.ASSET_INDEX: str = join(self.ASSET_CACHE, "index.json")
+        self.GOLDEN: str = join(ROOT, "golden")  # tracked reference cards
+        self.GOLDEN_RUN: str = join(self.CACHE, "golden")  # diffs of the last check
+        self.TEMPLATES: str = join(SRC, "config", "templates")
+
+    def setOutput(self, output: str) -> None:
+        """Move the output folder and everything written below it to ``output``."""
         self.OUTPUT: str = output
         self.ITEM_OUTPUT: str = join(output, "items")
         self.WEAPON_OUTPUT: str = join(output, "weapons")
@@ -161,9 +125,9 @@ class _PathConstants:
         self.MISSING: str = join(output, "missing")
         self.MISSING_ITEMS: str = join(self.MISSING, "items.json")
         self.MISSING_SPELLS: str = join(self.MISSING, "spells.json")
-        self.CACHE: str = join(ROOT, "cache")
-        self.ITEM_CACHE: str = join(self.CACHE, "itemCache.json")
-        self.SPELL_CACHE: str = join(self.CACHE, "spellCache.json")
+        self.BUILD_MANIFEST: str = join(output, "manifest.json")
+        self.PROFILE_OUTPUT: str = join(output, "profile")
+        self.BENCHMARK_OUTPUT: str = join(output, "benchmarks")
 
 
 PATHS = _PathConstants()
@@ -200,7 +164,7 @@ FONT_STYLE = _FontStyling()
 SECONDARY_FONT_STYLE = _FontStyling(primary=False)
 
 
-# = Items =
+# = Layout =
 class _Position:
     def __init__(
         self, relative: tuple[float, float], absolute: tuple[int, int]
@@ -218,72 +182,29 @@ class _Size:
 
 
 class LayoutElement:
-    def __init__(self, x: float, y: float, width: float, height: float) -> None:
+    def __init__(
+        self, x: float, y: float, width: float, height: float, factor: float = 1.0
+    ) -> None:
+        """A box given in print pixels; ``factor`` scales its absolute values."""
         rel_pos = (x / CARD.RESOLUTION[0], y / CARD.RESOLUTION[1])
         rel_size = (width / CARD.RESOLUTION[0], height / CARD.RESOLUTION[1])
         abs_pos = twoDTruncate(rel_pos, CARD.RESOLUTION)
         abs_size = twoDTruncate(rel_size, CARD.RESOLUTION)
+        if factor != 1:
+            abs_pos = twoDTruncate(abs_pos, (factor, factor))
+            abs_size = twoDTruncate(abs_size, (factor, factor))
 
+        self._box = (x, y, width, height)
+        self._factor = factor
         self.POSITION: _Position = _Position(rel_pos, abs_pos)
         self.SIZE: _Size = _Size(rel_size, abs_size)
 
+    def scaled(self, factor: float) -> "LayoutElement":
+        """Return this element for a canvas ``factor`` times the card resolution."""
+        if factor == 1:
+            return self
+        return LayoutElement(*self._box, factor=self._factor * factor)
 
-class _ItemConstants:
-    def __init__(self) -> None:
-        self.TITLE: LayoutElement = LayoutElement(885, 275, 1000, 275)
-        self.PRICE: LayoutElement = LayoutElement(1460, 580, 350, 250)
-        self.STATS: LayoutElement = LayoutElement(300, 1930, 1350, 350)
-        self.IMAGE: LayoutElement = LayoutElement(900, 1145, 1565, 1330)
-
-
-class _MaterialConstants:
-    def __init__(self) -> None:
-        sY = _SpellConstants.SMALLS_Y_OFFSET
-        lY = _SpellConstants.LOWER_Y_OFFSET
-        self.SPOKEN: LayoutElement = LayoutElement(750, 1900 + lY + sY, 125, 125)
-        self.MATERIAL: LayoutElement = LayoutElement(950, 1830 + lY + sY, 250, 250)
-        self.GESTURAL: LayoutElement = LayoutElement(1100, 1900 + lY + sY, 125, 125)
-        self.NAME: LayoutElement = LayoutElement(925, 2050 + lY + sY, 1000, 175)
-        self.COST: LayoutElement = LayoutElement(930, 1850 + lY + sY, 250, 100)
-
-
-class _SpellConstants:
-    SMALLS_Y_OFFSET: int = 325
-    LOWER_Y_OFFSET: int = -175
-    MID_Y_OFFSET: int = -75
-    MID_X_OFFSET: int = 125
-    def __init__(self) -> None:
-        sY = _SpellConstants.SMALLS_Y_OFFSET
-        mY = _SpellConstants.MID_Y_OFFSET
-        # mX = _SpellConstants.MID_X_OFFSET
-        lY = _SpellConstants.LOWER_Y_OFFSET
-        self.TITLE: LayoutElement = LayoutElement(1000, 275, 675, 250)
-        self.LEVEL: LayoutElement = LayoutElement(545, 305, 280, 280)
-        self.CATEGORY: LayoutElement = LayoutElement(900, 520, 765, 130)
-        self.IMAGE: LayoutElement = LayoutElement(885, 1000, 1550, 750)
-        self.DURATION: LayoutElement = LayoutElement(300, 2150 + lY, 180, 180)
-        self.DURATION_TEXT: LayoutElement = LayoutElement(300, 2300 + lY, 300, 130)
-        # self.COOLDOWN: LayoutElement = LayoutElement(525, 1975 + lY + mY, 180, 180)
-        # self.COOLDOWN_TEXT: LayoutElement = LayoutElement(525, 2125 + lY + mY, 180, 130)
-        self.DAMAGE: LayoutElement = LayoutElement(1275, 1975 + lY + mY, 180, 180)
-        self.DAMAGE_TEXT: LayoutElement = LayoutElement(1275, 2125 + lY + mY, 300, 130)
-        self.RANGE: LayoutElement = LayoutElement(1500, 2150 + lY, 180, 180)
-        self.RANGE_TEXT: LayoutElement = LayoutElement(1500, 2300 + lY, 300, 130)
-        self.MATERIAL: _MaterialConstants = _MaterialConstants()
-        self.CONCENTRATION: LayoutElement = LayoutElement(750, 1775 + lY + sY, 125, 125)
-        self.CAST_TIME: LayoutElement = LayoutElement(525, 1975 + lY + mY, 180, 180)
-        self.CAST_TIME_TEXT: LayoutElement = LayoutElement(525, 2125 + lY + mY, 300, 130)
-        self.RITUAL: LayoutElement = LayoutElement(1100, 1775 + lY + sY, 125, 125)
-        self.SAVING_THROW: LayoutElement = LayoutElement(1275, 1750 + lY, 200, 90)
-        self.SUB_RANGE: LayoutElement = LayoutElement(925, 1925 + lY, 250, 100)
-        self.TARGET: LayoutElement = LayoutElement(925, 1800 + lY, 200, 200)
-        self.OVERLEVEL: LayoutElement = LayoutElement(
-            1600, 1375 + lY, 150, 950
-        )  # for later use
-
-
-ITEM = _ItemConstants()
-SPELL = _SpellConstants()
 
 # = Text Constants =
 from classes.textKeys import PrefixText
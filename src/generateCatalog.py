@@ -0,0 +1,31 @@
+import argparse
+import os
+from config.constants import DATA
+from helpers.syntheticHelper import CATALOG_FILES, writeCatalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Write a synthetic catalog modelled on the bundled data."
+    )
+    parser.add_argument("folder", help="output folder (not the data folder)")
+    parser.add_argument(
+        "--size", type=int, default=1000, help="entries per catalog, e.g. 1000/10000/100000"
+    )
+    for kind in CATALOG_FILES:
+        parser.add_argument(f"--{kind}", type=int, default=None, help=f"{kind} entries")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if os.path.abspath(args.folder) == os.path.abspath(DATA.DIRECTORY):
+        parser.error("refusing to overwrite the bundled catalogs")
+    sizes = {
+        kind: args.size if getattr(args, kind) is None else getattr(args, kind)
+        for kind in CATALOG_FILES
+    }
+    for kind, path in writeCatalog(args.folder, sizes, args.seed).items():
+        print(f"{sizes[kind]:>7} {kind:<8} {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import json
+import sys
+
+try:
+    from handlers.goldenHandler import runGolden
+    from helpers.goldenHelper import GOLDEN_TOLERANCE
+except ImportError as error:
+    if error.name != "numpy":
+        raise
+    sys.exit("the golden-image check needs NumPy: pip install numpy")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare rendered cards against the golden references."
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="re-record every reference image"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=int,
+        default=GOLDEN_TOLERANCE,
+        help="allowed difference per channel (0-255)",
+    )
+    parser.add_argument(
+        "--max-fraction",
+        type=float,
+        default=0.0,
+        help="share of pixels allowed beyond the tolerance",
+    )
+    parser.add_argument("--jobs", type=int, default=0, help="worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    summary = runGolden(args.update, args.tolerance, args.max_fraction, args.jobs)
+    for result in summary["results"]:
+        if result["status"] == "missing":
+            print(f"FAIL {result['case']}: no reference, record it with --update")
+        for label, stats in (("", result), (" preview vs final", result.get("final"))):
+            if stats and stats.get("passed") is False:
+                print(
+                    f"FAIL {result['case']}{label}: {stats['badPixels']} pixels "
+                    f"({stats['badFraction']:.4%}), max diff {stats['maxDiff']}"
+                )
+    print(
+        json.dumps(
+            {key: value for key, value in summary.items() if key != "results"},
+            ensure_ascii=False,
+        )
+    )
+    sys.exit(1 if summary["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,17 @@
 """Handler package exports."""
 
-from .interfaceHandler import InterfaceHandler
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .interfaceHandler import InterfaceHandler
 
 __all__ = ["InterfaceHandler"]
+
+
+def __getattr__(name: str) -> Any:
+    # imported on first use so headless tools never load tkinter
+    if name == "InterfaceHandler":
+        from .interfaceHandler import InterfaceHandler
+
+        return InterfaceHandler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,247 @@
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Generator, Optional, Sequence
+import PIL
+from config.constants import CARD, PATHS
+from classes.types import JsonItemCache, Spell, Weapon
+from handlers.imageHandler import ImageHandler
+from helpers.benchmarkHelper import (
+    BENCHMARK_VERSION,
+    DEFAULT_SEED,
+    KEYSTROKES,
+    SAMPLE_CARDS,
+    SCALING_RENDERS,
+    SCALING_SIZES,
+    catalogCases,
+    catalogData,
+    keystrokes,
+    measureCatalogLoad,
+    microCases,
+    timeCase,
+)
+from helpers.dataHelper import getArmors, getItems, getSpells, getWeapons
+from helpers.filterHelper import filterCards, filterWeapons
+from helpers.missingHelper import flushMissing
+from helpers.syntheticHelper import CATALOG_FILES, writeCatalog
+from helpers.translationHelper import (
+    get_language,
+    get_print_missing,
+    get_skip_missing,
+    use_missing_settings,
+)
+
+
+@contextmanager
+def isolatedOutput() -> Generator[str, None, None]:
+    """Redirect every output path to a temporary folder for the block.
+
+    Missing art is rendered without artwork and never skipped, so every run
+    draws the same cards whatever art is installed. Settings are not saved.
+    Render pools started in the block pass both on to their workers.
+    """
+    folder = tempfile.mkdtemp(prefix="dhelper-bench-")
+    output = PATHS.OUTPUT
+    missing = (get_skip_missing(), get_print_missing())
+    PATHS.setOutput(folder)
+    use_missing_settings(False, True)
+    try:
+        yield folder
+    finally:
+        flushMissing()  # ids recorded in the block point into ``folder``
+        PATHS.setOutput(output)
+        use_missing_settings(*missing)
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def cardCases(
+    repeat: int, rng: random.Random, spells: list[Spell], weapons: list[Weapon]
+) -> dict[str, Any]:
+    """Time single cards at print resolution and preview recomposition.
+
+    The same seeded sample of cards and transforms is used on every run.
+    """
+    handler = ImageHandler()
+    handler.warmIconCache()
+    transforms: list[JsonItemCache] = [
+        {
+            "rotate": rng.uniform(-30, 30),
+            "flip": rng.random() < 0.5,
+            "scale": rng.uniform(0.6, 1.4),
+            "offset_x": rng.uniform(-100, 100),
+            "offset_y": rng.uniform(-100, 100),
+        }
+        for _ in range(SAMPLE_CARDS)
+    ]
+    kinds: list[tuple[str, Sequence[Any], Callable[..., Any], Callable[..., Any]]] = [
+        ("spell", spells, handler.renderSpellCard, handler.renderSpellLayers),
+        ("weapon", weapons, handler.renderItemCard, handler.renderItemLayers),
+    ]
+    cases: dict[str, Any] = {}
+    for kind, catalog, render, layers in kinds:
+        sample = rng.sample(list(catalog), min(SAMPLE_CARDS, len(catalog)))
+        if not sample:
+            continue
+        cards = iter(sample * repeat)
+        cases[f"card.single.{kind}"] = timeCase(
+            lambda: render(next(cards)), repeat * len(sample)
+        )
+        previews = iter([(card, t) for card in sample for t in transforms] * repeat)
+
+        def compose() -> None:
+            card, transform = next(previews)
+            handler.composeCard(layers(card, CARD.PREVIEW_RESOLUTION), **transform)
+
+        cases[f"preview.compose.{kind}"] = timeCase(
+            compose, repeat * len(sample) * len(transforms)
+        )
+    return cases
+
+
+def batchCases(
+    repeat: int, jobs: int = 1, limit: Optional[int] = None
+) -> dict[str, Any]:
+    """Time forced batch renders of every catalog.
+
+    ``limit`` renders only the first cards of each catalog with
+    ``renderCards`` instead of the ``create*Cards`` methods.
+    """
+    batches: list[tuple[str, Callable[[], Sequence[Any]], str]] = [
+        ("spells", getSpells, "createSpellCards"),
+        ("weapons", getWeapons, "createWeaponCards"),
+        ("armor", getArmors, "createArmorCards"),
+        ("items", getItems, "createSimpleItemCards"),
+    ]
+    cases: dict[str, Any] = {}
+    for name, load, method in batches:
+        cards = load()[:limit] if limit is not None else load()
+        if not cards:
+            continue
+        handler = ImageHandler()
+        if limit is None:
+            run = lambda: getattr(handler, method)(jobs=jobs, force=True)
+        else:
+            run = lambda: handler.renderCards(cards, None, False, jobs, force=True)
+        cases[f"batch.{name}"] = timeCase(run, repeat, len(cards))
+    return cases
+
+
+def scalingCases(
+    repeat: int,
+    rng: random.Random,
+    sizes: Sequence[int] = SCALING_SIZES,
+    jobs: int = 1,
+) -> dict[str, Any]:
+    """Time loading, manage-window filtering and rendering of synthetic catalogs.
+
+    Every catalog holds ``size`` spells, weapons, armor and items. Loading
+    runs in a fresh process per size so its peak RSS can be reported;
+    filtering replays typed searches like the manage windows do, including
+    their sort; rendering batches ``SCALING_RENDERS`` cards per kind and
+    the manifest check covers the whole catalog.
+    """
+    cases: dict[str, Any] = {}
+    context = multiprocessing.get_context("spawn")
+    for size in sizes:
+        folder = tempfile.mkdtemp(prefix=f"dhelper-catalog-{size}-")
+        try:
+            seed = rng.randrange(2**32)
+            cases[f"scale.{size}.generate"] = timeCase(
+                lambda: writeCatalog(folder, {kind: size for kind in CATALOG_FILES}, seed),
+                1,
+                size * len(CATALOG_FILES),
+            )
+            with ProcessPoolExecutor(1, mp_context=context) as executor:
+                cases[f"scale.{size}.load"] = executor.submit(
+                    measureCatalogLoad, folder, repeat
+                ).result()
+            with catalogData(folder):
+                spells, weapons = getSpells(), getWeapons()
+                spellSearches = iter(keystrokes(rng, [s.name for s in spells], repeat))
+                cases[f"scale.{size}.filter.spells"] = timeCase(
+                    lambda: sorted(
+                        filterCards(spells, next(spellSearches)), key=lambda s: s.id
+                    ),
+                    repeat * KEYSTROKES,
+                    len(spells),
+                )
+                weaponSearches = iter(keystrokes(rng, [w.name for w in weapons], repeat))
+                attributes = [
+                    attrs[:1] for attrs in (w.attributes for w in weapons) if attrs
+                ]
+                weaponFilters = iter(
+                    [(text, rng.choice(attributes or [[]])) for text in weaponSearches]
+                )
+
+                def filterWeaponList() -> None:
+                    text, selected = next(weaponFilters)
+                    sorted(filterWeapons(weapons, text, selected), key=lambda w: w.name)
+
+                cases[f"scale.{size}.filter.weapons"] = timeCase(
+                    filterWeaponList, repeat * KEYSTROKES, len(weapons)
+                )
+                handler = ImageHandler()
+                cards = [*spells[:SCALING_RENDERS], *weapons[:SCALING_RENDERS]]
+                cases[f"scale.{size}.render"] = timeCase(
+                    lambda: handler.renderCards(cards, None, False, jobs, force=True),
+                    1,
+                    len(cards),
+                )
+                catalog = [*spells, *weapons]
+                cases[f"scale.{size}.manifestCheck"] = timeCase(
+                    lambda: [handler.isCardCurrent(card) for card in catalog],
+                    1,
+                    len(catalog),
+                )
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+    return cases
+
+
+def runBenchmarks(
+    repeat: int = 5,
+    seed: int = DEFAULT_SEED,
+    jobs: int = 1,
+    limit: Optional[int] = None,
+    groups: Sequence[str] = ("catalog", "micro", "card", "batch"),
+    sizes: Sequence[int] = SCALING_SIZES,
+) -> dict[str, Any]:
+    """Run the selected benchmark ``groups`` and return their results.
+
+    Cards are written to a temporary folder, see :func:`isolatedOutput`.
+    """
+    rng = random.Random(seed)
+    spells, weapons = getSpells(), getWeapons()
+    cases: dict[str, Any] = {}
+    with isolatedOutput():
+        if "catalog" in groups:
+            cases.update(catalogCases(repeat))
+        if "micro" in groups:
+            cases.update(microCases(repeat, spells, weapons))
+        if "card" in groups:
+            cases.update(cardCases(repeat, rng, spells, weapons))
+        if "batch" in groups:
+            cases.update(batchCases(repeat, jobs, limit))
+        if "scaling" in groups:
+            cases.update(scalingCases(repeat, rng, sizes, jobs))
+    return {
+        "version": BENCHMARK_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seed": seed,
+        "repeat": repeat,
+        "jobs": jobs,
+        "limit": limit,
+        "sizes": list(sizes) if "scaling" in groups else None,
+        "language": get_language(),
+        "python": platform.python_version(),
+        "pillow": PIL.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "cases": cases,
+    }
@@ -0,0 +1,160 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from os.path import join
+from typing import Any, Optional
+from PIL import Image
+from config.constants import CARD, PATHS
+from handlers.benchmarkHandler import isolatedOutput
+from handlers.imageHandler import ImageHandler, initRenderWorker, renderWorkerSettings
+from helpers.goldenHelper import (
+    GOLDEN_TOLERANCE,
+    GoldenCase,
+    compareImages,
+    goldenCases,
+    goldenCatalog,
+    heatmap,
+)
+from helpers.templateHelper import CARD_KINDS
+
+
+def renderCase(handler: ImageHandler, case: GoldenCase) -> Image.Image:
+    """Render ``case`` in memory; preview cases go through the cached layers."""
+    card = goldenCatalog()[case.kind][case.cardId]
+    transform: dict[str, Any] = dict(case.transform or {})
+    if case.preview:
+        layers = (
+            handler.renderSpellLayers(card, CARD.PREVIEW_RESOLUTION)
+            if case.kind == "spell"
+            else handler.renderItemLayers(card, CARD.PREVIEW_RESOLUTION)
+        )
+        return handler.composeCard(layers, **transform)
+    return renderFinal(handler, case)
+
+
+def renderFinal(handler: ImageHandler, case: GoldenCase) -> Image.Image:
+    """Render ``case`` the way the saved cards are drawn, at the case's resolution."""
+    card = goldenCatalog()[case.kind][case.cardId]
+    transform: dict[str, Any] = dict(case.transform or {})
+    if case.preview:
+        transform["resolution"] = CARD.PREVIEW_RESOLUTION
+    if case.kind == "spell":
+        return handler.renderSpellCard(card, **transform)
+    return handler.renderItemCard(card, **transform)
+
+
+def _compare(
+    name: str,
+    expected: Image.Image,
+    actual: Image.Image,
+    tolerance: int,
+    maxFraction: float,
+    diffFolder: str,
+) -> tuple[dict[str, Any], bool]:
+    """Compare two renders and leave the actual image and a heatmap on failure."""
+    stats, peak = compareImages(expected, actual, tolerance)
+    passed = peak is not None and stats["badFraction"] <= maxFraction
+    if not passed:
+        os.makedirs(diffFolder, exist_ok=True)
+        actual.save(join(diffFolder, f"{name}.actual.png"), compress_level=1)
+        if peak is not None:
+            heatmap(expected, peak, tolerance).save(
+                join(diffFolder, f"{name}.heatmap.png"), compress_level=1
+            )
+    stats["passed"] = passed
+    return stats, passed
+
+
+def _checkCase(
+    case: GoldenCase,
+    folder: str,
+    diffFolder: str,
+    tolerance: int,
+    maxFraction: float,
+    update: bool,
+) -> dict[str, Any]:
+    start = time.perf_counter()
+    handler = ImageHandler()
+    actual = renderCase(handler, case)
+    referencePath = join(folder, f"{case.name}.png")
+    result: dict[str, Any] = {"case": case.name}
+    if update:
+        actual.save(referencePath)
+        result["status"] = "updated"
+    elif not os.path.exists(referencePath):
+        result["status"] = "missing"
+    else:
+        with Image.open(referencePath) as reference:
+            expected = reference.copy()
+        stats, passed = _compare(
+            case.name, expected, actual, tolerance, maxFraction, diffFolder
+        )
+        result.update(stats)
+        result["status"] = "pass" if passed else "fail"
+    if case.preview:
+        # the preview must look like the card saved at the same resolution
+        stats, passed = _compare(
+            f"{case.name}.final",
+            renderFinal(handler, case),
+            actual,
+            tolerance,
+            maxFraction,
+            diffFolder,
+        )
+        result["final"] = stats
+        if not passed:
+            result["status"] = "fail"
+    result["ms"] = (time.perf_counter() - start) * 1e3
+    return result
+
+
+def runGolden(
+    update: bool = False,
+    tolerance: int = GOLDEN_TOLERANCE,
+    maxFraction: float = 0.0,
+    jobs: int = 0,
+    folder: Optional[str] = None,
+) -> dict[str, Any]:
+    """Render the reference set and compare it against ``folder``.
+
+    A missing reference fails the case; ``update`` rewrites all of them.
+    Preview cases are also compared against the full render at preview
+    resolution. Mismatching cases leave ``<case>.actual.png`` and
+    ``<case>.heatmap.png`` in ``PATHS.GOLDEN_RUN/diff``. ``folder``
+    defaults to ``PATHS.GOLDEN`` and ``jobs <= 0`` uses all cores.
+    """
+    start = time.perf_counter()
+    folder = folder or PATHS.GOLDEN
+    os.makedirs(folder, exist_ok=True)
+    diffFolder = join(PATHS.GOLDEN_RUN, "diff")
+    for name in os.listdir(diffFolder) if os.path.isdir(diffFolder) else []:
+        os.remove(join(diffFolder, name))
+    cases = goldenCases()
+    jobs = min(jobs if jobs > 0 else os.cpu_count() or 1, len(cases))
+    args = [(case, folder, diffFolder, tolerance, maxFraction, update) for case in cases]
+    with isolatedOutput():
+        if jobs <= 1:
+            ImageHandler().warmIconCache()
+            results = [_checkCase(*arg) for arg in args]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=initRenderWorker,
+                initargs=(CARD_KINDS, renderWorkerSettings()),
+            ) as executor:
+                results = list(executor.map(_checkCase, *zip(*args)))
+    summary = {
+        "cases": len(results),
+        "failed": [r["case"] for r in results if r["status"] in ("fail", "missing")],
+        "missing": [r["case"] for r in results if r["status"] == "missing"],
+        "updated": sum(r["status"] == "updated" for r in results),
+        "tolerance": tolerance,
+        "maxFraction": maxFraction,
+        "seconds": time.perf_counter() - start,
+        "results": results,
+    }
+    os.makedirs(PATHS.GOLDEN_RUN, exist_ok=True)
+    with open(join(PATHS.GOLDEN_RUN, "last_run.json"), "w", encoding="utf-8") as file:
+        json.dump(summary, file, ensure_ascii=False, indent=4)
+    return summary
@@ -1,14 +1,16 @@
-from typing import Optional, Callable, List, Any
+from typing import Optional, Callable, List, Any, Mapping, Sequence
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import errno
 import os
 import json
+import math
 from config.constants import (
     # New hierarchical constants
     FONT_STYLE,
     SECONDARY_FONT_STYLE,
     IMAGE,
-    ITEM,
     PATHS,
-    SPELL,
     TEXT,
     FONT,
     LayoutElement,
@@ -23,17 +25,58 @@ from classes.types import (
     Item,
     Weapon,
     Spell,
-    TargetType,
+    JsonItemCache,
+    NormalizedAsset,
 )
 from helpers.translationHelper import (
     translate,
     shortName,
     get_print_missing,
     get_skip_missing,
+    get_language,
+    use_missing_settings,
+)
+from helpers.fontHelper import getFont
+from helpers.assetHelper import (
+    getArt,
+    getArtSize,
+    getBackground,
+    getIcon,
+    quantizeAngle,
+    rotatedSize,
+    warmIcons,
+)
+from helpers.normalizeHelper import (
+    artFolders,
+    getNormalizedAsset,
+    normalizedAssetPath,
+)
+from helpers.assetIndexHelper import artExists, refreshAssetIndex
+from helpers.missingHelper import (
+    flushMissing,
+    mergeMissing,
+    recordMissing,
+    takeMissing,
+)
+from helpers.manifestHelper import BuildManifest, cardDigest, renderFingerprint
+from helpers.profileHelper import (
+    RenderProfile,
+    captureCard,
+    profileSpan,
+    profiled,
+    profilingEnabled,
+)
+from helpers.templateHelper import (
+    CARD_KINDS,
+    CardTemplate,
+    TemplateElement,
+    getTemplate,
 )
 from helpers.dataHelper import getWeapons, getArmors, getItems, getSpells
 from helpers.formattingHelper import (
+    fitFontSize,
     getMaxFontSize,
+    measureText,
     findOptimalAttributeLayout,
     formatDamage,
     formatTimedelta,
@@ -42,40 +85,180 @@ from helpers.formattingHelper import (
     wrapText,
 )
 from os.path import join
-from PIL import Image, ImageDraw, ImageFont
-from PIL.Image import Resampling, Transpose
+from PIL import Image, ImageDraw
 
 from helpers.tupleHelper import twoDSub, twoDTruncate
 
 
-class ImageHandler:
-    def __init__(self) -> None:
-        pass
+Card = Item | SimpleItem | Armor | Spell
+
+LAYER_CACHE_SIZE = 8
+
+_baseLayers: dict[tuple[Any, ...], tuple[tuple[Any, ...], Image.Image]] = {}
+# (handler, card bindings) -> instruction of one template element
+_ElementFactory = Callable[["ImageHandler", dict[str, Any]], Callable[[Image.Image], None]]
 
-    def _writeMissing(self, path: str, missing: List[str]) -> None:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as file:
-            json.dump(sorted(missing), file, ensure_ascii=False, indent=4)
 
-    def _recordMissing(self, path: str, asset_id: str) -> None:
+def _renderCardWorker(
+    job: tuple[Card, bool, Optional[JsonItemCache]],
+) -> tuple[Optional[str], Optional[dict[str, Any]], dict[str, tuple[list[str], bool]]]:
+    """Render one card inside a pool worker.
+
+    Returns the card id when its art is missing and ``skip_missing`` is set,
+    otherwise ``None``, together with the card's profile when profiling is
+    on and the missing-art ids it recorded, which the parent process writes.
+    Missing art without ``skip_missing`` is re-raised so the parent process
+    sees the same error as the serial path.
+    """
+    card, skip_missing, transform = job
+    handler = ImageHandler()
+    t = transform or {}
+    kwargs: dict[str, Any] = {
+        "rotate": t.get("rotate", 0.0),
+        "flip": bool(t.get("flip", False)),
+        "scale": t.get("scale", 1.0),
+        "offset_x": t.get("offset_x", 0.0),
+        "offset_y": t.get("offset_y", 0.0),
+    }
+    missingId: Optional[str] = None
+    with captureCard(card.id) as capture:
         try:
-            with open(path, "r", encoding="utf-8") as file:
-                data = json.load(file)
-                if not isinstance(data, list):
-                    ids: set[str] = set()
-                else:
-                    ids = set([str(i) for i in data]) # type: ignore
-                ids = set(str(i) for i in ids)
+            if isinstance(card, Spell):
+                handler.createSpellCard(card, **kwargs)
+            else:
+                handler.createItemCard(card, **kwargs)
         except FileNotFoundError:
-            ids = set()
-        ids.add(asset_id)
-        self._writeMissing(path, list(ids))
+            if not skip_missing:
+                raise
+            missingId = card.id
+    return missingId, capture.result() if capture is not None else None, takeMissing()
+
+
+class _CardPlan:
+    """Instructions of a card, split around its artwork."""
+
+    def __init__(
+        self,
+        background: Image.Image,
+        below: List[Callable[[Image.Image], None]],
+        art: Optional[tuple[str, LayoutElement]],
+        above: List[Callable[[Image.Image], None]],
+    ) -> None:
+        self.background = background
+        self.below = below
+        self.art = art
+        self.above = above
+
+    def instructions(
+        self,
+        handler: "ImageHandler",
+        rotate: float,
+        flip: bool,
+        scale: float,
+        offset_x: float,
+        offset_y: float,
+    ) -> List[Callable[[Image.Image], None]]:
+        if self.art is None:
+            return self.below + self.above
+        path, layout = self.art
+        artOp = handler._imageOp(  # pyright: ignore[reportPrivateUsage]
+            path, layout, rotate, flip, scale, offset_x, offset_y
+        )
+        return [*self.below, artOp, *self.above]
+
+
+class CardLayers:
+    """A card rendered below and above its artwork.
+
+    ``above`` is transparent except for the elements drawn over the art, so
+    a transform change only needs the art re-placed between the two layers.
+    """
+
+    def __init__(
+        self,
+        below: Image.Image,
+        art: Optional[tuple[str, LayoutElement]],
+        above: Image.Image,
+    ) -> None:
+        self.below = below
+        self.art = art
+        self.above = above
+
+
+def renderWorkerSettings() -> tuple[str, bool, bool]:
+    """What a pool worker must share with this process: output root and missing-art handling.
+
+    Workers started with ``spawn`` re-import the modules and would otherwise
+    fall back to the defaults.
+    """
+    return PATHS.OUTPUT, get_skip_missing(), get_print_missing()
+
+
+def initRenderWorker(kinds: Sequence[str], settings: tuple[str, bool, bool]) -> None:
+    """Pool initializer: apply :func:`renderWorkerSettings` and load the icons of ``kinds``."""
+    output, skipMissing, printMissing = settings
+    PATHS.setOutput(output)
+    use_missing_settings(skipMissing, printMissing)
+    ImageHandler().warmIconCache(kinds)
+
+
+class ImageHandler:
+    def __init__(self) -> None:
+        self._manifest: Optional[BuildManifest] = None
+        self._fingerprint: Optional[str] = None
+        self._layers: "OrderedDict[tuple[Any, ...], CardLayers]" = OrderedDict()
+        self.lastProfile: Optional[tuple[str, str]] = None
+
+    def _templateKind(self, card: Card) -> str:
+        return "spell" if isinstance(card, Spell) else "item"
+
+    def _baseLayer(
+        self,
+        template: CardTemplate,
+        backgroundPath: str,
+        resolution: tuple[int, int] = CARD.RESOLUTION,
+    ) -> Image.Image:
+        """Return a copy of a background with the template's static icons on it.
+
+        The layer is rebuilt when the background, a static icon or the
+        template file change.
+        """
+        if not template.static:
+            return getBackground(backgroundPath, resolution)
+        staticIcons = [(e.image.resolve({}), e.layout) for e in template.static if e.image]
+        key = (
+            os.path.getmtime(backgroundPath),
+            os.path.getmtime(template.path),
+            tuple((path, os.path.getmtime(path)) for path, _ in staticIcons),
+        )
+        cacheKey = (template.path, template.kind, backgroundPath, resolution)
+        cached = _baseLayers.get(cacheKey)
+        if cached is None or cached[0] != key:
+            base = getBackground(backgroundPath, resolution)
+            for path, layout in staticIcons:
+                self._iconOp(path, layout)(base)
+            cached = (key, base)
+            _baseLayers[cacheKey] = cached
+        return cached[1].copy()
+
+    def warmIconCache(self, kinds: Sequence[str] = CARD_KINDS) -> None:
+        """Load every icon and base layer the templates of ``kinds`` can use."""
+        for kind in kinds:
+            template = getTemplate(kind)
+            warmIcons(template.icons())
+            if template.static:
+                for backgroundPath in template.background.paths():
+                    self._baseLayer(template, backgroundPath)
 
     def recordMissingItem(self, item_id: str) -> None:
-        self._recordMissing(PATHS.MISSING_ITEMS, item_id)
+        recordMissing(PATHS.MISSING_ITEMS, [item_id])
 
     def recordMissingSpell(self, spell_id: str) -> None:
-        self._recordMissing(PATHS.MISSING_SPELLS, spell_id)
+        recordMissing(PATHS.MISSING_SPELLS, [spell_id])
+
+    def flushMissing(self) -> None:
+        """Write the missing-art ids recorded since the last flush."""
+        flushMissing()
 
     def getItemOutputPath(self, item: Item | SimpleItem | Armor) -> str:
         """Get the output path for an item based on its type."""
@@ -88,32 +271,148 @@ class ImageHandler:
         else:  # isinstance(item, Item) - covers general items and weapons
             return join(PATHS.WEAPON_OUTPUT, f"{item.id}.png")
 
+    def getSpellOutputPath(self, spell: Spell) -> str:
+        """Get the output path for a spell, grouped by level."""
+        return join(PATHS.SPELL_OUTPUT, f"level{spell.level}", f"{spell.id}.png")
+
+    def getSpellAssetPath(self, spell: Spell) -> str:
+        """Get the art path for a spell, preferring an up-to-date normalized copy."""
+        return normalizedAssetPath(self._artSourcePath(spell))
+
+    def _artSourcePath(self, card: Card) -> str:
+        """Path of the original artwork of ``card`` in ``IMAGE.PATHS``."""
+        if isinstance(card, Spell):
+            folder = IMAGE.PATHS.SPELLS
+        elif isinstance(card, Armor):
+            folder = IMAGE.PATHS.ARMOR
+        elif isinstance(card, Weapon):
+            folder = IMAGE.PATHS.WEAPONS
+        elif isinstance(card, SimpleItem):
+            folder = IMAGE.PATHS.ITEMS
+        else:  # isinstance(card, Item) - covers general items and weapons
+            folder = IMAGE.PATHS.WEAPONS
+        return join(folder, f"{card.id}.{IMAGE.FORMAT}")
+
+    def preflightArt(
+        self, cards: Optional[Sequence[Card]] = None
+    ) -> dict[str, list[str]]:
+        """Ids of cards without artwork by kind, before anything is rendered.
+
+        ``cards`` defaults to every weapon, armor, item and spell in the
+        catalogs. The art folders are scanned once, rescanning only folders
+        whose mtime changed since the last report.
+        """
+        if cards is None:
+            cards = [*getWeapons(), *getArmors(), *getItems(), *getSpells()]
+        refreshAssetIndex(artFolders())
+        report: dict[str, list[str]] = {}
+        for card in cards:
+            if not artExists(self._artSourcePath(card), refresh=False):
+                report.setdefault(self._cardKind(card), []).append(card.id)
+        return report
+
+    def _cardKind(self, card: Card) -> str:
+        if isinstance(card, Spell):
+            return "spell"
+        if isinstance(card, Armor):
+            return "armor"
+        if isinstance(card, SimpleItem):
+            return "item"
+        return "weapon"
+
+    def _cardKey(self, card: Card) -> str:
+        return f"{self._cardKind(card)}/{card.id}"
+
+    def _cardEntry(self, card: Card) -> Any:
+        if isinstance(card, Spell):
+            return card.toJsonSpell()
+        if isinstance(card, Armor):
+            return card.toJsonArmor()
+        if isinstance(card, SimpleItem):
+            return card.toJsonSimpleItem()
+        return card.toJsonItem()
+
+    def _cardPaths(self, card: Card) -> tuple[str, str]:
+        """Return the (asset, output) paths of ``card``."""
+        if isinstance(card, Spell):
+            return self.getSpellAssetPath(card), self.getSpellOutputPath(card)
+        return self.getItemAssetPath(card), self.getItemOutputPath(card)
+
+    def _getManifest(self) -> BuildManifest:
+        if self._manifest is None:
+            self._manifest = BuildManifest()
+        return self._manifest
+
+    def _cardDigest(self, card: Card, transform: Optional[JsonItemCache]) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = renderFingerprint()
+        assetPath, _ = self._cardPaths(card)
+        return cardDigest(self._fingerprint, self._cardEntry(card), transform, assetPath)
+
+    def isCardCurrent(
+        self, card: Card, transform: Optional[JsonItemCache] = None
+    ) -> bool:
+        """Return ``True`` if the card on disk was built from the current inputs."""
+        _, outputPath = self._cardPaths(card)
+        return self._getManifest().isCurrent(
+            self._cardKey(card), self._cardDigest(card, transform), outputPath
+        )
+
+    def recordCardBuilt(
+        self, card: Card, transform: Optional[JsonItemCache] = None
+    ) -> None:
+        """Remember that ``card`` was written with ``transform``."""
+        _, outputPath = self._cardPaths(card)
+        self._getManifest().record(
+            self._cardKey(card), self._cardDigest(card, transform), outputPath
+        )
+
+    def saveBuildManifest(self) -> None:
+        """Write pending manifest changes and forget the cached fingerprint."""
+        if self._manifest is not None:
+            self._manifest.save()
+        self._fingerprint = None
+
+    def pruneStaleCards(self, kind: str, cards: Sequence[Card]) -> list[str]:
+        """Delete rendered cards of ``kind`` that are no longer in ``cards``."""
+        return self._getManifest().prune(kind, {self._cardKey(c) for c in cards})
+
     def getItemAssetPath(self, item: Item | SimpleItem | Armor) -> str:
-        """Get the asset path for an item based on its type."""
-        if isinstance(item, Armor):
-            return join(IMAGE.PATHS.ARMOR, f"{item.id}.{IMAGE.FORMAT}")
-        elif isinstance(item, Weapon):
-            return join(IMAGE.PATHS.WEAPONS, f"{item.id}.{IMAGE.FORMAT}")
-        elif isinstance(item, SimpleItem):
-            return join(IMAGE.PATHS.ITEMS, f"{item.id}.{IMAGE.FORMAT}")
-        else:  # isinstance(item, Item) - covers general items and weapons
-            return join(IMAGE.PATHS.WEAPONS, f"{item.id}.{IMAGE.FORMAT}")
+        """Get the asset path for an item based on its type.
+
+        An up-to-date normalized copy from ``normalizeAssets`` is preferred.
+        """
+        return normalizedAssetPath(self._artSourcePath(item))
+
+    def _renderScale(self, background: Image.Image) -> float:
+        """Factor between the canvas being drawn on and the print resolution."""
+        return background.width / CARD.RESOLUTION[0]
+
+    def _scaleFontSize(self, size: int, factor: float) -> int:
+        return size if factor == 1 else max(1, round(size * factor))
+
+    def _scaleSpacing(self, factor: float) -> float:
+        # Pillow's default multiline spacing is 4px at print resolution
+        return 4 if factor == 1 else 4 * factor
 
     def _iconOp(
         self, path: str, layout: LayoutElement, center: bool = True
     ) -> Callable[[Image.Image], None]:
         def op(background: Image.Image) -> None:
-            icon = Image.open(path).convert("RGBA")
-            icon = icon.resize(tuple(map(int, layout.SIZE.ABSOLUTE)), Resampling.LANCZOS)  # type: ignore
-            pos = layout.POSITION.ABSOLUTE
+            scaled = layout.scaled(self._renderScale(background))
+            icon = getIcon(path, scaled.SIZE.ABSOLUTE)
+            pos = scaled.POSITION.ABSOLUTE
             if center:
                 pos = (
-                    pos[0] - layout.SIZE.ABSOLUTE[0] // 2,
-                    pos[1] - layout.SIZE.ABSOLUTE[1] // 2,
+                    pos[0] - scaled.SIZE.ABSOLUTE[0] // 2,
+                    pos[1] - scaled.SIZE.ABSOLUTE[1] // 2,
                 )
-            background.paste(icon, pos, mask=icon)
+            # compositing keeps the canvas alpha, so icons drawn on the
+            # transparent layer of CardLayers match icons drawn on the card
+            left, top = max(0, -pos[0]), max(0, -pos[1])
+            background.alpha_composite(icon, (pos[0] + left, pos[1] + top), (left, top))
 
-        return op
+        return profiled("icon", op, os.path.basename(path))
 
     def _textOp(
         self,
@@ -125,22 +424,28 @@ class ImageHandler:
     ) -> Callable[[Image.Image], None]:
         def op(background: Image.Image) -> None:
             draw: ImageDraw.ImageDraw = ImageDraw.Draw(background)
-            fontSize = getMaxFontSize(text, fontPath, maxSize, layout.SIZE.ABSOLUTE[0])
-            font = ImageFont.truetype(fontPath, fontSize)
-            bbox = draw.textbbox((0, 0), text, font=font)
+            factor = self._renderScale(background)
+            fontSize, bbox = fitFontSize(
+                text, fontPath, maxSize, layout.SIZE.ABSOLUTE[0]
+            )
+            if factor != 1:
+                fontSize = self._scaleFontSize(fontSize, factor)
+                bbox = measureText(text, fontPath, fontSize)
+            font = getFont(fontPath, fontSize)
             w = bbox[2] - bbox[0]
             h = bbox[3] - bbox[1]
+            position = layout.scaled(factor).POSITION.ABSOLUTE
             draw.text(  # type: ignore[reportUnknownMemberType]
                 (
-                    layout.POSITION.ABSOLUTE[0] - w / 2,
-                    layout.POSITION.ABSOLUTE[1] - h / 2,
+                    position[0] - w / 2,
+                    position[1] - h / 2,
                 ),
                 text,
                 font=font,
                 fill=FONT_STYLE.COLORS.STATS if primary else SECONDARY_FONT_STYLE.COLORS.STATS,
             )
 
-        return op
+        return profiled("text", op, text.replace("\n", " "))
 
     def _imageOp(
         self,
@@ -153,27 +458,64 @@ class ImageHandler:
         offset_y: float = 0.0,
     ) -> Callable[[Image.Image], None]:
         def op(background: Image.Image) -> None:
-            if not os.path.exists(path):
+            if not artExists(path):
                 raise FileNotFoundError(path)
-            image = Image.open(path).convert("RGBA")
-            if flip:
-                image = image.transpose(Transpose.FLIP_LEFT_RIGHT)
-            if rotate:
-                image = image.rotate(rotate, expand=True, resample=Resampling.BICUBIC)
-            maxWidth, maxHeight = layout.SIZE.ABSOLUTE
-            originWidth, originHeight = image.size
+            factor = self._renderScale(background)
+            scaled = layout.scaled(factor)
+            # previews share cache entries across near-equal slider angles;
+            # print cards are rotated by the exact angle
+            angle = rotate if factor == 1 else quantizeAngle(rotate)
+            maxWidth, maxHeight = scaled.SIZE.ABSOLUTE
+            normalized = getNormalizedAsset(path)
+            if normalized is None:
+                originWidth, originHeight = getArtSize(path, angle)
+            else:
+                # lay out the original image, the trimmed copy is placed inside it
+                originWidth, originHeight = rotatedSize(
+                    (normalized["size"][0], normalized["size"][1]), angle
+                )
             ratio = min(maxWidth / originWidth, maxHeight / originHeight) * scale
-            width = int(originWidth * ratio)
-            height = int(originHeight * ratio)
+            width = max(1, int(originWidth * ratio))
+            height = max(1, int(originHeight * ratio))
             imageX, imageY = twoDSub(
-                layout.POSITION.ABSOLUTE, twoDTruncate((width, height), (1 / 2, 1 / 2))
+                scaled.POSITION.ABSOLUTE, twoDTruncate((width, height), (1 / 2, 1 / 2))
             )
-            imageX += int(offset_x)
-            imageY += int(offset_y)
-            resized = image.resize((width, height), resample=Resampling.LANCZOS)  # type: ignore
+            imageX += int(offset_x * factor)
+            imageY += int(offset_y * factor)
+            if normalized is not None:
+                imageX, imageY, width, height = self._placeTrimmedArt(
+                    normalized, angle, flip, ratio, (imageX, imageY, width, height)
+                )
+            resized = getArt(path, flip, angle, (width, height))
             background.paste(resized, (imageX, imageY), mask=resized)
 
-        return op
+        return profiled("image", op, os.path.basename(path))
+
+    def _placeTrimmedArt(
+        self,
+        normalized: NormalizedAsset,
+        angle: float,
+        flip: bool,
+        ratio: float,
+        frame: tuple[int, int, int, int],
+    ) -> tuple[int, int, int, int]:
+        """Box of a trimmed copy inside the ``frame`` of its original image."""
+        frameX, frameY, frameWidth, frameHeight = frame
+        originWidth, originHeight = normalized["size"]
+        left, top, right, bottom = normalized["crop"]
+        cropWidth, cropHeight = rotatedSize((right - left, bottom - top), angle)
+        width = max(1, int(cropWidth * ratio))
+        height = max(1, int(cropHeight * ratio))
+        # offset of the crop centre from the image centre, flipped and rotated
+        dx = (left + right - originWidth) / 2
+        dy = (top + bottom - originHeight) / 2
+        if flip:
+            dx = -dx
+        radians = math.radians(angle)
+        cos, sin = math.cos(radians), math.sin(radians)
+        centerX = frameX + frameWidth / 2 + (dx * cos + dy * sin) * ratio
+        centerY = frameY + frameHeight / 2 + (dy * cos - dx * sin) * ratio
+        return round(centerX - width / 2), round(centerY - height / 2), width, height
 
     def _statsOp(
         self,
@@ -182,6 +524,7 @@ class ImageHandler:
         versatile: Optional[Damage],
         attributes: list[AttributeType],
         ranges: dict[AttributeType, tuple[int, int]],
+        layout: LayoutElement,
     ) -> Callable[[Image.Image], None]:
         def op(background: Image.Image) -> None:
             fixedRows: list[str] = []
@@ -211,25 +554,29 @@ class ImageHandler:
                 fixedRows,
                 FONT.STATS_PATH,
                 FONT_STYLE.SIZES.STATS,
-                ITEM.STATS.SIZE.ABSOLUTE[0],
-                ITEM.STATS.SIZE.ABSOLUTE[1],
+                layout.SIZE.ABSOLUTE[0],
+                layout.SIZE.ABSOLUTE[1],
             )
             statsString = "\n".join(optimalRows)
 
             draw: ImageDraw.ImageDraw = ImageDraw.Draw(background)
-            statsX, statsY = ITEM.STATS.POSITION.ABSOLUTE
-            statsFont = ImageFont.truetype(FONT.STATS_PATH, optimalFontSize)
+            factor = self._renderScale(background)
+            statsX, statsY = layout.scaled(factor).POSITION.ABSOLUTE
+            statsFont = getFont(
+                FONT.STATS_PATH, self._scaleFontSize(optimalFontSize, factor)
+            )
             draw.text(  # type: ignore[reportUnknownMemberType]
                 (statsX, statsY),
                 statsString,
                 font=statsFont,
                 fill=FONT_STYLE.COLORS.STATS,
+                spacing=self._scaleSpacing(factor),
             )
 
-        return op
+        return profiled("stats", op)
 
     def _simpleStatsOp(
-        self, weight: float, description: str
+        self, weight: float, description: str, layout: LayoutElement
     ) -> Callable[[Image.Image], None]:
         def op(background: Image.Image) -> None:
             text = f"{translate(TEXT.WEIGHT_PREFIX)}{formatFloatAsInt(weight)}{translate(TEXT.WEIGHT_SUFFIX)}\n{description}".strip()
@@ -238,20 +585,24 @@ class ImageHandler:
                 text,
                 FONT.STATS_PATH,
                 FONT_STYLE.SIZES.STATS,
-                ITEM.STATS.SIZE.ABSOLUTE[0],
-                ITEM.STATS.SIZE.ABSOLUTE[1],
+                layout.SIZE.ABSOLUTE[0],
+                layout.SIZE.ABSOLUTE[1],
             )
-            font = ImageFont.truetype(FONT.STATS_PATH, size)
+            factor = self._renderScale(background)
+            font = getFont(FONT.STATS_PATH, self._scaleFontSize(size, factor))
             draw.multiline_text(
-                ITEM.STATS.POSITION.ABSOLUTE,
+                layout.scaled(factor).POSITION.ABSOLUTE,
                 text,
                 font=font,
                 fill=FONT_STYLE.COLORS.STATS,
+                spacing=self._scaleSpacing(factor),
             )
 
-        return op
+        return profiled("stats", op)
 
-    def _armorStatsOp(self, armor: Armor) -> Callable[[Image.Image], None]:
+    def _armorStatsOp(
+        self, armor: Armor, layout: LayoutElement
+    ) -> Callable[[Image.Image], None]:
         def op(background: Image.Image) -> None:
             text_lines: list[str] = []
             text_lines.append(
@@ -279,29 +630,86 @@ class ImageHandler:
                 text,
                 FONT.STATS_PATH,
                 FONT_STYLE.SIZES.STATS,
-                ITEM.STATS.SIZE.ABSOLUTE[0],
-                ITEM.STATS.SIZE.ABSOLUTE[1],
+                layout.SIZE.ABSOLUTE[0],
+                layout.SIZE.ABSOLUTE[1],
             )
-            font = ImageFont.truetype(FONT.STATS_PATH, size)
+            factor = self._renderScale(background)
+            font = getFont(FONT.STATS_PATH, self._scaleFontSize(size, factor))
             draw.multiline_text(
-                ITEM.STATS.POSITION.ABSOLUTE,
+                layout.scaled(factor).POSITION.ABSOLUTE,
                 text,
                 font=font,
                 fill=FONT_STYLE.COLORS.STATS,
+                spacing=self._scaleSpacing(factor),
             )
 
-        return op
+        return profiled("stats", op)
 
     def _createCard(
         self,
         background: Image.Image,
         instructions: List[Callable[[Image.Image], None]],
-        outputPath: str,
-    ) -> None:
-        for inst in instructions:
-            inst(background)
+    ) -> Image.Image:
+        with profileSpan("compose", "card"):
+            for inst in instructions:
+                inst(background)
+        return background
+
+    def saveCard(self, card: Image.Image, outputPath: str) -> None:
+        """Write a rendered card to ``outputPath``."""
         os.makedirs(os.path.dirname(outputPath), exist_ok=True)
-        background.save(outputPath)
+        with profileSpan("save", "save"):
+            card.save(outputPath)
+
+    def _cachedLayers(
+        self,
+        card: Card,
+        resolution: tuple[int, int],
+        buildPlan: Callable[[], "_CardPlan"],
+    ) -> "CardLayers":
+        """Layers of ``card``, rebuilt when the card, language or template files change."""
+        template = getTemplate(self._templateKind(card))
+        key = (
+            self._cardKey(card),
+            json.dumps(self._cardEntry(card), sort_keys=True, default=str),
+            get_language(),
+            resolution,
+            os.path.getmtime(template.path),
+            tuple(os.path.getmtime(path) for path in template.background.paths()),
+        )
+        layers = self._layers.get(key)
+        if layers is not None:
+            self._layers.move_to_end(key)
+            return layers
+        plan = buildPlan()
+        below = plan.background
+        for inst in plan.below:
+            inst(below)
+        above = Image.new("RGBA", below.size, (0, 0, 0, 0))
+        for inst in plan.above:
+            inst(above)
+        layers = CardLayers(below, plan.art, above)
+        self._layers[key] = layers
+        if len(self._layers) > LAYER_CACHE_SIZE:
+            self._layers.popitem(last=False)
+        return layers
+
+    def composeCard(
+        self,
+        layers: "CardLayers",
+        rotate: float = 0.0,
+        flip: bool = False,
+        scale: float = 1.0,
+        offset_x: float = 0.0,
+        offset_y: float = 0.0,
+    ) -> Image.Image:
+        """Place the transformed artwork between the cached card layers."""
+        card = layers.below.copy()
+        if layers.art is not None:
+            path, layout = layers.art
+            self._imageOp(path, layout, rotate, flip, scale, offset_x, offset_y)(card)
+        card.alpha_composite(layers.above)
+        return card
 
     def createItemCard(
         self,
@@ -312,141 +720,303 @@ class ImageHandler:
         offset_x: float = 0.0,
         offset_y: float = 0.0,
     ) -> None:
-        def getCurrency(price: float) -> Currency:
-            if price % 1 == 0:
-                return Currency.GOLD
-            elif price % 0.1 == 0:
-                return Currency.SILVER
-            else:
-                return Currency.COPPER
-
-        def createBackground(currency: Currency) -> Image.Image:
-            match currency:
-                case Currency.GOLD:
-                    backgroundPath = IMAGE.BACKGROUNDS.GOLD_ITEM
-                case Currency.SILVER:
-                    backgroundPath = IMAGE.BACKGROUNDS.SILVER_ITEM
-                case Currency.COPPER:
-                    backgroundPath = IMAGE.BACKGROUNDS.COPPER_ITEM
-            background = Image.open(backgroundPath).convert("RGBA")
-            return background.resize(CARD.RESOLUTION, Resampling.LANCZOS)
-
-        currency = getCurrency(item.price)
-        cardImage = createBackground(currency)
-
-        instructions: List[Callable[[Image.Image], None]] = []
-
-        image_path = self.getItemAssetPath(item)
-        if not os.path.exists(image_path):
-            if get_skip_missing():
-                raise FileNotFoundError(image_path)
-            if get_print_missing():
-                self.recordMissingItem(item.id)
-            else:
-                raise FileNotFoundError(image_path)
+        """Render an item card and write it to its output path."""
+        card = self.renderItemCard(item, rotate, flip, scale, offset_x, offset_y)
+        self.saveCard(card, self.getItemOutputPath(item))
+
+    def renderItemCard(
+        self,
+        item: Item | SimpleItem | Armor,
+        rotate: float = 0,
+        flip: bool = False,
+        scale: float = 1.0,
+        offset_x: float = 0.0,
+        offset_y: float = 0.0,
+        resolution: tuple[int, int] = CARD.RESOLUTION,
+    ) -> Image.Image:
+        """Render an item card in memory without touching the output folder.
+
+        ``resolution`` scales the whole layout, e.g. ``CARD.PREVIEW_RESOLUTION``
+        for interactive previews; text is fitted at print resolution first so
+        the preview matches the printed card.
+        """
+        with profileSpan("plan", "plan"):
+            plan = self._itemPlan(item, resolution)
+        return self._createCard(
+            plan.background,
+            plan.instructions(self, rotate, flip, scale, offset_x, offset_y),
+        )
+
+    def renderItemLayers(
+        self,
+        item: Item | SimpleItem | Armor,
+        resolution: tuple[int, int] = CARD.RESOLUTION,
+    ) -> "CardLayers":
+        """Render everything but the artwork of an item card, cached per item."""
+        return self._cachedLayers(item, resolution, lambda: self._itemPlan(item, resolution))
+
+    def _itemPlan(
+        self, item: Item | SimpleItem | Armor, resolution: tuple[int, int]
+    ) -> "_CardPlan":
+        artPath = self._artPath(
+            self.getItemAssetPath(item), item.id, self.recordMissingItem
+        )
+        return self._templatePlan(
+            getTemplate("item"), self._itemBindings(item), artPath, resolution
+        )
+
+    def _itemBindings(self, item: Item | SimpleItem | Armor) -> dict[str, Any]:
+        """Values the item template reads from ``item``."""
+        if item.price % 1 == 0:
+            currency = Currency.GOLD
+        elif item.price % 0.1 == 0:
+            currency = Currency.SILVER
         else:
-            instructions.append(
-                self._imageOp(
-                    image_path,
-                    ITEM.IMAGE,
-                    rotate,
-                    flip,
-                    scale,
-                    offset_x,
-                    offset_y,
-                )
-            )
+            currency = Currency.COPPER
+        stats: Callable[[LayoutElement], Callable[[Image.Image], None]] = (
+            lambda layout: self._itemStatsOp(item, layout)
+        )
+        return {
+            "currency": currency.name.lower(),
+            "price": formatPriceWithSuffix(item.price / currency.value),
+            "name": item.name,
+            "stats": stats,
+        }
 
-        instructions.extend(
-            [
-                self._textOp(
-                    formatPriceWithSuffix(item.price / currency.value),
-                    ITEM.PRICE,
-                    FONT.PRICE_PATH,
-                    FONT_STYLE.SIZES.PRICE,
-                ),
-                self._textOp(
-                    wrapText(
-                        item.name,
-                        FONT.TITLE_PATH,
-                        FONT_STYLE.SIZES.TITLE,
-                        ITEM.TITLE.SIZE.ABSOLUTE[0],
-                        ITEM.TITLE.SIZE.ABSOLUTE[1],
-                    ),
-                    ITEM.TITLE,
-                    FONT.TITLE_PATH,
-                    FONT_STYLE.SIZES.TITLE,
-                ),
-                (
-                    self._simpleStatsOp(item.weight, item.description)
-                    if isinstance(item, SimpleItem)
-                    else (
-                        self._armorStatsOp(item)
-                        if isinstance(item, Armor)
-                        else self._statsOp(
-                            item.weight,
-                            getattr(item, "damage", None),
-                            getattr(item, "versatileDamage", None),
-                            getattr(item, "attributes", []),
-                            getattr(item, "ranges", {}),
-                        )
-                    )
-                ),
-            ]
+    def _itemStatsOp(
+        self, item: Item | SimpleItem | Armor, layout: LayoutElement
+    ) -> Callable[[Image.Image], None]:
+        if isinstance(item, SimpleItem):
+            return self._simpleStatsOp(item.weight, item.description, layout)
+        if isinstance(item, Armor):
+            return self._armorStatsOp(item, layout)
+        return self._statsOp(
+            item.weight,
+            getattr(item, "damage", None),
+            getattr(item, "versatileDamage", None),
+            getattr(item, "attributes", []),
+            getattr(item, "ranges", {}),
+            layout,
+        )
+
+    def _artPath(
+        self, path: str, cardId: str, onMissing: Callable[[str], None]
+    ) -> Optional[str]:
+        """Return ``path`` if the art exists, else record or raise per settings."""
+        if artExists(path):
+            return path
+        if get_skip_missing() or not get_print_missing():
+            raise FileNotFoundError(path)
+        onMissing(cardId)
+        return None
+
+    def _templatePlan(
+        self,
+        template: CardTemplate,
+        bindings: dict[str, Any],
+        artPath: Optional[str],
+        resolution: tuple[int, int],
+    ) -> "_CardPlan":
+        """Instructions of a card drawn from ``template`` with ``bindings``."""
+        background = self._baseLayer(
+            template, template.background.resolve(bindings), resolution
+        )
+        below: List[Callable[[Image.Image], None]] = []
+        above: List[Callable[[Image.Image], None]] = []
+        instructions = below
+        art: Optional[tuple[str, LayoutElement]] = None
+        factories = template.factories(ImageHandler._compileElement)
+        for element, factory in zip(template.dynamic, factories):
+            if factory is None:
+                if artPath is not None:
+                    art = (artPath, element.layout)
+                instructions = above
+            elif element.applies(bindings):
+                instructions.append(factory(self, bindings))
+        return _CardPlan(background, below, art, above)
+
+    @staticmethod
+    def _compileElement(element: TemplateElement) -> "_ElementFactory":
+        """Build the function that turns a handler and card bindings into ``element``'s op."""
+        layout = element.layout
+        image = element.image
+        if image is not None:
+            if image.select is None:
+                path = image.resolve({})
+                return lambda handler, bindings: handler._iconOp(path, layout)
+            return lambda handler, bindings: handler._iconOp(
+                image.resolve(bindings), layout
+            )
+        if element.type == "stats":
+            return lambda handler, bindings: bindings["stats"](layout)
+        key = element.value or ""
+        fontPath, size, primary = element.fontPath, element.size, element.primary
+        if element.wrap:
+            width, height = layout.SIZE.ABSOLUTE
+            return lambda handler, bindings: handler._textOp(
+                wrapText(str(bindings[key]), fontPath, size, width, height),
+                layout,
+                fontPath,
+                size,
+                primary,
+            )
+        return lambda handler, bindings: handler._textOp(
+            str(bindings[key]), layout, fontPath, size, primary
         )
 
-        self._createCard(cardImage, instructions, self.getItemOutputPath(item))
+    def _resolveJobs(self, jobs: int) -> int:
+        """Return the worker count for ``jobs`` (``0`` or less means all cores)."""
+        if jobs <= 0:
+            return os.cpu_count() or 1
+        return jobs
+
+    def _renderCards(
+        self,
+        cards: Sequence[Card],
+        skip_missing: bool,
+        missing: Optional[List[str]],
+        jobs: int = 1,
+        force: bool = False,
+        transforms: Optional[Mapping[str, JsonItemCache]] = None,
+    ) -> List[Card]:
+        """Render ``cards`` serially or on a process pool; return the rendered ones.
+
+        Each card uses its transform in ``transforms`` by id, if any. Cards
+        whose inputs match the build manifest are skipped unless ``force`` is
+        set. Missing art is looked up with :meth:`preflightArt`
+        first: with ``skip_missing`` those cards are not rendered and their
+        ids are appended to ``missing`` in catalog order; when the settings
+        neither skip nor print cards without art, ``FileNotFoundError`` is
+        raised before any card is written. Both paths run the same per-card
+        code, so the written PNGs are identical. With profiling on, the batch
+        timings are written to ``PATHS.PROFILE_OUTPUT``.
+        """
+        transforms = transforms or {}
+        pending = [
+            card
+            for card in cards
+            if force or not self.isCardCurrent(card, transforms.get(card.id))
+        ]
+        report = self.preflightArt(pending)
+        withoutArt = [c for c in pending if c.id in report.get(self._cardKind(c), ())]
+        if withoutArt and skip_missing:
+            if missing is not None:
+                missing.extend(card.id for card in withoutArt)
+            skipped = {id(card) for card in withoutArt}
+            pending = [card for card in pending if id(card) not in skipped]
+        elif withoutArt and (get_skip_missing() or not get_print_missing()):
+            path = self._artSourcePath(withoutArt[0])
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+        jobs = min(self._resolveJobs(jobs), len(pending))
+        kinds = sorted({self._templateKind(card) for card in pending})
+        jobArgs = [(card, skip_missing, transforms.get(card.id)) for card in pending]
+        profile = RenderProfile("-".join(kinds)) if profilingEnabled() and pending else None
+        if jobs <= 1:
+            self.warmIconCache(kinds)
+            results = [_renderCardWorker(job) for job in jobArgs]
+        else:
+            chunksize = max(1, len(pending) // (jobs * 4))
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=initRenderWorker,
+                initargs=(kinds, renderWorkerSettings()),
+            ) as executor:
+                results = list(
+                    executor.map(_renderCardWorker, jobArgs, chunksize=chunksize)
+                )
+        rendered: List[Card] = []
+        for card, (missingId, capture, recorded) in zip(pending, results):
+            if profile is not None:
+                profile.add(capture)
+            mergeMissing(recorded)
+            if missingId is None:
+                self.recordCardBuilt(card, transforms.get(card.id))
+                rendered.append(card)
+            elif missing is not None:
+                missing.append(missingId)
+        self.saveBuildManifest()
+        self.flushMissing()
+        if profile is not None:
+            self.lastProfile = profile.save()
+        return rendered
+
+    def renderCards(
+        self,
+        cards: Sequence[Card],
+        transforms: Optional[Mapping[str, JsonItemCache]] = None,
+        skip_missing: bool = False,
+        jobs: int = 1,
+        force: bool = False,
+    ) -> tuple[List[Card], List[str]]:
+        """Write the cards of ``cards`` that changed, with their stored transforms.
+
+        ``transforms`` maps card ids to the ``loadItemCache``/``loadSpellCache``
+        entries. Returns the rendered cards and, in catalog order, the ids of
+        cards without art: skipped ones, which are also added to the missing
+        lists, and ones drawn without artwork.
+        """
+        skippedIds: List[str] = []
+        rendered = self._renderCards(cards, skip_missing, skippedIds, jobs, force, transforms)
+        skipped = set(skippedIds)
+        for card in cards:
+            if card.id in skipped:
+                path = PATHS.MISSING_SPELLS if isinstance(card, Spell) else PATHS.MISSING_ITEMS
+                recordMissing(path, [card.id])
+        self.flushMissing()
+        drawn = {i for ids in self.preflightArt(rendered).values() for i in ids}
+        missing = [card.id for card in cards if card.id in skipped or card.id in drawn]
+        return rendered, missing
 
-    def createItemCards(self, skip_missing: bool = False) -> None:
+    def createItemCards(
+        self, skip_missing: bool = False, jobs: int = 1, force: bool = False
+    ) -> None:
         """Create cards for all items: weapons, armor, and simple items."""
         missing: List[str] = []
-        self.createWeaponCards(skip_missing, missing)
-        self.createArmorCards(skip_missing, missing)
-        self.createSimpleItemCards(skip_missing, missing)
+        weapons, armors, items = getWeapons(), getArmors(), getItems()
+        self.pruneStaleCards("weapon", weapons)
+        self.pruneStaleCards("armor", armors)
+        self.pruneStaleCards("item", items)
+        cards: List[Card] = [*weapons, *armors, *items]
+        self._renderCards(cards, skip_missing, missing, jobs, force)
         if skip_missing and missing:
-            self._writeMissing(PATHS.MISSING_ITEMS, missing)
+            recordMissing(PATHS.MISSING_ITEMS, missing, replace=True)
+            self.flushMissing()
 
     def createWeaponCards(
-        self, skip_missing: bool = False, missing: Optional[List[str]] = None
+        self,
+        skip_missing: bool = False,
+        missing: Optional[List[str]] = None,
+        jobs: int = 1,
+        force: bool = False,
     ) -> None:
         """Create cards for all weapons."""
         weapons = getWeapons()
-        for weapon in weapons:
-            try:
-                self.createItemCard(weapon)
-            except FileNotFoundError:
-                if not skip_missing:
-                    raise
-                if missing is not None:
-                    missing.append(weapon.id)
+        self.pruneStaleCards("weapon", weapons)
+        self._renderCards(weapons, skip_missing, missing, jobs, force)
 
     def createArmorCards(
-        self, skip_missing: bool = False, missing: Optional[List[str]] = None
+        self,
+        skip_missing: bool = False,
+        missing: Optional[List[str]] = None,
+        jobs: int = 1,
+        force: bool = False,
     ) -> None:
         """Create cards for all armor."""
         armors = getArmors()
-        for armor in armors:
-            try:
-                self.createItemCard(armor)
-            except FileNotFoundError:
-                if not skip_missing:
-                    raise
-                if missing is not None:
-                    missing.append(armor.id)
+        self.pruneStaleCards("armor", armors)
+        self._renderCards(armors, skip_missing, missing, jobs, force)
 
     def createSimpleItemCards(
-        self, skip_missing: bool = False, missing: Optional[List[str]] = None
+        self,
+        skip_missing: bool = False,
+        missing: Optional[List[str]] = None,
+        jobs: int = 1,
+        force: bool = False,
     ) -> None:
         """Create cards for all simple items."""
         items = getItems()
-        for item in items:
-            try:
-                self.createItemCard(item)
-            except FileNotFoundError:
-                if not skip_missing:
-                    raise
-                if missing is not None:
-                    missing.append(item.id)
+        self.pruneStaleCards("item", items)
+        self._renderCards(items, skip_missing, missing, jobs, force)
 
     def createSpellCard(
         self,
@@ -457,198 +1027,94 @@ class ImageHandler:
         offset_x: float = 0.0,
         offset_y: float = 0.0,
     ) -> None:
-        card = Image.open(IMAGE.BACKGROUNDS.SPELL).convert("RGBA").resize(
-            CARD.RESOLUTION, Resampling.LANCZOS
-        )
+        """Render a spell card and write it to its output path."""
+        card = self.renderSpellCard(spell, rotate, flip, scale, offset_x, offset_y)
+        self.saveCard(card, self.getSpellOutputPath(spell))
 
-        levelIcons = {
-            1: IMAGE.ICONS.LEVELS.LEVEL_1,
-            2: IMAGE.ICONS.LEVELS.LEVEL_2,
-            3: IMAGE.ICONS.LEVELS.LEVEL_3,
-            4: IMAGE.ICONS.LEVELS.LEVEL_4,
-            5: IMAGE.ICONS.LEVELS.LEVEL_5,
-            6: IMAGE.ICONS.LEVELS.LEVEL_6,
-            7: IMAGE.ICONS.LEVELS.LEVEL_7,
-            8: IMAGE.ICONS.LEVELS.LEVEL_8,
-            9: IMAGE.ICONS.LEVELS.LEVEL_9,
-        }
-        levelIcon = levelIcons.get(spell.level, IMAGE.ICONS.LEVELS.LEVEL_1)
-
-        instructions: List[Callable[[Image.Image], None]] = [
-            self._iconOp(levelIcon, SPELL.LEVEL, center=True),
-            self._textOp(
-                wrapText(
-                    spell.name,
-                    FONT.TITLE_PATH,
-                    FONT_STYLE.SIZES.TITLE,
-                    SPELL.TITLE.SIZE.ABSOLUTE[0],
-                    SPELL.TITLE.SIZE.ABSOLUTE[1],
-                ),
-                SPELL.TITLE,
-                FONT.TITLE_PATH,
-                FONT_STYLE.SIZES.TITLE,
-            ),
-            self._textOp(
-                str(spell.type), SPELL.CATEGORY, FONT.TITLE_PATH, FONT_STYLE.SIZES.TITLE
-            ),
-        ]
+    def renderSpellCard(
+        self,
+        spell: Spell,
+        rotate: float = 0.0,
+        flip: bool = False,
+        scale: float = 1.0,
+        offset_x: float = 0.0,
+        offset_y: float = 0.0,
+        resolution: tuple[int, int] = CARD.RESOLUTION,
+    ) -> Image.Image:
+        """Render a spell card in memory without touching the output folder.
 
-        spell_image_path = join(IMAGE.PATHS.SPELLS, f"{spell.id}.{IMAGE.FORMAT}")
-        if not os.path.exists(spell_image_path):
-            if get_skip_missing():
-                raise FileNotFoundError(spell_image_path)
-            if get_print_missing():
-                self.recordMissingSpell(spell.id)
-            else:
-                raise FileNotFoundError(spell_image_path)
-        else:
-            instructions.append(
-                self._imageOp(
-                    spell_image_path,
-                    SPELL.IMAGE,
-                    rotate,
-                    flip,
-                    scale,
-                    offset_x,
-                    offset_y,
-                )
-            )
+        ``resolution`` works as in :meth:`renderItemCard`.
+        """
+        with profileSpan("plan", "plan"):
+            plan = self._spellPlan(spell, resolution)
+        return self._createCard(
+            plan.background,
+            plan.instructions(self, rotate, flip, scale, offset_x, offset_y),
+        )
 
-        instructions.extend(
-            [
-                self._iconOp(IMAGE.ICONS.DURATION, SPELL.DURATION),
-                self._textOp(
-                    formatTimedelta(spell.duration),
-                    SPELL.DURATION_TEXT,
-                    FONT.STATS_PATH,
-                    FONT_STYLE.SIZES.STATS,
-                ),
-                self._iconOp(IMAGE.ICONS.COOLDOWN, SPELL.CAST_TIME),
-                self._textOp(
-                    str(spell.castingTime),
-                    SPELL.CAST_TIME_TEXT,
-                    FONT.STATS_PATH,
-                    FONT_STYLE.SIZES.STATS,
-                ),
-                self._iconOp(IMAGE.ICONS.DAMAGE, SPELL.DAMAGE),
-                self._iconOp(IMAGE.ICONS.RANGE, SPELL.RANGE),
-                self._textOp(
-                    f"{formatFloatAsInt(spell.range)}m",
-                    SPELL.RANGE_TEXT,
-                    FONT.STATS_PATH,
-                    FONT_STYLE.SIZES.STATS,
-                ),
-                self._iconOp(IMAGE.ICONS.SPOKEN, SPELL.MATERIAL.SPOKEN),
-                self._iconOp(IMAGE.ICONS.MATERIAL, SPELL.MATERIAL.MATERIAL),
-                self._iconOp(IMAGE.ICONS.GESTURAL, SPELL.MATERIAL.GESTURAL),
-                self._iconOp(IMAGE.ICONS.CONCENTRATION, SPELL.CONCENTRATION),
-                self._iconOp(IMAGE.ICONS.RITUAL, SPELL.RITUAL),
-                # self._textOp(
-                #     str(spell.castingTime),
-                #     SPELL.CAST_TIME,
-                #     FONT.STATS_PATH,
-                #     FONT_STYLE.SIZES.STATS,
-                # ),
-            ]
+    def renderSpellLayers(
+        self, spell: Spell, resolution: tuple[int, int] = CARD.RESOLUTION
+    ) -> "CardLayers":
+        """Render everything but the artwork of a spell card, cached per spell."""
+        return self._cachedLayers(spell, resolution, lambda: self._spellPlan(spell, resolution))
+
+    def _spellPlan(self, spell: Spell, resolution: tuple[int, int]) -> "_CardPlan":
+        artPath = self._artPath(
+            self.getSpellAssetPath(spell), spell.id, self.recordMissingSpell
+        )
+        return self._templatePlan(
+            getTemplate("spell"), self._spellBindings(spell), artPath, resolution
         )
 
-        if spell.damage:
-            dmg_text = f"{formatDamage(spell.damage)}\n{spell.damage.damageType}"
-            instructions.append(
-                self._textOp(
-                    dmg_text, SPELL.DAMAGE_TEXT, FONT.STATS_PATH, FONT_STYLE.SIZES.STATS
-                )
-            )
-        if not spell.components.verbal:
-            instructions.append(self._iconOp(IMAGE.ICONS.STRIKE, SPELL.MATERIAL.SPOKEN))
-        if not spell.components.material:
-            instructions.append(
-                self._iconOp(IMAGE.ICONS.STRIKE, SPELL.MATERIAL.MATERIAL)
-            )
-        if not spell.components.gestural:
-            instructions.append(
-                self._iconOp(IMAGE.ICONS.STRIKE, SPELL.MATERIAL.GESTURAL)
-            )
-        if spell.components.material:
-            if spell.components.material.name:
-                wrapped_name = wrapText(
-                    spell.components.material.name,
-                    FONT.STATS_PATH,
-                    FONT_STYLE.SIZES.STATS,
-                    SPELL.MATERIAL.NAME.SIZE.ABSOLUTE[0],
-                    SPELL.MATERIAL.NAME.SIZE.ABSOLUTE[1],
-                )
-                instructions.append(
-                    self._textOp(
-                        wrapped_name,
-                        SPELL.MATERIAL.NAME,
-                        FONT.STATS_PATH,
-                        FONT_STYLE.SIZES.STATS,
-                    )
-                )
-            if spell.components.material.cost is not None:
-                instructions.append(
-                    self._textOp(
-                        formatPriceWithSuffix(spell.components.material.cost),
-                        SPELL.MATERIAL.COST,
-                        FONT.STATS_PATH,
-                        SECONDARY_FONT_STYLE.SIZES.STATS,
-                        False,
-                    )
-                )
-        if not spell.concentration:
-            instructions.append(self._iconOp(IMAGE.ICONS.STRIKE, SPELL.CONCENTRATION))
-        if not spell.ritual:
-            instructions.append(self._iconOp(IMAGE.ICONS.STRIKE, SPELL.RITUAL))
-        if spell.savingThrow:
-            instructions.append(
-                self._textOp(
-                    shortName(spell.savingThrow, True),
-                    SPELL.SAVING_THROW,
-                    FONT.STATS_PATH,
-                    FONT_STYLE.SIZES.STATS,
-                )
-            )
-        if spell.subRange is not None:
-            instructions.append(
-                self._textOp(
-                    f"{formatFloatAsInt(spell.subRange)}m",
-                    SPELL.SUB_RANGE,
-                    FONT.STATS_PATH,
-                    FONT_STYLE.SIZES.STATS,
-                )
-            )
-        targetIcons = {
-            TargetType.CONE: IMAGE.ICONS.TARGETS.CONE,
-            TargetType.CREATURE: IMAGE.ICONS.TARGETS.CREATURE,
-            TargetType.CUBE: IMAGE.ICONS.TARGETS.CUBE,
-            TargetType.CYLINDER: IMAGE.ICONS.TARGETS.CYLINDER,
-            TargetType.LINE: IMAGE.ICONS.TARGETS.LINE,
-            TargetType.OBJECT: IMAGE.ICONS.TARGETS.OBJECT,
-            TargetType.POINT: IMAGE.ICONS.TARGETS.POINT,
-            TargetType.RECTANGLE: IMAGE.ICONS.TARGETS.RECTANGLE,
-            TargetType.SELF: IMAGE.ICONS.TARGETS.SELF,
-            TargetType.SPHERE: IMAGE.ICONS.TARGETS.SPHERE,
+    def _spellBindings(self, spell: Spell) -> dict[str, Any]:
+        """Values the spell template reads from ``spell``; ``None`` when absent."""
+        components = spell.components
+        material = components.material
+        damage = spell.damage
+        return {
+            "level": spell.level,
+            "name": spell.name,
+            "category": str(spell.type),
+            "duration": formatTimedelta(spell.duration),
+            "castTime": str(spell.castingTime),
+            "range": f"{formatFloatAsInt(spell.range)}m",
+            "damage": (
+                f"{formatDamage(damage)}\n{damage.damageType}" if damage else None
+            ),
+            "verbal": bool(components.verbal),
+            "material": bool(material),
+            "gestural": bool(components.gestural),
+            "materialName": material.name if material and material.name else None,
+            "materialCost": (
+                formatPriceWithSuffix(material.cost)
+                if material and material.cost is not None
+                else None
+            ),
+            "concentration": bool(spell.concentration),
+            "ritual": bool(spell.ritual),
+            "savingThrow": (
+                shortName(spell.savingThrow, True) if spell.savingThrow else None
+            ),
+            "subRange": (
+                f"{formatFloatAsInt(spell.subRange)}m"
+                if spell.subRange is not None
+                else None
+            ),
+            "target": getattr(spell.target, "name", None),
         }
-        instructions.append(
-            self._iconOp(
-                targetIcons.get(spell.target, IMAGE.ICONS.TARGETS.SELF), SPELL.TARGET
-            )
-        )
 
-        level_dir = join(PATHS.SPELL_OUTPUT, f"level{spell.level}")
-        outputPath = join(level_dir, f"{spell.id}.png")
-        self._createCard(card, instructions, outputPath)
+    def createSpellCards(
+        self, skip_missing: bool = False, jobs: int = 1, force: bool = False
+    ) -> None:
+        """Create cards for all spells, optionally on ``jobs`` worker processes.
 
-    def createSpellCards(self, skip_missing: bool = False) -> None:
+        Only spells whose inputs changed since the last build are rendered
+        unless ``force`` is set; cards of deleted spells are removed.
+        """
         spells: list[Spell] = getSpells()
         missing: List[str] = []
-        for spell in spells:
-            try:
-                self.createSpellCard(spell)
-            except FileNotFoundError:
-                if not skip_missing:
-                    raise
-                missing.append(spell.id)
+        self.pruneStaleCards("spell", spells)
+        self._renderCards(spells, skip_missing, missing, jobs, force)
         if skip_missing and missing:
-            self._writeMissing(PATHS.MISSING_SPELLS, missing)
+            recordMissing(PATHS.MISSING_SPELLS, missing, replace=True)
+            self.flushMissing()
@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Callable, List, Sequence, Union
+from typing import Any, Callable, List, Optional, Sequence, Union
+from threading import Condition, Thread
 from datetime import timedelta
 import os
-from os.path import join
 from PIL import Image, ImageTk
 
 from classes.types import (
@@ -39,7 +39,8 @@ from helpers.translationHelper import (
     set_print_missing,
     LANG_DIR,
 )
-from config.constants import GAME, PATHS, IMAGE, CARD
+from config.constants import GAME, IMAGE, CARD
+from helpers.filterHelper import filterCards, filterWeapons
 from helpers.dataHelper import (
     getWeapons,
     addWeapon,
@@ -54,7 +55,7 @@ from helpers.dataHelper import (
     loadSpellCache,
     updateSpellCache,
 )
-from handlers.imageHandler import ImageHandler
+from handlers.imageHandler import CardLayers, ImageHandler
 
 
 class InterfaceHandler:
@@ -415,18 +416,10 @@ class InterfaceHandler:
         ).pack(side="left", padx=2)
 
         def filter_items() -> List[Item]:
-            search = search_var.get().lower()
             selected = [
                 to_enum(AttributeType, a) for a, v in attr_vars.items() if v.get()
             ]
-            filtered: List[Item] = []
-            for it in items:
-                if search not in it.name.lower() and search not in it.id.lower():
-                    continue
-                if selected and not all(a in it.attributes for a in selected):
-                    continue
-                filtered.append(it)
-            return filtered
+            return filterWeapons(items, search_var.get(), selected)
 
         def update_list(*_args: object) -> None:
             tree.delete(*tree.get_children())
@@ -468,25 +461,19 @@ class InterfaceHandler:
             try:
                 cache: ItemCache = loadItemCache()
                 t = cache.get(item.id, {"rotate": 0.0, "scale": 1.0, "flip": False})
-                self.image_handler.createItemCard(
+                img = self.image_handler.renderItemCard(
                     item,
                     rotate=t.get("rotate", 0.0),
                     flip=bool(t.get("flip", False)),
                     scale=t.get("scale", 1.0),
                     offset_x=t.get("offset_x", 0.0),
                     offset_y=t.get("offset_y", 0.0),
+                    resolution=CARD.PREVIEW_RESOLUTION,
                 )
-                path = self.image_handler.getItemOutputPath(item)
-                img = Image.open(path)
                 top = tk.Toplevel(window)
                 self._set_icon(top)
                 top.title(f"{item.name} Card")
-                # Scale the image for display (divide by 5 to reduce size)
-                width, height = CARD.RESOLUTION
-                preview_width = width // 5
-                preview_height = height // 5
-                scaled_img = img.resize((preview_width, preview_height), Image.Resampling.LANCZOS)
-                tk_img = ImageTk.PhotoImage(scaled_img)
+                tk_img = ImageTk.PhotoImage(img)
                 lbl = ttk.Label(top, image=tk_img)
                 lbl.image = tk_img  # type: ignore (anti garbage collection)
                 lbl.pack()
@@ -583,12 +570,7 @@ class InterfaceHandler:
         ).pack(side="left", padx=2)
 
         def filter_items() -> List[SimpleItem]:
-            search = search_var.get().lower()
-            return [
-                it
-                for it in items
-                if search in it.id.lower() or search in it.name.lower()
-            ]
+            return filterCards(items, search_var.get())
 
         def update_list(*_args: object) -> None:
             tree.delete(*tree.get_children())
@@ -693,12 +675,7 @@ class InterfaceHandler:
         ).pack(side="left", padx=2)
 
         def filter_items() -> List[Armor]:
-            search = search_var.get().lower()
-            return [
-                it
-                for it in items
-                if search in it.id.lower() or search in it.name.lower()
-            ]
+            return filterCards(items, search_var.get())
 
         def update_list(*_args: object) -> None:
             tree.delete(*tree.get_children())
@@ -1659,12 +1636,7 @@ class InterfaceHandler:
         ).pack(side="left", padx=2)
 
         def filter_spells() -> List[Spell]:
-            search = search_var.get().lower()
-            return [
-                sp
-                for sp in spells
-                if search in sp.id.lower() or search in sp.name.lower()
-            ]
+            return filterCards(spells, search_var.get())
 
         def update_list(*_args: object) -> None:
             tree.delete(*tree.get_children())
@@ -1692,25 +1664,19 @@ class InterfaceHandler:
             try:
                 cache = loadSpellCache()
                 t = cache.get(sp.id, {"rotate": 0.0, "scale": 1.0, "flip": False})
-                self.image_handler.createSpellCard(
+                img = self.image_handler.renderSpellCard(
                     sp,
                     rotate=t.get("rotate", 0.0),
                     flip=bool(t.get("flip", False)),
                     scale=t.get("scale", 1.0),
                     offset_x=t.get("offset_x", 0.0),
                     offset_y=t.get("offset_y", 0.0),
+                    resolution=CARD.PREVIEW_RESOLUTION,
                 )
-                path = join(PATHS.SPELL_OUTPUT, f"level{sp.level}", f"{sp.id}.png")
-                img = Image.open(path)
                 top = tk.Toplevel(window)
                 self._set_icon(top)
                 top.title(sp.name)
-                # Scale the image for display (divide by 5 to reduce size)
-                width, height = CARD.RESOLUTION
-                preview_width = width // 5
-                preview_height = height // 5
-                scaled_img = img.resize((preview_width, preview_height), Image.Resampling.LANCZOS)
-                tk_img = ImageTk.PhotoImage(scaled_img)
+                tk_img = ImageTk.PhotoImage(img)
                 lbl = ttk.Label(top, image=tk_img)
                 lbl.image = tk_img  # type: ignore
                 lbl.pack()
@@ -1763,38 +1729,38 @@ class InterfaceHandler:
         preview_spells: List[Spell] = []
         skip_missing = get_skip_missing()
         print_missing = get_print_missing()
+        missing_art = {
+            card_id
+            for ids in self.image_handler.preflightArt(spells).values()
+            for card_id in ids
+        }
         for sp in spells:
-            if show_all:
+            if skip_missing and sp.id in missing_art:
+                self.image_handler.recordMissingSpell(sp.id)
+            elif show_all:
                 preview_spells.append(sp)
             elif sp.id not in cache:
-                if print_missing:
-                    spell_image = join(IMAGE.PATHS.SPELLS, f"{sp.id}.{IMAGE.FORMAT}")
-                    if not os.path.exists(spell_image):
-                        try:
-                            self.image_handler.createSpellCard(sp)
-                        except FileNotFoundError:
-                            if skip_missing:
-                                self.image_handler.recordMissingSpell(sp.id)
-                            else:
-                                raise
-                        continue
+                if print_missing and sp.id in missing_art:
+                    if not self.image_handler.isCardCurrent(sp):
+                        self.image_handler.createSpellCard(sp)
+                        self.image_handler.recordCardBuilt(sp)
+                    continue
                 preview_spells.append(sp)
             else:
                 t = cache[sp.id]
-                try:
-                    self.image_handler.createSpellCard(
-                        sp,
-                        rotate=t.get("rotate", 0.0),
-                        flip=t.get("flip", False),
-                        scale=t.get("scale", 1.0),
-                        offset_x=t.get("offset_x", 0.0),
-                        offset_y=t.get("offset_y", 0.0),
-                    )
-                except FileNotFoundError:
-                    if skip_missing:
-                        self.image_handler.recordMissingSpell(sp.id)
-                    else:
-                        raise
+                if self.image_handler.isCardCurrent(sp, t):
+                    continue
+                self.image_handler.createSpellCard(
+                    sp,
+                    rotate=t.get("rotate", 0.0),
+                    flip=t.get("flip", False),
+                    scale=t.get("scale", 1.0),
+                    offset_x=t.get("offset_x", 0.0),
+                    offset_y=t.get("offset_y", 0.0),
+                )
+                self.image_handler.recordCardBuilt(sp, t)
+        self.image_handler.saveBuildManifest()
+        self.image_handler.flushMissing()
 
         if preview_spells:
             SpellPreviewWindow(self.root, preview_spells, self.image_handler, cache)
@@ -1822,36 +1788,38 @@ class InterfaceHandler:
         preview_items: List[Item] = []
         skip_missing = get_skip_missing()
         print_missing = get_print_missing()
+        missing_art = {
+            card_id
+            for ids in self.image_handler.preflightArt(items).values()
+            for card_id in ids
+        }
         for item in items:
-            if show_all:
+            if skip_missing and item.id in missing_art:
+                self.image_handler.recordMissingItem(item.id)
+            elif show_all:
                 preview_items.append(item)
             elif item.id not in cache:
-                if print_missing:
-                    asset_path = self.image_handler.getItemAssetPath(item)
-                    if not os.path.exists(asset_path):
-                        try:
-                            self.image_handler.createItemCard(item)
-                        except FileNotFoundError:
-                            if skip_missing:
-                                self.image_handler.recordMissingItem(item.id)
-                            else:
-                                raise
-                        continue
+                if print_missing and item.id in missing_art:
+                    if not self.image_handler.isCardCurrent(item):
+                        self.image_handler.createItemCard(item)
+                        self.image_handler.recordCardBuilt(item)
+                    continue
                 preview_items.append(item)
             else:
                 t = cache[item.id]
-                try:
-                    self.image_handler.createItemCard(
-                        item,
-                        rotate=t.get("rotate", 0.0),
-                        flip=t.get("flip", False),
-                        scale=t.get("scale", 1.0),
-                    )
-                except FileNotFoundError:
-                    if skip_missing:
-                        self.image_handler.recordMissingItem(item.id)
-                    else:
-                        raise
+                if self.image_handler.isCardCurrent(item, t):
+                    continue
+                self.image_handler.createItemCard(
+                    item,
+                    rotate=t.get("rotate", 0.0),
+                    flip=t.get("flip", False),
+                    scale=t.get("scale", 1.0),
+                    offset_x=t.get("offset_x", 0.0),
+                    offset_y=t.get("offset_y", 0.0),
+                )
+                self.image_handler.recordCardBuilt(item, t)
+        self.image_handler.saveBuildManifest()
+        self.image_handler.flushMissing()
 
         if preview_items:
             PreviewWindow(self.root, preview_items, self.image_handler, cache)
@@ -1878,36 +1846,38 @@ class InterfaceHandler:
         preview_items: List[SimpleItem] = []
         skip_missing = get_skip_missing()
         print_missing = get_print_missing()
+        missing_art = {
+            card_id
+            for ids in self.image_handler.preflightArt(items).values()
+            for card_id in ids
+        }
         for item in items:
-            if show_all:
+            if skip_missing and item.id in missing_art:
+                self.image_handler.recordMissingItem(item.id)
+            elif show_all:
                 preview_items.append(item)
             elif item.id not in cache:
-                if print_missing:
-                    asset_path = self.image_handler.getItemAssetPath(item)
-                    if not os.path.exists(asset_path):
-                        try:
-                            self.image_handler.createItemCard(item)
-                        except FileNotFoundError:
-                            if skip_missing:
-                                self.image_handler.recordMissingItem(item.id)
-                            else:
-                                raise
-                        continue
+                if print_missing and item.id in missing_art:
+                    if not self.image_handler.isCardCurrent(item):
+                        self.image_handler.createItemCard(item)
+                        self.image_handler.recordCardBuilt(item)
+                    continue
                 preview_items.append(item)
             else:
                 t = cache[item.id]
-                try:
-                    self.image_handler.createItemCard(
-                        item,
-                        rotate=t.get("rotate", 0.0),
-                        flip=t.get("flip", False),
-                        scale=t.get("scale", 1.0),
-                    )
-                except FileNotFoundError:
-                    if skip_missing:
-                        self.image_handler.recordMissingItem(item.id)
-                    else:
-                        raise
+                if self.image_handler.isCardCurrent(item, t):
+                    continue
+                self.image_handler.createItemCard(
+                    item,
+                    rotate=t.get("rotate", 0.0),
+                    flip=t.get("flip", False),
+                    scale=t.get("scale", 1.0),
+                    offset_x=t.get("offset_x", 0.0),
+                    offset_y=t.get("offset_y", 0.0),
+                )
+                self.image_handler.recordCardBuilt(item, t)
+        self.image_handler.saveBuildManifest()
+        self.image_handler.flushMissing()
 
         if preview_items:
             PreviewWindow(self.root, preview_items, self.image_handler, cache)
@@ -1934,36 +1904,38 @@ class InterfaceHandler:
         preview_items: List[Armor] = []
         skip_missing = get_skip_missing()
         print_missing = get_print_missing()
+        missing_art = {
+            card_id
+            for ids in self.image_handler.preflightArt(items).values()
+            for card_id in ids
+        }
         for item in items:
-            if show_all:
+            if skip_missing and item.id in missing_art:
+                self.image_handler.recordMissingItem(item.id)
+            elif show_all:
                 preview_items.append(item)
             elif item.id not in cache:
-                if print_missing:
-                    asset_path = self.image_handler.getItemAssetPath(item)
-                    if not os.path.exists(asset_path):
-                        try:
-                            self.image_handler.createItemCard(item)
-                        except FileNotFoundError:
-                            if skip_missing:
-                                self.image_handler.recordMissingItem(item.id)
-                            else:
-                                raise
-                        continue
+                if print_missing and item.id in missing_art:
+                    if not self.image_handler.isCardCurrent(item):
+                        self.image_handler.createItemCard(item)
+                        self.image_handler.recordCardBuilt(item)
+                    continue
                 preview_items.append(item)
             else:
                 t = cache[item.id]
-                try:
-                    self.image_handler.createItemCard(
-                        item,
-                        rotate=t.get("rotate", 0.0),
-                        flip=t.get("flip", False),
-                        scale=t.get("scale", 1.0),
-                    )
-                except FileNotFoundError:
-                    if skip_missing:
-                        self.image_handler.recordMissingItem(item.id)
-                    else:
-                        raise
+                if self.image_handler.isCardCurrent(item, t):
+                    continue
+                self.image_handler.createItemCard(
+                    item,
+                    rotate=t.get("rotate", 0.0),
+                    flip=t.get("flip", False),
+                    scale=t.get("scale", 1.0),
+                    offset_x=t.get("offset_x", 0.0),
+                    offset_y=t.get("offset_y", 0.0),
+                )
+                self.image_handler.recordCardBuilt(item, t)
+        self.image_handler.saveBuildManifest()
+        self.image_handler.flushMissing()
 
         if preview_items:
             PreviewWindow(self.root, preview_items, self.image_handler, cache)
@@ -1977,6 +1949,102 @@ class InterfaceHandler:
         self.root.mainloop()
 
 
+PREVIEW_POLL_MS = 15
+
+PreviewTransform = tuple[float, bool, float, float, float]
+
+
+class _PreviewRenderer:
+    """Composes preview frames on a worker thread.
+
+    Only the most recent transform is kept: requests arriving while a frame
+    is being rendered replace each other, and results of superseded requests
+    are dropped. Finished frames are picked up on the Tk thread by polling
+    with ``after()``, so Pillow never runs on the main loop.
+    """
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        image_handler: ImageHandler,
+        on_frame: Callable[[Image.Image], None],
+    ) -> None:
+        self.widget = widget
+        self.image_handler = image_handler
+        self.on_frame = on_frame
+        self._condition = Condition()
+        self._pending: Optional[tuple[int, CardLayers, PreviewTransform]] = None
+        self._result: Optional[tuple[int, Optional[Image.Image]]] = None
+        self._generation = 0
+        self._busy = False
+        self._polling: Optional[str] = None
+        self._closed = False
+        Thread(target=self._work, daemon=True).start()
+
+    def submit(self, layers: CardLayers, transform: PreviewTransform) -> None:
+        with self._condition:
+            self._generation += 1
+            self._pending = (self._generation, layers, transform)
+            self._condition.notify()
+        self._schedule_poll()
+
+    def cancel(self) -> None:
+        """Drop pending and in-flight frames, e.g. when switching cards."""
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._pending = None
+            self._condition.notify()
+        if self._polling is not None:
+            self.widget.after_cancel(self._polling)
+            self._polling = None
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                pending = self._pending
+                if self._closed or pending is None:
+                    return
+                generation, layers, transform = pending
+                self._pending = None
+                self._busy = True
+            rotate, flip, scale, offset_x, offset_y = transform
+            frame: Optional[Image.Image]
+            try:
+                frame = self.image_handler.composeCard(
+                    layers, rotate, flip, scale, offset_x, offset_y
+                )
+            except Exception:
+                frame = None
+            with self._condition:
+                self._result = (generation, frame)
+                self._busy = False
+
+    def _schedule_poll(self) -> None:
+        if self._polling is not None or self._closed:
+            return
+        self._polling = self.widget.after(PREVIEW_POLL_MS, self._poll)
+
+    def _poll(self) -> None:
+        self._polling = None
+        if self._closed:
+            return
+        with self._condition:
+            result, self._result = self._result, None
+            outstanding = self._busy or self._pending is not None
+            current = self._generation
+        if result is not None and result[0] == current and result[1] is not None:
+            self.on_frame(result[1])
+        if outstanding:
+            self._schedule_poll()
+
+
 class PreviewWindow(tk.Toplevel):
     def __init__(
         self,
@@ -2058,6 +2126,9 @@ class PreviewWindow(tk.Toplevel):
         self.original: Image.Image | None = None
         self.display: Image.Image | None = None
         self.tk_img: ImageTk.PhotoImage | None = None
+        self.layers: CardLayers | None = None
+        self.renderer = _PreviewRenderer(self, image_handler, self._show_frame)
+        self.bind("<Destroy>", self._on_destroy)
         self._load_current()
 
     def _load_current(self) -> None:
@@ -2068,19 +2139,20 @@ class PreviewWindow(tk.Toplevel):
         self.flip = bool(t.get("flip", False))
         self.x_var.set(float(t.get("offset_x", 0.0)))
         self.y_var.set(float(t.get("offset_y", 0.0)))
+        self.renderer.cancel()
+        self.layers = None
         if not self._generate_image(item):
             return
         self._update_image()
 
     def _generate_image(self, item: Union[Item, SimpleItem, Armor]) -> bool:
         try:
-            self.image_handler.createItemCard(
-                item,
-                rotate=self.angle_var.get(),
-                flip=self.flip,
-                scale=self.scale_var.get(),
-                offset_x=self.x_var.get(),
-                offset_y=self.y_var.get(),
+            # only the artwork moves with the sliders, the rest is cached
+            self.layers = self.image_handler.renderItemLayers(
+                item, resolution=CARD.PREVIEW_RESOLUTION
+            )
+            self.original = self.image_handler.composeCard(
+                self.layers, *self._transform()
             )
         except FileNotFoundError:
             if get_skip_missing():
@@ -2095,19 +2167,17 @@ class PreviewWindow(tk.Toplevel):
             else:
                 self.skip_flag = True
                 return False
-        path = self.image_handler.getItemOutputPath(item)
-        self.original = Image.open(path)
         self.display = self.original
         return True
 
     def _update_image(self) -> None:
         if self.display is None:
             return
-        # Scale the image for preview (divide by 5 to reduce size)
-        width, height = CARD.RESOLUTION
-        preview_width = width // 5
-        preview_height = height // 5
-        scaled_image = self.display.resize((preview_width, preview_height), Image.Resampling.LANCZOS)
+        scaled_image = self.display
+        if scaled_image.size != CARD.PREVIEW_RESOLUTION:
+            scaled_image = scaled_image.resize(
+                CARD.PREVIEW_RESOLUTION, Image.Resampling.LANCZOS
+            )
         self.tk_img = ImageTk.PhotoImage(scaled_image)
         self.label.configure(image=self.tk_img)
 
@@ -2124,15 +2194,41 @@ class PreviewWindow(tk.Toplevel):
         self.flip = not self.flip
         self._apply_transform()
 
+    def _transform(self) -> PreviewTransform:
+        return (
+            self.angle_var.get(),
+            self.flip,
+            self.scale_var.get(),
+            self.x_var.get(),
+            self.y_var.get(),
+        )
+
     def _apply_transform(self) -> None:
-        item = self.items[self.index]
-        if not self._generate_image(item):
+        if self.layers is None:
             return
+        self.renderer.submit(self.layers, self._transform())
+
+    def _show_frame(self, frame: Image.Image) -> None:
+        self.original = frame
+        self.display = frame
         self._update_image()
 
+    def _on_destroy(self, event: "tk.Event[Any]") -> None:
+        if event.widget is self:
+            self.renderer.close()
+
     def _next(self) -> None:
         item = self.items[self.index]
-        if not self.skip_flag:
+        if not self.skip_flag and self.original is not None:
+            # the preview is rendered at reduced size, print at full resolution
+            self.image_handler.createItemCard(
+                item,
+                rotate=self.angle_var.get(),
+                flip=self.flip,
+                scale=self.scale_var.get(),
+                offset_x=self.x_var.get(),
+                offset_y=self.y_var.get(),
+            )
             updateItemCache(
                 item.id,
                 self.angle_var.get(),
@@ -2141,6 +2237,9 @@ class PreviewWindow(tk.Toplevel):
                 self.x_var.get(),
                 self.y_var.get(),
             )
+            self.image_handler.recordCardBuilt(item, loadItemCache().get(item.id))
+            self.image_handler.saveBuildManifest()
+            self.image_handler.flushMissing()
         self.skip_flag = False
         self.index += 1
         if self.index >= len(self.items):
@@ -2234,6 +2333,9 @@ class SpellPreviewWindow(tk.Toplevel):
         self.original: Image.Image | None = None
         self.display: Image.Image | None = None
         self.tk_img: ImageTk.PhotoImage | None = None
+        self.layers: CardLayers | None = None
+        self.renderer = _PreviewRenderer(self, image_handler, self._show_frame)
+        self.bind("<Destroy>", self._on_destroy)
         self._load_current()
 
     def _load_current(self) -> None:
@@ -2244,19 +2346,20 @@ class SpellPreviewWindow(tk.Toplevel):
         self.flip = bool(t.get("flip", False))
         self.x_var.set(float(t.get("offset_x", 0.0)))
         self.y_var.set(float(t.get("offset_y", 0.0)))
+        self.renderer.cancel()
+        self.layers = None
         if not self._generate_image(sp):
             return
         self._update_image()
 
     def _generate_image(self, spell: Spell) -> bool:
         try:
-            self.image_handler.createSpellCard(
-                spell,
-                rotate=self.angle_var.get(),
-                flip=self.flip,
-                scale=self.scale_var.get(),
-                offset_x=self.x_var.get(),
-                offset_y=self.y_var.get(),
+            # only the artwork moves with the sliders, the rest is cached
+            self.layers = self.image_handler.renderSpellLayers(
+                spell, resolution=CARD.PREVIEW_RESOLUTION
+            )
+            self.original = self.image_handler.composeCard(
+                self.layers, *self._transform()
             )
         except FileNotFoundError:
             if get_skip_missing():
@@ -2271,20 +2374,17 @@ class SpellPreviewWindow(tk.Toplevel):
             else:
                 self.skip_flag = True
                 return False
-        level_dir = join(PATHS.SPELL_OUTPUT, f"level{spell.level}")
-        path = join(level_dir, f"{spell.id}.png")
-        self.original = Image.open(path)
         self.display = self.original
         return True
 
     def _update_image(self) -> None:
         if self.display is None:
             return
-        # Scale the image for preview (divide by 5 to reduce size)
-        width, height = CARD.RESOLUTION
-        preview_width = width // 5
-        preview_height = height // 5
-        scaled_image = self.display.resize((preview_width, preview_height), Image.Resampling.LANCZOS)
+        scaled_image = self.display
+        if scaled_image.size != CARD.PREVIEW_RESOLUTION:
+            scaled_image = scaled_image.resize(
+                CARD.PREVIEW_RESOLUTION, Image.Resampling.LANCZOS
+            )
         self.tk_img = ImageTk.PhotoImage(scaled_image)
         self.label.configure(image=self.tk_img)
 
@@ -2301,15 +2401,41 @@ class SpellPreviewWindow(tk.Toplevel):
         self.flip = not self.flip
         self._apply_transform()
 
+    def _transform(self) -> PreviewTransform:
+        return (
+            self.angle_var.get(),
+            self.flip,
+            self.scale_var.get(),
+            self.x_var.get(),
+            self.y_var.get(),
+        )
+
     def _apply_transform(self) -> None:
-        sp = self.spells[self.index]
-        if not self._generate_image(sp):
+        if self.layers is None:
             return
+        self.renderer.submit(self.layers, self._transform())
+
+    def _show_frame(self, frame: Image.Image) -> None:
+        self.original = frame
+        self.display = frame
         self._update_image()
 
+    def _on_destroy(self, event: "tk.Event[Any]") -> None:
+        if event.widget is self:
+            self.renderer.close()
+
     def _next(self) -> None:
         sp = self.spells[self.index]
-        if not self.skip_flag:
+        if not self.skip_flag and self.original is not None:
+            # the preview is rendered at reduced size, print at full resolution
+            self.image_handler.createSpellCard(
+                sp,
+                rotate=self.angle_var.get(),
+                flip=self.flip,
+                scale=self.scale_var.get(),
+                offset_x=self.x_var.get(),
+                offset_y=self.y_var.get(),
+            )
             updateSpellCache(
                 sp.id,
                 self.angle_var.get(),
@@ -2318,6 +2444,9 @@ class SpellPreviewWindow(tk.Toplevel):
                 self.x_var.get(),
                 self.y_var.get(),
             )
+            self.image_handler.recordCardBuilt(sp, loadSpellCache().get(sp.id))
+            self.image_handler.saveBuildManifest()
+            self.image_handler.flushMissing()
         self.skip_flag = False
         self.index += 1
         if self.index >= len(self.spells):
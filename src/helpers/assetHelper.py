@@ -0,0 +1,346 @@
+import hashlib
+import math
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional
+from PIL import Image
+from PIL.Image import Resampling, Transpose
+from config.constants import IMAGE, PATHS
+from helpers.manifestHelper import fileFingerprint
+
+
+_backgrounds: dict[tuple[str, tuple[int, int]], tuple[float, Image.Image]] = {}
+_icons: dict[tuple[str, tuple[int, int]], tuple[float, Image.Image]] = {}
+_art: "OrderedDict[tuple[Any, ...], Image.Image]" = OrderedDict()
+_artSizes: dict[tuple[str, float], tuple[int, int]] = {}
+_artStats: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+_lock = Lock()
+_mipPruned = False
+
+
+def getBackground(path: str, size: tuple[int, int]) -> Image.Image:
+    """Return a copy of the background template at ``path`` resized to ``size``.
+
+    Templates are decoded and resampled once per (path, size) and reloaded
+    when the file's mtime changes; callers may draw on the returned copy.
+    """
+    mtime = os.path.getmtime(path)
+    key = (path, size)
+    with _lock:
+        cached = _backgrounds.get(key)
+        if cached is None or cached[0] != mtime:
+            image = Image.open(path).convert("RGBA").resize(size, Resampling.LANCZOS)
+            cached = (mtime, image)
+            _backgrounds[key] = cached
+        return cached[1].copy()
+
+
+def getIcon(path: str, size: tuple[int, int]) -> Image.Image:
+    """Return the icon at ``path`` converted to RGBA and resized to ``size``.
+
+    Icons are resized once per (path, size) and shared between all cards, so
+    the returned image must not be drawn on.
+    """
+    mtime = os.path.getmtime(path)
+    key = (path, size)
+    with _lock:
+        cached = _icons.get(key)
+        if cached is None or cached[0] != mtime:
+            icon = Image.open(path).convert("RGBA").resize(size, Resampling.LANCZOS)
+            cached = (mtime, icon)
+            _icons[key] = cached
+        return cached[1]
+
+
+def warmIcons(icons: list[tuple[str, tuple[int, int]]]) -> None:
+    """Load and resize every (path, size) pair in ``icons`` ahead of a batch."""
+    for path, size in icons:
+        getIcon(path, size)
+
+
+def quantizeAngle(angle: float) -> float:
+    """Round ``angle`` to ``IMAGE.ANGLE_STEP`` so near-equal rotations share a cache entry."""
+    return round(round(angle / IMAGE.ANGLE_STEP) * IMAGE.ANGLE_STEP, 6)
+
+
+def _imageBytes(image: Image.Image) -> int:
+    return image.width * image.height * len(image.getbands())
+
+
+def _artLookup(key: tuple[Any, ...]) -> Optional[Image.Image]:
+    with _lock:
+        image = _art.get(key)
+        if image is None:
+            _artStats["misses"] += 1
+            return None
+        _art.move_to_end(key)
+        _artStats["hits"] += 1
+        return image
+
+
+def _artStore(key: tuple[Any, ...], image: Image.Image) -> Image.Image:
+    size = _imageBytes(image)
+    if size > IMAGE.ART_CACHE_BYTES:
+        return image
+    with _lock:
+        previous = _art.pop(key, None)
+        if previous is not None:
+            _artStats["bytes"] -= _imageBytes(previous)
+        _art[key] = image
+        _artStats["bytes"] += size
+        while _artStats["bytes"] > IMAGE.ART_CACHE_BYTES:
+            _, evicted = _art.popitem(last=False)
+            _artStats["bytes"] -= _imageBytes(evicted)
+            _artStats["evictions"] += 1
+    return image
+
+
+def rotatedSize(size: tuple[int, int], angle: float) -> tuple[int, int]:
+    """Size of an image of ``size`` after ``Image.rotate(angle, expand=True)``."""
+    angle = angle % 360.0
+    width, height = size
+    if angle in (0, 180):
+        return size
+    if angle in (90, 270):
+        return (height, width)
+    radians = -math.radians(angle)
+    cos, sin = round(math.cos(radians), 15), round(math.sin(radians), 15)
+    offsetX = cos * -width / 2 + sin * -height / 2 + width / 2
+    offsetY = -sin * -width / 2 + cos * -height / 2 + height / 2
+    corners = ((0, 0), (width, 0), (width, height), (0, height))
+    xs = [cos * x + sin * y + offsetX for x, y in corners]
+    ys = [-sin * x + cos * y + offsetY for x, y in corners]
+    return (
+        math.ceil(max(xs)) - math.floor(min(xs)),
+        math.ceil(max(ys)) - math.floor(min(ys)),
+    )
+
+
+def getArtSize(path: str, rotate: float = 0.0) -> tuple[int, int]:
+    """Return the full-resolution size of the artwork at ``path`` rotated by ``rotate``.
+
+    Only the image header is read; the size does not depend on the mip level
+    that is eventually sampled.
+    """
+    key = (path, os.path.getmtime(path))
+    with _lock:
+        size = _artSizes.get(key)
+    if size is None:
+        with Image.open(path) as image:
+            size = image.size
+        with _lock:
+            _artSizes[key] = size
+    return rotatedSize(size, rotate)
+
+
+def _mipLevel(sourceSize: tuple[int, int], rotate: float, size: tuple[int, int]) -> int:
+    """Smallest pyramid level whose rotated image is still at least ``size``."""
+    fullWidth, fullHeight = rotatedSize(sourceSize, rotate)
+    ratio = max(size[0] / fullWidth, size[1] / fullHeight)
+    level = 0
+    while (
+        level < IMAGE.MIP_MAX_LEVEL
+        and ratio * 2 ** (level + 1) <= 1
+        and min(sourceSize) >> (level + 1) > 0
+    ):
+        level += 1
+    return level
+
+
+def _mipDigest(path: str) -> str:
+    return hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+
+
+def _mipCachePath(path: str, fingerprint: list[int], level: int) -> str:
+    """Disk copy of pyramid ``level`` for the version ``fingerprint`` of ``path``."""
+    mtime, size = fingerprint
+    return os.path.join(PATHS.MIP_CACHE, f"{_mipDigest(path)}_{mtime}_{size}_{level}.png")
+
+
+def pruneMipCache() -> dict[str, int]:
+    """Bound the pyramid levels kept in ``PATHS.MIP_CACHE``.
+
+    Levels of a source that changed or is gone are removed first; the least
+    recently used of the rest are removed while the folder holds more than
+    ``IMAGE.MIP_CACHE_BYTES``. Runs once per process before the first level
+    is written. Returns how many files were removed and the bytes kept.
+    """
+    global _mipPruned
+    _mipPruned = True
+    try:
+        entries = list(os.scandir(PATHS.MIP_CACHE))
+    except FileNotFoundError:
+        return {"removed": 0, "bytes": 0}
+    current: dict[str, str] = {}
+    for entry in entries:
+        if entry.name.endswith(".source"):
+            try:
+                with open(entry.path, "r", encoding="utf-8") as file:
+                    fingerprint = fileFingerprint(file.read())
+            except OSError:
+                fingerprint = None
+            if fingerprint is not None:
+                current[entry.name[: -len(".source")]] = "{}_{}".format(*fingerprint)
+    stale: list[str] = []
+    levels: list[tuple[float, int, str]] = []
+    for entry in entries:
+        if entry.name.endswith(".tmp"):
+            continue  # being written by another process
+        if entry.name.endswith(".source"):
+            if entry.name[: -len(".source")] not in current:
+                stale.append(entry.path)
+            continue
+        parts = entry.name[: -len(".png")].split("_")
+        if (
+            not entry.name.endswith(".png")
+            or len(parts) != 4
+            or current.get(parts[0]) != f"{parts[1]}_{parts[2]}"
+        ):
+            stale.append(entry.path)
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        levels.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in levels)
+    levels.sort()
+    while levels and total > IMAGE.MIP_CACHE_BYTES:
+        _, size, path = levels.pop(0)
+        stale.append(path)
+        total -= size
+    kept = {os.path.basename(path).split("_")[0] for _, _, path in levels}
+    stale.extend(
+        os.path.join(PATHS.MIP_CACHE, f"{digest}.source")
+        for digest in current
+        if digest not in kept
+    )
+    for path in stale:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    return {"removed": len(stale), "bytes": total}
+
+
+def _storeLevel(path: str, fingerprint: list[int], level: int, image: Image.Image) -> None:
+    """Write a pyramid level to disk, replacing levels of older versions of ``path``."""
+    if not _mipPruned:
+        pruneMipCache()
+    os.makedirs(PATHS.MIP_CACHE, exist_ok=True)
+    digest = _mipDigest(path)
+    version = "{}_{}_".format(*fingerprint)
+    for name in os.listdir(PATHS.MIP_CACHE):
+        if name.startswith(f"{digest}_") and not name.startswith(f"{digest}_{version}"):
+            try:
+                os.remove(os.path.join(PATHS.MIP_CACHE, name))
+            except FileNotFoundError:
+                pass
+    suffix = f".{os.getpid()}.tmp"
+    sourcePath = os.path.join(PATHS.MIP_CACHE, f"{digest}.source")
+    with open(sourcePath + suffix, "w", encoding="utf-8") as file:
+        file.write(os.path.abspath(path))
+    os.replace(sourcePath + suffix, sourcePath)
+    cachePath = _mipCachePath(path, fingerprint, level)
+    image.save(cachePath + suffix, format="PNG", compress_level=1)
+    os.replace(cachePath + suffix, cachePath)
+
+
+def _loadLevel(path: str, level: int) -> Image.Image:
+    """Decode pyramid ``level`` of ``path``: ``ceil(size / 2**level)`` pixels."""
+    if level == 0:
+        return Image.open(path).convert("RGBA")
+    fingerprint = fileFingerprint(path)
+    if fingerprint is None:
+        raise FileNotFoundError(path)
+    cachePath = _mipCachePath(path, fingerprint, level)
+    if IMAGE.MIP_DISK_CACHE and os.path.exists(cachePath):
+        try:
+            image = Image.open(cachePath).convert("RGBA")
+            os.utime(cachePath)  # mark as recently used for pruneMipCache
+            return image
+        except OSError:
+            pass
+    with Image.open(path) as source:
+        width, height = source.size
+        levelSize = (-(-width >> level), -(-height >> level))
+        if source.format == "JPEG":
+            # let libjpeg scale while decoding instead of decoding full size
+            source.draft("RGB", levelSize)
+            image = source.convert("RGBA")
+            if image.size != levelSize:
+                image = image.resize(levelSize, resample=Resampling.LANCZOS)
+        else:
+            image = _getLevel(path, level - 1).reduce(2)
+    if IMAGE.MIP_DISK_CACHE:
+        _storeLevel(path, fingerprint, level, image)
+    return image
+
+
+def _getLevel(path: str, level: int) -> Image.Image:
+    key = (path, os.path.getmtime(path), False, 0.0, None, level)
+    image = _artLookup(key)
+    if image is None:
+        image = _artStore(key, _loadLevel(path, level))
+    return image
+
+
+def getArt(
+    path: str,
+    flip: bool = False,
+    rotate: float = 0.0,
+    size: Optional[tuple[int, int]] = None,
+) -> Image.Image:
+    """Return the artwork at ``path`` flipped, rotated and optionally resized.
+
+    Resizing starts from the smallest power-of-two pyramid level that is still
+    at least ``size``, so large sources are not resampled at full resolution.
+    Levels, rotated levels and resized results are kept in a shared LRU bounded
+    by ``IMAGE.ART_CACHE_BYTES`` and keyed by the file's mtime, so the returned
+    image must not be drawn on. Previews pass ``rotate`` through
+    :func:`quantizeAngle` to share entries; print cards use the exact angle.
+    """
+    level = 0
+    if size is not None:
+        level = _mipLevel(getArtSize(path), rotate, size)
+    return _getArt(path, flip, rotate, size, level)
+
+
+def _getArt(
+    path: str,
+    flip: bool,
+    rotate: float,
+    size: Optional[tuple[int, int]],
+    level: int,
+) -> Image.Image:
+    if not (flip or rotate or size):
+        return _getLevel(path, level)
+    key = (path, os.path.getmtime(path), flip, rotate, size, level)
+    image = _artLookup(key)
+    if image is not None:
+        return image
+    if size is not None:
+        image = _getArt(path, flip, rotate, None, level)
+        image = image.resize(size, resample=Resampling.LANCZOS)
+    else:
+        image = _getLevel(path, level)
+        if flip:
+            image = image.transpose(Transpose.FLIP_LEFT_RIGHT)
+        if rotate:
+            image = image.rotate(rotate, expand=True, resample=Resampling.BICUBIC)
+    return _artStore(key, image)
+
+
+def getArtCacheStats() -> dict[str, int]:
+    """Return hit/miss/eviction counters, cached bytes and entry count of the art cache."""
+    with _lock:
+        return {**_artStats, "size": len(_art)}
+
+
+def clearArtCache() -> None:
+    with _lock:
+        _art.clear()
+        _artSizes.clear()
+        for key in _artStats:
+            _artStats[key] = 0
@@ -0,0 +1,53 @@
+import os
+from threading import Lock
+from typing import Iterable, Optional
+
+# normalized folder -> (folder mtime, normalized file names)
+_listings: dict[str, tuple[Optional[int], frozenset[str]]] = {}
+_lock = Lock()
+
+
+def _folderMtime(folder: str) -> Optional[int]:
+    try:
+        return os.stat(folder).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _scan(folder: str) -> tuple[Optional[int], frozenset[str]]:
+    mtime = _folderMtime(folder)
+    if mtime is None:
+        return None, frozenset()
+    with os.scandir(folder) as entries:
+        names = frozenset(os.path.normcase(e.name) for e in entries if e.is_file())
+    return mtime, names
+
+
+def _listing(folder: str, refresh: bool) -> frozenset[str]:
+    with _lock:
+        cached = _listings.get(folder)
+        if cached is None or (refresh and cached[0] != _folderMtime(folder)):
+            cached = _scan(folder)
+            _listings[folder] = cached
+        return cached[1]
+
+
+def refreshAssetIndex(folders: Iterable[str]) -> None:
+    """Rescan every folder in ``folders`` whose mtime changed since its last scan."""
+    for folder in folders:
+        _listing(os.path.normcase(os.path.abspath(folder)), True)
+
+
+def artExists(path: str, refresh: bool = True) -> bool:
+    """Whether ``path`` exists, answered from a cached listing of its folder.
+
+    Adding or removing a file changes its folder's mtime. That mtime is only
+    checked when the cached listing lacks the file, so present files cost no
+    system call; a file deleted since the last scan still counts until
+    :func:`refreshAssetIndex` runs. With ``refresh`` off the listing is
+    trusted as is, e.g. right after :func:`refreshAssetIndex`.
+    """
+    folder, name = os.path.split(os.path.normcase(os.path.abspath(path)))
+    if name in _listing(folder, False):
+        return True
+    return refresh and name in _listing(folder, True)
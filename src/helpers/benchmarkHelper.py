@@ -0,0 +1,214 @@
+import json
+import os
+import platform
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Generator, Optional, Sequence
+from config.constants import DATA, FONT, FONT_STYLE, PATHS, TEXT
+from classes.types import Spell, Weapon
+from helpers.dataHelper import getArmors, getItems, getSpells, getWeapons
+from helpers.formattingHelper import (
+    clearFitCache,
+    findOptimalAttributeLayout,
+    formatDamage,
+    formatFloatAsInt,
+    getMaxFontSize,
+    wrapText,
+)
+from helpers.translationHelper import translate
+from helpers.syntheticHelper import CATALOG_FILES
+from helpers.templateHelper import getTemplate
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCHMARK_VERSION = 1
+DEFAULT_SEED = 1234
+SAMPLE_CARDS = 10  # cards drawn for the single-card and preview cases
+SCALING_SIZES = (1000, 10000, 100000)
+SCALING_RENDERS = 10  # cards per kind rendered at every catalog size
+KEYSTROKES = 6  # typed prefix length of the simulated searches
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Linearly interpolated ``q`` quantile (0..1) of ``samples``."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def timeCase(
+    run: Callable[[], Any],
+    repeat: int,
+    items: int = 1,
+    setup: Optional[Callable[[], Any]] = None,
+) -> dict[str, float]:
+    """Time ``repeat`` calls of ``run``, each processing ``items`` cards or strings.
+
+    ``setup`` runs untimed before every call, e.g. to start from cold caches.
+    """
+    samples: list[float] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    p50 = percentile(samples, 0.5)
+    return {
+        "samples": len(samples),
+        "items": items,
+        "p50Ms": p50 * 1e3,
+        "p95Ms": percentile(samples, 0.95) * 1e3,
+        "meanMs": sum(samples) / len(samples) * 1e3,
+        "minMs": min(samples) * 1e3,
+        "itemsPerSec": items / p50 if p50 else 0.0,
+    }
+
+
+def _attributeRows(weapon: Weapon) -> tuple[list[str], list[str]]:
+    """Fixed rows and attribute strings as the weapon stats block lays them out."""
+    fixed = [
+        f"{translate(TEXT.WEIGHT_PREFIX)}{formatFloatAsInt(weapon.weight)}{translate(TEXT.WEIGHT_SUFFIX)}"
+    ]
+    if weapon.damage:
+        fixed.append(f"{translate(TEXT.DAMAGE_PREFIX)}{formatDamage(weapon.damage, True)}")
+    return fixed, [str(attribute) for attribute in weapon.attributes]
+
+
+def catalogCases(repeat: int) -> dict[str, Any]:
+    """Time loading the bundled catalogs."""
+    return {
+        "catalog.getSpells": timeCase(getSpells, repeat, len(getSpells())),
+        "catalog.items": timeCase(
+            lambda: (getWeapons(), getArmors(), getItems()),
+            repeat,
+            len(getWeapons()) + len(getArmors()) + len(getItems()),
+        ),
+    }
+
+
+def microCases(repeat: int, spells: list[Spell], weapons: list[Weapon]) -> dict[str, Any]:
+    """Time the text fitting helpers from cold fit caches; fonts stay loaded."""
+    title = getTemplate("spell").boxes["title"].SIZE.ABSOLUTE
+    stats = getTemplate("item").boxes["stats"].SIZE.ABSOLUTE
+    names = [spell.name for spell in spells]
+    rows = [_attributeRows(weapon) for weapon in weapons if weapon.attributes]
+    return {
+        "micro.getMaxFontSize": timeCase(
+            lambda: [
+                getMaxFontSize(name, FONT.TITLE_PATH, FONT_STYLE.SIZES.TITLE, *title)
+                for name in names
+            ],
+            repeat,
+            len(names),
+            clearFitCache,
+        ),
+        "micro.wrapText": timeCase(
+            lambda: [
+                wrapText(name, FONT.TITLE_PATH, FONT_STYLE.SIZES.TITLE, *title)
+                for name in names
+            ],
+            repeat,
+            len(names),
+            clearFitCache,
+        ),
+        "micro.findOptimalAttributeLayout": timeCase(
+            lambda: [
+                findOptimalAttributeLayout(
+                    attributes, fixed, FONT.STATS_PATH, FONT_STYLE.SIZES.STATS, *stats
+                )
+                for fixed, attributes in rows
+            ],
+            repeat,
+            len(rows),
+            clearFitCache,
+        ),
+    }
+
+
+@contextmanager
+def catalogData(folder: str) -> Generator[None, None, None]:
+    """Read the catalogs from ``folder`` instead of ``data/`` for the block."""
+    original = dict(vars(DATA))
+    for kind, fileName in CATALOG_FILES.items():
+        setattr(DATA, kind.upper(), os.path.join(folder, fileName))
+    try:
+        yield
+    finally:
+        vars(DATA).update(original)
+
+
+def _peakRssMb() -> Optional[float]:
+    """Peak resident memory of this process, ``None`` where it is unknown."""
+    try:
+        # reset on exec, unlike ru_maxrss which a spawned child inherits
+        with open("/proc/self/status", "r", encoding="ascii") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if platform.system() == "Darwin" else 1024)
+
+
+def measureCatalogLoad(folder: str, repeat: int) -> dict[str, Any]:
+    """Load every catalog in ``folder``; runs in a fresh process for peak RSS."""
+    before = _peakRssMb()
+    with catalogData(folder):
+        start = time.perf_counter()
+        count = sum(len(c) for c in (getSpells(), getWeapons(), getArmors(), getItems()))
+        firstMs = (time.perf_counter() - start) * 1e3
+        peak = _peakRssMb()
+        result = timeCase(
+            lambda: (getSpells(), getWeapons(), getArmors(), getItems()), repeat, count
+        )
+    return {**result, "firstMs": firstMs, "baseRssMb": before, "peakRssMb": peak}
+
+
+def keystrokes(rng: random.Random, names: list[str], count: int) -> list[str]:
+    """Prefixes typed into a search box while looking for ``count`` random names."""
+    searches: list[str] = []
+    for name in rng.sample(names, min(count, len(names))):
+        searches.extend(name.lower()[:length] for length in range(1, KEYSTROKES + 1))
+    return searches
+
+
+def saveResults(results: dict[str, Any], path: Optional[str] = None) -> str:
+    """Write ``results`` as JSON, by default to a timestamped file in ``PATHS.BENCHMARK_OUTPUT``."""
+    if path is None:
+        stamp = results["timestamp"].replace(":", "").replace("-", "")
+        path = os.path.join(PATHS.BENCHMARK_OUTPUT, f"bench-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, ensure_ascii=False, indent=4)
+    return path
+
+
+def compareResults(baseline: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Table rows comparing the p50 per card or string of every shared case.
+
+    Times are divided by each case's item count, so runs with a different
+    ``--limit`` stay comparable; a ratio below 1 is an improvement.
+    """
+    rows = [f"{'case':<36}{'base/item':>12}{'new/item':>12}{'ratio':>8}"]
+    for name, case in current["cases"].items():
+        base = baseline["cases"].get(name)
+        if base is None:
+            continue
+        before = base["p50Ms"] / base["items"]
+        after = case["p50Ms"] / case["items"]
+        ratio = after / before if before else 0.0
+        rows.append(f"{name:<36}{before:>10.3f}ms{after:>10.3f}ms{ratio:>8.2f}")
+    return rows
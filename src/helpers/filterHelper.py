@@ -0,0 +1,68 @@
+from typing import Collection, Protocol, Sequence, TypeVar
+from classes.types import (
+    ArmorCategory,
+    AttributeType,
+    CasterClassType,
+    Item,
+    SpellType,
+)
+
+
+class _Named(Protocol):
+    id: str
+    name: str
+
+
+C = TypeVar("C", bound=_Named)
+W = TypeVar("W", bound=Item)
+
+
+def filterCards(cards: Sequence[C], search: str) -> list[C]:
+    """Cards whose id or name contains ``search``, ignoring case."""
+    search = search.lower()
+    return [
+        card
+        for card in cards
+        if search in card.id.lower() or search in card.name.lower()
+    ]
+
+
+def filterWeapons(
+    weapons: Sequence[W], search: str, attributes: Sequence[AttributeType]
+) -> list[W]:
+    """Weapons matching ``search`` that have all of ``attributes``."""
+    return [
+        weapon
+        for weapon in filterCards(weapons, search)
+        if all(attribute in weapon.attributes for attribute in attributes)
+    ]
+
+
+def selectCards(
+    cards: Sequence[C],
+    ids: Collection[str] = (),
+    levels: Collection[int] = (),
+    casterClasses: Collection[CasterClassType] = (),
+    schools: Collection[SpellType] = (),
+    categories: Collection[ArmorCategory] = (),
+) -> list[C]:
+    """Cards matching every non-empty selector.
+
+    Level, caster class and school only match spells, category only armor,
+    so e.g. a level selector drops all items.
+    """
+
+    def matches(card: C) -> bool:
+        if ids and card.id not in ids:
+            return False
+        if levels and getattr(card, "level", None) not in levels:
+            return False
+        if casterClasses and not any(
+            c in casterClasses for c in getattr(card, "casterClasses", ())
+        ):
+            return False
+        if schools and getattr(card, "type", None) not in schools:
+            return False
+        return not categories or getattr(card, "category", None) in categories
+
+    return [card for card in cards if matches(card)]
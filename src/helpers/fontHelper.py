@@ -0,0 +1,183 @@
+from collections import OrderedDict
+from io import BytesIO
+from threading import Lock
+from PIL import ImageFont
+from config.constants import FONT
+
+
+_fontBytes: dict[str, bytes] = {}
+_fonts: "OrderedDict[tuple[str, int], ImageFont.FreeTypeFont]" = OrderedDict()
+_stats: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+_metrics: dict[str, "FontMetrics"] = {}
+_lock = Lock()
+
+
+def _getFontBytes(fontPath: str) -> bytes:
+    data = _fontBytes.get(fontPath)
+    if data is None:
+        with open(fontPath, "rb") as file:
+            data = file.read()
+        _fontBytes[fontPath] = data
+    return data
+
+
+def getFont(fontPath: str, size: int) -> ImageFont.FreeTypeFont:
+    """Return a shared font for ``fontPath`` at ``size``.
+
+    The TTF file is read once per path and each (path, size) pair is parsed
+    once; the least recently used fonts are evicted beyond ``FONT.CACHE_SIZE``.
+    """
+    key = (fontPath, size)
+    with _lock:
+        font = _fonts.get(key)
+        if font is not None:
+            _fonts.move_to_end(key)
+            _stats["hits"] += 1
+            return font
+        _stats["misses"] += 1
+        font = ImageFont.truetype(BytesIO(_getFontBytes(fontPath)), size)
+        _fonts[key] = font
+        if len(_fonts) > FONT.CACHE_SIZE:
+            _fonts.popitem(last=False)
+            _stats["evictions"] += 1
+        return font
+
+
+def getFontCacheStats() -> dict[str, int]:
+    """Return hit/miss/eviction counters and the current number of cached fonts."""
+    with _lock:
+        return {**_stats, "size": len(_fonts)}
+
+
+def clearFontCache() -> None:
+    with _lock:
+        _fonts.clear()
+        _metrics.clear()
+        _fontBytes.clear()
+        for key in _stats:
+            _stats[key] = 0
+
+
+class FontMetrics:
+    """Advance, kerning and ink tables of one font at ``FONT.METRICS_SIZE``.
+
+    Glyphs and glyph pairs are measured once, the first time they are used;
+    extents at any other size are estimated by linear scaling without
+    rasterizing. Hinting makes real extents differ by a pixel or two, so
+    callers verify their final choice with a real measurement.
+    """
+
+    def __init__(self, fontPath: str) -> None:
+        self.fontPath = fontPath
+        self.referenceSize = FONT.METRICS_SIZE
+        self._font = ImageFont.truetype(
+            BytesIO(_getFontBytes(fontPath)), self.referenceSize
+        )
+        self._advances: dict[str, float] = {}
+        self._kerning: dict[tuple[str, str], float] = {}
+        self._extents: dict[str, tuple[float, float, float, float]] = {}
+        self._lineHeight = float(self._font.getbbox("A")[3])
+        self._lock = Lock()
+
+    def _advance(self, char: str) -> float:
+        advance = self._advances.get(char)
+        if advance is None:
+            advance = self._font.getlength(char)
+            self._advances[char] = advance
+        return advance
+
+    def _kern(self, left: str, right: str) -> float:
+        pair = (left, right)
+        kerning = self._kerning.get(pair)
+        if kerning is None:
+            kerning = (
+                self._font.getlength(left + right)
+                - self._advance(left)
+                - self._advance(right)
+            )
+            self._kerning[pair] = kerning
+        return kerning
+
+    def _extent(self, char: str) -> tuple[float, float, float, float]:
+        extent = self._extents.get(char)
+        if extent is None:
+            extent = tuple(float(v) for v in self._font.getbbox(char))  # type: ignore
+            self._extents[char] = extent  # type: ignore
+        return extent  # type: ignore
+
+    def _lineBox(self, line: str) -> tuple[float, float, float, float]:
+        left, top, right, bottom = 0.0, float("inf"), 0.0, float("-inf")
+        pen = 0.0
+        previous = ""
+        for char in line:
+            if previous:
+                pen += self._kern(previous, char)
+            if not char.isspace():
+                glyphLeft, glyphTop, glyphRight, glyphBottom = self._extent(char)
+                left = min(left, pen + glyphLeft)
+                right = max(right, pen + glyphRight)
+                top = min(top, glyphTop)
+                bottom = max(bottom, glyphBottom)
+            pen += self._advance(char)
+            previous = char
+        right = max(right, pen)
+        if top > bottom:
+            top = bottom = 0.0
+        return left, top, right, bottom
+
+    def length(self, text: str, size: float) -> float:
+        """Advance width of a single line of ``text`` at ``size``."""
+        with self._lock:
+            pen = 0.0
+            previous = ""
+            for char in text:
+                if previous:
+                    pen += self._kern(previous, char)
+                pen += self._advance(char)
+                previous = char
+        return pen * size / self.referenceSize
+
+    def bbox(
+        self, text: str, size: float, spacing: float = 4
+    ) -> tuple[float, float, float, float]:
+        """Estimated ``textbbox`` of (multiline) ``text`` at ``size``."""
+        scale = size / self.referenceSize
+        lineStep = self._lineHeight * scale + spacing
+        left = top = float("inf")
+        right = bottom = float("-inf")
+        with self._lock:
+            boxes = [self._lineBox(line) for line in text.split("\n")]
+        for index, (x0, y0, x1, y1) in enumerate(boxes):
+            offset = index * lineStep
+            left = min(left, x0 * scale)
+            right = max(right, x1 * scale)
+            top = min(top, y0 * scale + offset)
+            bottom = max(bottom, y1 * scale + offset)
+        return left, top, right, bottom
+
+    def fitSize(
+        self,
+        text: str,
+        maxWidth: float,
+        maxHeight: float = float("inf"),
+        spacing: float = 4,
+    ) -> float:
+        """Estimated largest (fractional) size at which ``text`` fits the box."""
+        left, top, right, bottom = self.bbox(text, self.referenceSize, spacing)
+        gaps = text.count("\n") * spacing
+        width = max(right - left, 1.0)
+        height = max(bottom - top - gaps, 1.0)
+        return min(
+            maxWidth * self.referenceSize / width,
+            (maxHeight - gaps) * self.referenceSize / height,
+        )
+
+
+def getFontMetrics(fontPath: str) -> FontMetrics:
+    """Return the shared :class:`FontMetrics` of ``fontPath``."""
+    with _lock:
+        metrics = _metrics.get(fontPath)
+        if metrics is None:
+            metrics = FontMetrics(fontPath)
+            _metrics[fontPath] = metrics
+        return metrics
@@ -1,9 +1,11 @@
 from datetime import timedelta
-from itertools import combinations
-from PIL import ImageFont, ImageDraw, Image
+from functools import lru_cache
+from typing import Callable, Iterator, TypeVar
+from PIL import ImageDraw, Image
 from classes.types import Damage
 from helpers.translationHelper import translate
 from classes.textKeys import Time
+from helpers.fontHelper import getFont, getFontMetrics
 
 
 def formatFloatAsInt(value: float) -> str:
@@ -34,111 +36,293 @@ def formatPriceWithSuffix(value: float) -> str:
         return formatFloatAsInt(value)
 
 
-def getMaxFontSize(
+BBox = tuple[float, float, float, float]
+
+_measureDraw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+_VERIFIED_LAYOUTS = 3  # attribute layouts measured with FreeType
+_FIT_STEPS = 4  # size steps around an estimate before a full search
+_EXTRA_LINES = 2  # lines tried beyond the fewest fitting the width
+_BREAK_PROBES = 32  # bisection steps of the narrowest-line search
+
+_fitCache: dict[tuple[str, str, int, float, float], tuple[int, BBox]] = {}
+_fitStats: dict[str, int] = {"hits": 0, "misses": 0, "measurements": 0}
+
+T = TypeVar("T")
+
+
+def _measure(text: str, fontPath: str, size: int) -> BBox:
+    _fitStats["measurements"] += 1
+    return _measureDraw.textbbox((0, 0), text, font=getFont(fontPath, size))
+
+
+@lru_cache(maxsize=4096)
+def measureText(text: str, fontPath: str, size: int) -> BBox:
+    """Return the bbox of ``text`` drawn at ``size`` (memoized)."""
+    return _measure(text, fontPath, size)
+
+
+def _largestSize(
+    check: Callable[[int], T | None], low: int, high: int
+) -> tuple[int, T] | None:
+    """Binary search the largest size in ``[low, high]`` passing ``check``."""
+    best: tuple[int, T] | None = None
+    while low <= high:
+        mid = (low + high) // 2
+        result = check(mid)
+        if result is not None:
+            best = (mid, result)
+            low = mid + 1
+        else:
+            high = mid - 1
+    return best
+
+
+def _largestSizeNear(
+    check: Callable[[int], T | None], low: int, high: int, guess: float
+) -> tuple[int, T] | None:
+    """Like :func:`_largestSize`, stepping from an estimated ``guess``.
+
+    A good estimate needs two or three checks; after ``_FIT_STEPS`` steps the
+    rest of the range is binary searched.
+    """
+    size = min(high, max(low, int(guess)))
+    result = check(size)
+    if result is not None:
+        for _ in range(_FIT_STEPS):
+            if size == high:
+                return size, result
+            larger = check(size + 1)
+            if larger is None:
+                return size, result
+            size, result = size + 1, larger
+        return _largestSize(check, size + 1, high) or (size, result)
+    for _ in range(_FIT_STEPS):
+        if size == low:
+            return None
+        size -= 1
+        result = check(size)
+        if result is not None:
+            return size, result
+    return _largestSize(check, low, size - 1)
+
+
+def fitFontSize(
     text: str,
     fontPath: str,
     maxSize: int,
     maxWidth: float,
     maxHeight: float = float("inf"),
-) -> int:
-    size = maxSize
-    dummyImage = Image.new("RGB", (1, 1))
-    draw = ImageDraw.Draw(dummyImage)
-    for size in range(maxSize, 1, -1):
-        testFont = ImageFont.truetype(fontPath, size)
-        bbox = draw.textbbox((0, 0), text, font=testFont)
-        testWidth = bbox[2] - bbox[0]
-        testHeight = bbox[3] - bbox[1]
-        if testWidth < maxWidth and testHeight < maxHeight:
-            break
-    return size
+) -> tuple[int, BBox]:
+    """Return the largest font size (down to 2) fitting the box and its bbox.
+
+    The size is estimated from the font's scaled metrics and confirmed by
+    measuring the text at and around the estimate. Results are memoized per
+    (text, font, box) for the rest of the session.
+    """
+    key = (text, fontPath, maxSize, maxWidth, maxHeight)
+    cached = _fitCache.get(key)
+    if cached is not None:
+        _fitStats["hits"] += 1
+        return cached
+    _fitStats["misses"] += 1
+
+    def check(size: int) -> BBox | None:
+        bbox = _measure(text, fontPath, size)
+        if bbox[2] - bbox[0] < maxWidth and bbox[3] - bbox[1] < maxHeight:
+            return bbox
+        return None
+
+    if maxSize <= 2:
+        result = (maxSize, _measure(text, fontPath, maxSize))
+    else:
+        guess = getFontMetrics(fontPath).fitSize(text, maxWidth, maxHeight)
+        result = _largestSizeNear(check, 2, maxSize, guess) or (
+            2,
+            _measure(text, fontPath, 2),
+        )
+    _fitCache[key] = result
+    return result
 
 
-def wrapText(
+def getFitStats() -> dict[str, int]:
+    """Return fit cache hit/miss counters and the number of real text measurements."""
+    return {**_fitStats, "size": len(_fitCache)}
+
+
+def clearFitCache() -> None:
+    """Forget every fitted size and memoized measurement and reset the counters."""
+    _fitCache.clear()
+    measureText.cache_clear()
+    for key in _fitStats:
+        _fitStats[key] = 0
+
+
+def getMaxFontSize(
     text: str,
     fontPath: str,
     maxSize: int,
     maxWidth: float,
     maxHeight: float = float("inf"),
-) -> str:
-    """Insert line breaks to maximize font size within the given width and height."""
-    words = text.split()
-    if len(words) <= 1:
-        return text
+) -> int:
+    return fitFontSize(text, fontPath, maxSize, maxWidth, maxHeight)[0]
+
+
+def _greedyBreaks(widths: list[float], space: float, maxWidth: float) -> list[int]:
+    """Indices of the words starting a new line, filling each line as far as possible.
+
+    This yields the fewest lines whose advance width stays below ``maxWidth``.
+    """
+    breaks: list[int] = []
+    lineWidth = widths[0]
+    for index in range(1, len(widths)):
+        if lineWidth + space + widths[index] < maxWidth:
+            lineWidth += space + widths[index]
+        else:
+            breaks.append(index)
+            lineWidth = widths[index]
+    return breaks
+
+
+def _narrowestBreaks(widths: list[float], space: float, lineCount: int) -> list[int]:
+    """Breaks into at most ``lineCount`` lines keeping the widest line narrowest.
+
+    The width limit is bisected with the greedy pass, which needs fewer lines
+    the wider it may fill them, so this stays linear per probe.
+    """
+    low, high = 0.0, sum(widths) + space * len(widths) + 1
+    for _ in range(_BREAK_PROBES):
+        middle = (low + high) / 2
+        if len(_greedyBreaks(widths, space, middle)) < lineCount:
+            high = middle
+        else:
+            low = middle
+    return _greedyBreaks(widths, space, high)
+
+
+def _joinLines(words: list[str], breaks: list[int]) -> str:
+    bounds = [0, *breaks, len(words)]
+    return "\n".join(
+        " ".join(words[start:end]) for start, end in zip(bounds, bounds[1:])
+    )
 
-    bestText = text
-    bestSize = getMaxFontSize(text, fontPath, maxSize, maxWidth, maxHeight)
-
-    # Limit the number of combinations to prevent exponential explosion
-    # For texts with many words, use a more efficient greedy approach
-    if len(words) > 8:
-        # Use greedy approach for long texts
-        return _wrapTextGreedy(text, fontPath, maxSize, maxWidth, maxHeight)
-
-    # For shorter texts, try different break combinations but limit the search
-    positions = list(range(1, len(words)))
-    max_breaks = min(3, len(words) - 1)  # Limit to max 3 line breaks
-
-    for r in range(1, max_breaks + 1):
-        for breaks in combinations(positions, r):
-            lines: list[str] = []
-            last = 0
-            for b in breaks:
-                lines.append(" ".join(words[last:b]))
-                last = b
-            lines.append(" ".join(words[last:]))
-            candidate = "\n".join(lines)
-            size = getMaxFontSize(candidate, fontPath, maxSize, maxWidth, maxHeight)
-            if size > bestSize:
-                bestSize = size
-                bestText = candidate
-
-    return bestText
-
-
-def _wrapTextGreedy(
+
+def wrapText(
     text: str,
     fontPath: str,
     maxSize: int,
     maxWidth: float,
     maxHeight: float = float("inf"),
 ) -> str:
-    """Greedy text wrapping approach for longer texts."""
+    """Insert line breaks to maximize font size within the given width and height.
+
+    At each size the fewest lines fitting the width are found greedily from
+    the words' advance widths; up to ``_EXTRA_LINES`` more are tried while
+    only the width is exceeded. The size is binary searched on the font's
+    scaled metrics and then confirmed with the real text bbox. Of the breaks
+    with that line count, the one rendering largest in a box of ``maxWidth``
+    wins, as cards fit the wrapped text to the width only.
+    """
     words = text.split()
     if len(words) <= 1:
         return text
+    metrics = getFontMetrics(fontPath)
+
+    def candidates(size: int) -> Iterator[tuple[str, str]]:
+        """(narrowest, greedy) texts per line count, fewest lines first."""
+        widths = [metrics.length(word, size) for word in words]
+        space = metrics.length(" ", size)
+        greedy = _greedyBreaks(widths, space, maxWidth)
+        fewest = len(greedy) + 1
+        for lineCount in range(fewest, min(len(words), fewest + _EXTRA_LINES) + 1):
+            narrowest = _joinLines(words, _narrowestBreaks(widths, space, lineCount))
+            yield narrowest, (_joinLines(words, greedy) if lineCount == fewest else narrowest)
+
+    def fits(size: int, measure: Callable[[str, int], BBox]) -> list[str] | None:
+        """Texts of the first line count with a text fitting at ``size``."""
+        for options in candidates(size):
+            unique = list(dict.fromkeys(options))
+            heights: list[float] = []
+            for candidate in unique:
+                bbox = measure(candidate, size)
+                heights.append(bbox[3] - bbox[1])
+                if heights[-1] < maxHeight and bbox[2] - bbox[0] < maxWidth:
+                    return unique
+            if min(heights) >= maxHeight:
+                return None  # more lines only get taller
+        return None
+
+    estimate = _largestSize(lambda size: fits(size, metrics.bbox), 2, maxSize)
+    found = _largestSizeNear(
+        lambda size: fits(size, lambda line, s: _measure(line, fontPath, s)),
+        2,
+        maxSize,
+        estimate[0] if estimate is not None else 2,
+    )
+    if found is None:
+        return text
+    # the size cards render at; memoized, so drawing reuses it
+    return max(
+        found[1], key=lambda option: fitFontSize(option, fontPath, maxSize, maxWidth)[0]
+    )
 
-    bestText = text
-    bestSize = getMaxFontSize(text, fontPath, maxSize, maxWidth, maxHeight)
-
-    # Try simple splits at different positions
-    for split_point in range(1, len(words)):
-        lines = [
-            " ".join(words[:split_point]),
-            " ".join(words[split_point:])
-        ]
-        candidate = "\n".join(lines)
-        size = getMaxFontSize(candidate, fontPath, maxSize, maxWidth, maxHeight)
-        if size > bestSize:
-            bestSize = size
-            bestText = candidate
-
-    # Try three-line splits for very long texts
-    if len(words) > 6:
-        mid1 = len(words) // 3
-        mid2 = 2 * len(words) // 3
-        lines = [
-            " ".join(words[:mid1]),
-            " ".join(words[mid1:mid2]),
-            " ".join(words[mid2:])
-        ]
-        candidate = "\n".join(lines)
-        size = getMaxFontSize(candidate, fontPath, maxSize, maxWidth, maxHeight)
-        if size > bestSize:
-            bestSize = size
-            bestText = candidate
 
-    return bestText
+def _minMaxBreaks(
+    widths: list[float], separator: float, rowCount: int
+) -> tuple[list[int], float]:
+    """Split tokens into ``rowCount`` rows minimizing the widest row.
+
+    Returns the indices starting a new row and the width of the widest row;
+    ties are broken towards the most even rows.
+    """
+    count = len(widths)
+    inf = float("inf")
+    # best[rows][end]: (widest row, squared widths) of tokens[:end] in ``rows`` rows
+    best = [[(inf, inf)] * (count + 1) for _ in range(rowCount + 1)]
+    previous = [[0] * (count + 1) for _ in range(rowCount + 1)]
+    best[0][0] = (0.0, 0.0)
+    for rows in range(1, rowCount + 1):
+        for end in range(rows, count + 1):
+            rowWidth = -separator
+            for start in range(end - 1, rows - 2, -1):
+                rowWidth += widths[start] + separator
+                widest, squares = best[rows - 1][start]
+                if widest == inf:
+                    continue
+                score = (max(widest, rowWidth), squares + rowWidth**2)
+                if score < best[rows][end]:
+                    best[rows][end] = score
+                    previous[rows][end] = start
+    breaks: list[int] = []
+    end = count
+    for rows in range(rowCount, 1, -1):
+        end = previous[rows][end]
+        breaks.append(end)
+    return breaks[::-1], best[rowCount][count][0]
+
+
+def _earliestBreaks(
+    widths: list[float], separator: float, rowCount: int, limit: float
+) -> list[int] | None:
+    """Breaks into ``rowCount`` rows no wider than ``limit``, each as early as possible.
+
+    Rows are filled greedily from the last one, so every break lands on the
+    earliest token that still lets the rest fit; ``None`` if nothing fits.
+    """
+    breaks: list[int] = []
+    end = len(widths)
+    for rowsBefore in range(rowCount - 1, 0, -1):
+        start = end - 1
+        rowWidth = widths[start]
+        while start > rowsBefore and rowWidth + separator + widths[start - 1] <= limit:
+            start -= 1
+            rowWidth += separator + widths[start]
+        if rowWidth > limit:
+            return None
+        breaks.append(start)
+        end = start
+    if sum(widths[:end]) + separator * (end - 1) > limit:
+        return None
+    return breaks[::-1]
 
 
 def findOptimalAttributeLayout(
@@ -149,66 +333,73 @@ def findOptimalAttributeLayout(
     maxWidth: float,
     maxHeight: float,
 ) -> tuple[list[str], int]:
+    """Split the attributes into rows below ``fixedRows`` maximizing the font size.
+
+    Every row count is planned from the attributes' advance widths and its
+    font size estimated from the font's scaled metrics. Only the most
+    promising layouts are verified with real FreeType measurement.
+    """
     if not attributes:
         return fixedRows, getMaxFontSize(
             "\n".join(fixedRows), fontPath, maxFontSize, maxWidth, maxHeight
         )
 
-    bestLayout = fixedRows + [", ".join(attributes)]
-    bestFontSize = getMaxFontSize(
-        "\n".join(bestLayout), fontPath, maxFontSize, maxWidth, maxHeight
-    )
-
-    if len(attributes) > 1:
-        for splitPoint in range(1, len(attributes)):
-            line1 = ", ".join(attributes[:splitPoint])
-            line2 = ", ".join(attributes[splitPoint:])
-            testRows = fixedRows + [line1, line2]
-            testString = "\n".join(testRows)
-
-            fontSize = getMaxFontSize(
-                testString, fontPath, maxFontSize, maxWidth, maxHeight
-            )
-
-            if fontSize > bestFontSize:
-                bestFontSize = fontSize
-                bestLayout = testRows
-
-    if len(attributes) > 3:
-        third = len(attributes) // 3
-        split1 = third
-        split2 = third * 2
+    metrics = getFontMetrics(fontPath)
+    widths = [metrics.length(attribute, maxFontSize) for attribute in attributes]
+    separator = metrics.length(", ", maxFontSize)
+
+    estimates: list[tuple[float, int, list[str]]] = []
+    for rowCount in range(1, len(attributes) + 1):
+        breaks, _widest = _minMaxBreaks(widths, separator, rowCount)
+        bounds = [0, *breaks, len(attributes)]
+        rows = [", ".join(attributes[a:b]) for a, b in zip(bounds, bounds[1:])]
+        layout = fixedRows + rows
+        size = min(
+            float(maxFontSize),
+            metrics.fitSize("\n".join(layout), maxWidth, maxHeight),
+        )
+        estimates.append((size, rowCount, layout))
 
-        line1 = ", ".join(attributes[:split1])
-        line2 = ", ".join(attributes[split1:split2])
-        line3 = ", ".join(attributes[split2:])
-        testRows = fixedRows + [line1, line2, line3]
-        testString = "\n".join(testRows)
+    estimates.sort(key=lambda estimate: (-estimate[0], estimate[1]))
+    bestLayout: list[str] = []
+    bestFontSize = 0
+    for size, _rowCount, layout in estimates[:_VERIFIED_LAYOUTS]:
+        if size + 1 < bestFontSize:
+            break
+        text = "\n".join(layout)
 
-        fontSize = getMaxFontSize(
-            testString, fontPath, maxFontSize, maxWidth, maxHeight
-        )
+        def check(fontSize: int) -> BBox | None:
+            bbox = _measure(text, fontPath, fontSize)
+            if bbox[2] - bbox[0] < maxWidth and bbox[3] - bbox[1] < maxHeight:
+                return bbox
+            return None
 
+        found = _largestSizeNear(check, 2, maxFontSize, size)
+        fontSize = found[0] if found is not None else 2
         if fontSize > bestFontSize:
             bestFontSize = fontSize
-            bestLayout = testRows
-
-        for split1 in range(1, len(attributes) - 1):
-            for split2 in range(split1 + 1, len(attributes)):
-                line1 = ", ".join(attributes[:split1])
-                line2 = ", ".join(attributes[split1:split2])
-                line3 = ", ".join(attributes[split2:])
-                testRows = fixedRows + [line1, line2, line3]
-                testString = "\n".join(testRows)
-
-                fontSize = getMaxFontSize(
-                    testString, fontPath, maxFontSize, maxWidth, maxHeight
-                )
-
-                if fontSize > bestFontSize:
-                    bestFontSize = fontSize
-                    bestLayout = testRows
-
+            bestLayout = layout
+
+    # among equal sizes, keep the earliest split like the exhaustive search did;
+    # rows may widen up to the box at the chosen size, else to the widest row
+    rows = bestLayout[len(fixedRows) :]
+    widest = max(metrics.length(row, maxFontSize) for row in rows)
+    for limit in (maxWidth * maxFontSize / max(1, bestFontSize), widest):
+        breaks = _earliestBreaks(widths, separator, len(rows), limit)
+        if breaks is None:
+            continue
+        bounds = [0, *breaks, len(attributes)]
+        earliest = fixedRows + [
+            ", ".join(attributes[a:b]) for a, b in zip(bounds, bounds[1:])
+        ]
+        if earliest == bestLayout:
+            break
+        fontSize = getMaxFontSize(
+            "\n".join(earliest), fontPath, maxFontSize, maxWidth, maxHeight
+        )
+        if fontSize >= bestFontSize:
+            bestLayout, bestFontSize = earliest, fontSize
+            break
     return bestLayout, bestFontSize
 
 
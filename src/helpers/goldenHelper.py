@@ -0,0 +1,93 @@
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+import numpy as np
+from PIL import Image
+from classes.types import JsonItemCache
+from helpers.dataHelper import getArmors, getItems, getSpells, getWeapons
+
+# the references are committed, so the set stays small: a print-size card is ~4 MB
+GOLDEN_PER_KIND = {"spell": 3, "weapon": 2, "armor": 1, "item": 3}
+GOLDEN_TRANSFORMED = 1  # weapons also drawn with ``TRANSFORM``
+GOLDEN_PREVIEWS = 2  # spells and weapons also checked at preview resolution
+GOLDEN_TOLERANCE = 2  # allowed difference per channel, absorbs resampling noise
+TRANSFORM: JsonItemCache = {
+    "rotate": 15.25,
+    "scale": 1.1,
+    "flip": True,
+    "offset_x": 40.0,
+    "offset_y": -25.0,
+}
+
+
+class GoldenCase(NamedTuple):
+    name: str
+    kind: str
+    cardId: str
+    transform: Optional[JsonItemCache]
+    preview: bool
+
+
+@lru_cache(maxsize=1)
+def goldenCatalog() -> dict[str, dict[str, Any]]:
+    """Cards of every kind by id."""
+    return {
+        "spell": {card.id: card for card in getSpells()},
+        "weapon": {card.id: card for card in getWeapons()},
+        "armor": {card.id: card for card in getArmors()},
+        "item": {card.id: card for card in getItems()},
+    }
+
+
+def goldenCases() -> list[GoldenCase]:
+    """The fixed reference set: the first cards of every catalog by id.
+
+    The first weapons are also drawn with a transform, and the first spells
+    and weapons at preview resolution through the cached layers.
+    """
+    cases: list[GoldenCase] = []
+    for kind, count in GOLDEN_PER_KIND.items():
+        for cardId in sorted(goldenCatalog()[kind])[:count]:
+            cases.append(GoldenCase(f"{kind}-{cardId}", kind, cardId, None, False))
+        if kind == "weapon":
+            for cardId in sorted(goldenCatalog()[kind])[:GOLDEN_TRANSFORMED]:
+                cases.append(
+                    GoldenCase(f"{kind}-{cardId}-transformed", kind, cardId, TRANSFORM, False)
+                )
+        if kind in ("spell", "weapon"):
+            for cardId in sorted(goldenCatalog()[kind])[:GOLDEN_PREVIEWS]:
+                cases.append(
+                    GoldenCase(f"{kind}-{cardId}-preview", kind, cardId, TRANSFORM, True)
+                )
+    return cases
+
+
+def compareImages(
+    expected: Image.Image, actual: Image.Image, tolerance: int
+) -> tuple[dict[str, Any], Optional[np.ndarray]]:
+    """Per-channel absolute difference of two images.
+
+    A pixel mismatches when any RGBA channel differs by more than
+    ``tolerance``. Returns the statistics and the per-pixel peak difference.
+    """
+    if expected.size != actual.size:
+        return {"maxDiff": 255, "badPixels": -1, "badFraction": 1.0}, None
+    a = np.asarray(expected.convert("RGBA"), dtype=np.int16)
+    b = np.asarray(actual.convert("RGBA"), dtype=np.int16)
+    peak = np.abs(a - b).max(axis=2)
+    bad = int(np.count_nonzero(peak > tolerance))
+    return {
+        "maxDiff": int(peak.max()),
+        "badPixels": bad,
+        "badFraction": bad / peak.size,
+    }, peak
+
+
+def heatmap(expected: Image.Image, peak: np.ndarray, tolerance: int) -> Image.Image:
+    """Dimmed reference with differences in red, brightest where they are largest."""
+    gray = np.asarray(expected.convert("L"), dtype=np.float32) * 0.35
+    heat = peak.astype(np.float32) * (255.0 / max(1, int(peak.max())))
+    bad = peak > tolerance
+    red = np.where(bad, np.maximum(heat, 96.0), gray)
+    other = np.where(bad, 0.0, gray)
+    rgb = np.stack([red, other, other], axis=2).clip(0, 255).astype(np.uint8)
+    return Image.fromarray(rgb, "RGB")
@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+from os.path import join
+from typing import Any, Optional, cast
+from classes.types import JsonItemCache
+from config.constants import FONT, IMAGE, PATHS, SRC
+from helpers.translationHelper import LANG_DIR, get_language, get_theme
+
+MANIFEST_VERSION = 1
+# bump whenever a code change alters rendered pixels, so existing cards rebuild
+RENDERER_VERSION = 5
+
+DEFAULT_TRANSFORM: JsonItemCache = {
+    "rotate": 0.0,
+    "scale": 1.0,
+    "flip": False,
+    "offset_x": 0.0,
+    "offset_y": 0.0,
+}
+
+
+def fileFingerprint(path: str) -> Optional[list[int]]:
+    """Return ``[mtime_ns, size]`` for ``path`` or ``None`` if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _directoryFingerprints(folder: str) -> list[Any]:
+    fingerprints: list[Any] = []
+    for root, _dirs, files in os.walk(folder):
+        for name in sorted(files):
+            path = join(root, name)
+            fingerprints.append([os.path.relpath(path, folder), fileFingerprint(path)])
+    return sorted(fingerprints)
+
+
+def renderFingerprint() -> str:
+    """Digest of everything shared by all cards of a render run.
+
+    Covers the renderer version, the language and its translation file, the
+    theme, the fonts, the background templates, the icons, the card templates
+    and the constants.
+    """
+    language = get_language()
+    payload = {
+        "version": MANIFEST_VERSION,
+        "renderer": RENDERER_VERSION,
+        "language": language,
+        "languageFile": fileFingerprint(join(LANG_DIR, f"{language}.json")),
+        "theme": get_theme(),
+        "fonts": [fileFingerprint(path) for path in vars(FONT.PATHS).values()],
+        "templates": _directoryFingerprints(IMAGE.PATHS.BACKGROUND),
+        "icons": _directoryFingerprints(join(IMAGE.PATHS.ASSETS, "icons")),
+        "cardTemplates": _directoryFingerprints(PATHS.TEMPLATES),
+        "layout": fileFingerprint(join(SRC, "config", "constants.py")),
+    }
+    return _digest(payload)
+
+
+def cardDigest(
+    fingerprint: str,
+    entry: Any,
+    transform: Optional[JsonItemCache],
+    artPath: str,
+) -> str:
+    """Digest of a single card's inputs.
+
+    ``entry`` is the card's JSON representation and ``transform`` its
+    ``itemCache``/``spellCache`` entry (``None`` for the defaults).
+    """
+    payload = {
+        "render": fingerprint,
+        "entry": entry,
+        "transform": {**DEFAULT_TRANSFORM, **(transform or {})},
+        "art": fileFingerprint(artPath),
+    }
+    return _digest(payload)
+
+
+def _digest(payload: Any) -> str:
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class BuildManifest:
+    """Record of the inputs each rendered card in ``output/`` was built from.
+
+    Entries are keyed by ``"<kind>/<id>"`` and store the card digest and the
+    PNG path relative to the output folder.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or PATHS.BUILD_MANIFEST
+        self.cards: dict[str, dict[str, str]] = {}
+        self._dirty = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if not isinstance(data, dict):
+            return
+        manifest = cast(dict[str, Any], data)
+        if manifest.get("version") == MANIFEST_VERSION:
+            self.cards = manifest.get("cards", {})
+
+    def isCurrent(self, key: str, digest: str, outputPath: str) -> bool:
+        entry = self.cards.get(key)
+        return (
+            entry is not None
+            and entry.get("hash") == digest
+            and entry.get("output") == self._relative(outputPath)
+            and os.path.exists(outputPath)
+        )
+
+    def record(self, key: str, digest: str, outputPath: str) -> None:
+        previous = self.cards.get(key)
+        output = self._relative(outputPath)
+        if previous is not None and previous.get("output") != output:
+            self._remove(previous.get("output", ""))
+        self.cards[key] = {"hash": digest, "output": output}
+        self._dirty = True
+
+    def prune(self, kind: str, liveKeys: set[str]) -> list[str]:
+        """Delete PNGs of ``kind`` cards whose ids are no longer in the catalog."""
+        removed: list[str] = []
+        for key in [k for k in self.cards if k.startswith(f"{kind}/")]:
+            if key in liveKeys:
+                continue
+            output = self.cards.pop(key).get("output", "")
+            if self._remove(output):
+                removed.append(join(PATHS.OUTPUT, output))
+            self._dirty = True
+        return removed
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmpPath = f"{self.path}.tmp"
+        with open(tmpPath, "w", encoding="utf-8") as file:
+            json.dump(
+                {"version": MANIFEST_VERSION, "cards": self.cards},
+                file,
+                ensure_ascii=False,
+                indent=4,
+                sort_keys=True,
+            )
+        os.replace(tmpPath, self.path)
+        self._dirty = False
+
+    def _relative(self, outputPath: str) -> str:
+        return os.path.relpath(outputPath, PATHS.OUTPUT).replace(os.sep, "/")
+
+    def _remove(self, output: str) -> bool:
+        if not output:
+            return False
+        try:
+            os.remove(join(PATHS.OUTPUT, output))
+        except FileNotFoundError:
+            return False
+        return True
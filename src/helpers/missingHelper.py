@@ -0,0 +1,99 @@
+import atexit
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Generator, Iterable
+
+# ids per missing-list path; ``True`` replaces the file instead of merging
+_pending: dict[str, tuple[set[str], bool]] = {}
+_lock = threading.Lock()
+
+
+def recordMissing(path: str, ids: Iterable[str], replace: bool = False) -> None:
+    """Remember missing-art ``ids`` for the list at ``path`` until the next flush.
+
+    With ``replace`` the flushed file holds exactly the ids recorded since
+    then, e.g. after a batch that checked every card of the list.
+    """
+    with _lock:
+        empty: tuple[set[str], bool] = (set(), False)
+        pending, replacing = _pending.get(path, empty)
+        if replace:
+            pending, replacing = set[str](), True
+        pending.update(ids)
+        _pending[path] = (pending, replacing)
+
+
+def takeMissing() -> dict[str, tuple[list[str], bool]]:
+    """Remove and return the pending ids, e.g. to hand them to another process."""
+    with _lock:
+        taken = {path: (sorted(ids), replace) for path, (ids, replace) in _pending.items()}
+        _pending.clear()
+    return taken
+
+
+def mergeMissing(taken: dict[str, tuple[list[str], bool]]) -> None:
+    """Add ids returned by :func:`takeMissing` to this process's pending ids."""
+    for path, (ids, replace) in taken.items():
+        recordMissing(path, ids, replace)
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    @contextmanager
+    def _fileLock(path: str) -> Generator[None, None, None]:
+        """Hold an exclusive lock on ``path.lock`` across processes."""
+        with open(f"{path}.lock", "a+b") as handle:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    @contextmanager
+    def _fileLock(path: str) -> Generator[None, None, None]:
+        """Hold an exclusive lock on ``path.lock`` across processes."""
+        with open(f"{path}.lock", "a+b") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _readIds(path: str) -> set[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return set()
+    return {str(i) for i in data} if isinstance(data, list) else set()  # type: ignore
+
+
+def flushMissing() -> None:
+    """Write every pending missing list once, merged with the file on disk.
+
+    Each file is read and replaced under a lock and written through a
+    temporary file, so concurrent flushes neither lose ids nor leave a
+    half-written list behind.
+    """
+    for path, (ids, replace) in takeMissing().items():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with _fileLock(path):
+            merged = set(ids) if replace else _readIds(path) | set(ids)
+            tmpPath = f"{path}.{os.getpid()}.tmp"
+            with open(tmpPath, "w", encoding="utf-8") as file:
+                json.dump(sorted(merged), file, ensure_ascii=False, indent=4)
+            os.replace(tmpPath, path)
+
+
+# GUI sessions record ids outside of batches; keep them on exit
+atexit.register(flushMissing)
@@ -0,0 +1,163 @@
+import json
+import math
+import os
+from os.path import join
+from threading import Lock
+from typing import Optional
+from PIL import Image
+from PIL.Image import Resampling
+from classes.types import NormalizedAsset
+from config.constants import IMAGE, PATHS
+from helpers.manifestHelper import fileFingerprint
+from helpers.templateHelper import CARD_KINDS, getTemplate
+
+NORMALIZE_VERSION = 1
+MAX_ART_SCALE = 1.5  # largest scale offered by the preview sliders
+
+_index: dict[str, NormalizedAsset] = {}
+_byOutput: dict[str, NormalizedAsset] = {}
+_indexMtime: Optional[float] = None
+_lock = Lock()
+
+
+def artFolders() -> list[str]:
+    """Asset folders holding card artwork."""
+    return [
+        IMAGE.PATHS.ITEMS,
+        IMAGE.PATHS.WEAPONS,
+        IMAGE.PATHS.ARMOR,
+        IMAGE.PATHS.SPELLS,
+    ]
+
+
+def maxArtSide() -> int:
+    """Longest side a normalized copy is capped to."""
+    arts = [getTemplate(kind).art for kind in CARD_KINDS]
+    boxes = [art.SIZE.ABSOLUTE for art in arts if art is not None]
+    return math.ceil(max((max(box) for box in boxes), default=0) * MAX_ART_SCALE)
+
+
+def _key(path: str) -> str:
+    return os.path.relpath(path, IMAGE.PATHS.ASSETS).replace(os.sep, "/")
+
+
+def _loadIndex() -> None:
+    global _index, _byOutput, _indexMtime
+    try:
+        mtime = os.path.getmtime(PATHS.ASSET_INDEX)
+    except FileNotFoundError:
+        mtime = None
+    if mtime == _indexMtime:
+        return
+    index: dict[str, NormalizedAsset] = {}
+    if mtime is not None:
+        try:
+            with open(PATHS.ASSET_INDEX, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") == NORMALIZE_VERSION:
+                index = data.get("assets", {})
+        except (OSError, json.JSONDecodeError):
+            pass
+    _index = index
+    _byOutput = {
+        os.path.normpath(join(PATHS.ASSET_CACHE, entry["output"])): entry
+        for entry in index.values()
+    }
+    _indexMtime = mtime
+
+
+def normalizedAssetPath(path: str) -> str:
+    """Return the normalized copy of ``path`` if it is up to date, else ``path``."""
+    with _lock:
+        _loadIndex()
+        entry = _index.get(_key(path))
+    if entry is None or entry["source"] != fileFingerprint(path):
+        return path
+    output = join(PATHS.ASSET_CACHE, entry["output"])
+    return output if os.path.exists(output) else path
+
+
+def getNormalizedAsset(path: str) -> Optional[NormalizedAsset]:
+    """Return the metadata of ``path`` if it is a normalized copy."""
+    with _lock:
+        _loadIndex()
+        return _byOutput.get(os.path.normpath(path))
+
+
+def _normalize(path: str, output: str) -> NormalizedAsset:
+    with Image.open(path) as source:
+        image = source.convert("RGBA")
+    width, height = image.size
+    crop = image.getchannel("A").getbbox() or (0, 0, width, height)
+    image = image.crop(crop)
+    scale = min(1.0, maxArtSide() / max(image.size))
+    if scale < 1:
+        size = (
+            max(1, round(image.width * scale)),
+            max(1, round(image.height * scale)),
+        )
+        image = image.resize(size, resample=Resampling.LANCZOS)
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    tmpPath = f"{output}.tmp"
+    image.save(tmpPath, format="PNG")
+    os.replace(tmpPath, output)
+    return {
+        "source": fileFingerprint(path) or [0, 0],
+        "output": os.path.relpath(output, PATHS.ASSET_CACHE).replace(os.sep, "/"),
+        "size": [width, height],
+        "crop": list(crop),
+        "scale": image.width / (crop[2] - crop[0]),
+    }
+
+
+def normalizeAssets(force: bool = False) -> dict[str, int]:
+    """Write normalized copies of all card artwork into ``PATHS.ASSET_CACHE``.
+
+    Copies are RGBA, trimmed to their opaque bounding box and capped to
+    :func:`maxArtSide`; the index records the original geometry so cards keep
+    their layout. Up-to-date copies are skipped unless ``force`` is set.
+    """
+    with _lock:
+        _loadIndex()
+        index = dict(_index)
+    summary = {"normalized": 0, "current": 0, "removed": 0}
+    live: set[str] = set()
+    for folder in artFolders():
+        if not os.path.isdir(folder):
+            continue
+        for name in sorted(os.listdir(folder)):
+            path = join(folder, name)
+            if not name.lower().endswith(f".{IMAGE.FORMAT}") or not os.path.isfile(path):
+                continue
+            key = _key(path)
+            live.add(key)
+            entry = index.get(key)
+            output = join(PATHS.ASSET_CACHE, key)
+            if (
+                not force
+                and entry is not None
+                and entry["source"] == fileFingerprint(path)
+                and os.path.exists(output)
+            ):
+                summary["current"] += 1
+                continue
+            index[key] = _normalize(path, output)
+            summary["normalized"] += 1
+    for key in [key for key in index if key not in live]:
+        try:
+            os.remove(join(PATHS.ASSET_CACHE, index.pop(key)["output"]))
+        except FileNotFoundError:
+            pass
+        summary["removed"] += 1
+    os.makedirs(PATHS.ASSET_CACHE, exist_ok=True)
+    tmpPath = f"{PATHS.ASSET_INDEX}.tmp"
+    with open(tmpPath, "w", encoding="utf-8") as file:
+        json.dump(
+            {"version": NORMALIZE_VERSION, "assets": index},
+            file,
+            ensure_ascii=False,
+            indent=4,
+            sort_keys=True,
+        )
+    os.replace(tmpPath, PATHS.ASSET_INDEX)
+    return summary
@@ -0,0 +1,220 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Generator, Optional
+from PIL import Image
+from config.constants import PATHS
+from helpers.assetHelper import getArtCacheStats
+from helpers.fontHelper import getFontCacheStats
+from helpers.formattingHelper import getFitStats, measureText
+from helpers.translationHelper import get_profile_render
+
+PROFILE_ENV = "DHELPER_PROFILE"
+
+Op = Callable[[Image.Image], None]
+ProfileEvent = dict[str, Any]
+
+_local = threading.local()
+
+
+def profilingEnabled() -> bool:
+    """Whether render profiling is on via settings or ``DHELPER_PROFILE``."""
+    value = os.environ.get(PROFILE_ENV, "")
+    return get_profile_render() or value.lower() not in ("", "0", "false", "no")
+
+
+def cacheCounters() -> dict[str, int]:
+    """Flat snapshot of the font, art, fit and measurement cache counters."""
+    counters: dict[str, int] = {}
+    for prefix, stats in (
+        ("font", getFontCacheStats()),
+        ("art", getArtCacheStats()),
+        ("fit", getFitStats()),
+    ):
+        for name, value in stats.items():
+            counters[f"{prefix}.{name}"] = value
+    info = measureText.cache_info()
+    counters["measure.hits"] = info.hits
+    counters["measure.misses"] = info.misses
+    return counters
+
+
+class CardCapture:
+    """Events and cache counter deltas recorded while rendering one card."""
+
+    def __init__(self, cardId: str) -> None:
+        self.cardId = cardId
+        self.events: list[ProfileEvent] = []
+        self.counters: dict[str, int] = {}
+
+    def record(self, name: str, kind: str, start: int, wall: int, cpu: int) -> None:
+        self.events.append(
+            {
+                "name": name,
+                "kind": kind,
+                "card": self.cardId,
+                "start": start,
+                "wall": wall,
+                "cpu": cpu,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+        )
+
+    def result(self) -> dict[str, Any]:
+        return {"events": self.events, "counters": self.counters}
+
+
+def _capture() -> Optional[CardCapture]:
+    return getattr(_local, "capture", None)
+
+
+@contextmanager
+def captureCard(cardId: str) -> Generator[Optional[CardCapture], None, None]:
+    """Record the spans of the card rendered in this block on this thread.
+
+    Yields ``None`` when profiling is off, so callers pay nothing.
+    """
+    if not profilingEnabled():
+        yield None
+        return
+    capture = CardCapture(cardId)
+    before = cacheCounters()
+    previous = _capture()
+    _local.capture = capture
+    try:
+        with profileSpan("render", "render"):
+            yield capture
+    finally:
+        _local.capture = previous
+        after = cacheCounters()
+        capture.counters = {
+            name: after[name] - before.get(name, 0)
+            for name in after
+            if not name.endswith((".size", ".bytes"))
+        }
+
+
+@contextmanager
+def profileSpan(name: str, kind: str) -> Generator[None, None, None]:
+    """Time the block as a span of the card captured on this thread."""
+    capture = _capture()
+    if capture is None:
+        yield
+        return
+    start, cpu = time.perf_counter_ns(), time.thread_time_ns()
+    try:
+        yield
+    finally:
+        capture.record(
+            name,
+            kind,
+            start,
+            time.perf_counter_ns() - start,
+            time.thread_time_ns() - cpu,
+        )
+
+
+def profiled(kind: str, op: Op, name: str = "") -> Op:
+    """Wrap a card instruction so it is timed while a card is captured."""
+    if not profilingEnabled():
+        return op
+    name = name or kind
+
+    def timed(background: Image.Image) -> None:
+        with profileSpan(name, kind):
+            op(background)
+
+    return timed
+
+
+class RenderProfile:
+    """Timings and cache counters of a whole render batch.
+
+    Card captures from worker processes are merged with :meth:`add`; the
+    batch is written as a JSON summary and as a Chrome trace-event file that
+    ``chrome://tracing`` or Perfetto can open.
+    """
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.start = time.perf_counter_ns()
+        self.cpuStart = time.process_time_ns()
+        self.events: list[ProfileEvent] = []
+        self.counters: dict[str, int] = {}
+        self.cards = 0
+
+    def add(self, capture: Optional[dict[str, Any]]) -> None:
+        if capture is None:
+            return
+        self.cards += 1
+        self.events.extend(capture["events"])
+        for name, value in capture["counters"].items():
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self) -> dict[str, Any]:
+        kinds: dict[str, dict[str, float]] = {}
+        for event in self.events:
+            entry = kinds.setdefault(event["kind"], {"count": 0, "wallMs": 0.0, "cpuMs": 0.0})
+            entry["count"] += 1
+            entry["wallMs"] += event["wall"] / 1e6
+            entry["cpuMs"] += event["cpu"] / 1e6
+        for entry in kinds.values():
+            entry["meanWallMs"] = entry["wallMs"] / entry["count"]
+        rates: dict[str, float] = {}
+        for prefix in ("font", "art", "fit", "measure"):
+            hits = self.counters.get(f"{prefix}.hits", 0)
+            total = hits + self.counters.get(f"{prefix}.misses", 0)
+            if total:
+                rates[prefix] = hits / total
+        return {
+            "label": self.label,
+            "cards": self.cards,
+            "wallMs": (time.perf_counter_ns() - self.start) / 1e6,
+            "parentCpuMs": (time.process_time_ns() - self.cpuStart) / 1e6,
+            "kinds": kinds,
+            "fitMeasurements": self.counters.get("fit.measurements", 0),
+            "cacheHitRates": rates,
+            "counters": self.counters,
+        }
+
+    def traceEvents(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "name": event["name"],
+                "cat": event["kind"],
+                "ph": "X",
+                "ts": (event["start"] - self.start) / 1e3,
+                "dur": event["wall"] / 1e3,
+                "pid": event["pid"],
+                "tid": event["tid"],
+                "args": {"card": event["card"], "cpuMs": event["cpu"] / 1e6},
+            }
+            for event in self.events
+        ]
+
+    def save(self, folder: Optional[str] = None) -> tuple[str, str]:
+        """Write ``<label>-<time>.json`` and ``<label>-<time>.trace.json`` to ``folder``.
+
+        ``folder`` defaults to the profile folder of the current output path.
+        """
+        folder = folder or PATHS.PROFILE_OUTPUT
+        os.makedirs(folder, exist_ok=True)
+        stem = os.path.join(folder, f"{self.label}-{time.strftime('%Y%m%d-%H%M%S')}")
+        summaryPath, tracePath = f"{stem}.json", f"{stem}.trace.json"
+        with open(summaryPath, "w", encoding="utf-8") as file:
+            json.dump(
+                {**self.summary(), "events": self.events},
+                file,
+                ensure_ascii=False,
+                indent=4,
+            )
+        with open(tracePath, "w", encoding="utf-8") as file:
+            json.dump(
+                {"traceEvents": self.traceEvents(), "displayTimeUnit": "ms"},
+                file,
+                ensure_ascii=False,
+            )
+        return summaryPath, tracePath
@@ -0,0 +1,118 @@
+import copy
+import json
+import os
+import random
+from os.path import join
+from typing import Any
+from config.constants import DATA
+
+CATALOG_FILES = {
+    "spells": "spells.json",
+    "weapons": "weapons.json",
+    "armor": "armor.json",
+    "items": "items.json",
+}
+
+
+def _loadBundled(kind: str) -> dict[str, Any]:
+    with open(join(DATA.DIRECTORY, CATALOG_FILES[kind]), "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+class CatalogGenerator:
+    """Random but valid catalog entries modelled on the bundled catalogs.
+
+    Names reuse the words and word counts of the bundled names, and every
+    entry copies its fields from a random bundled entry of the same kind, so
+    level, damage, component and attribute mixes follow the real data. The
+    same ``seed`` always yields the same catalog.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        self.rng = random.Random(seed)
+        self.bundled = {kind: list(_loadBundled(kind).values()) for kind in CATALOG_FILES}
+        names = [
+            entry["name"] for entries in self.bundled.values() for entry in entries
+        ]
+        self.words = sorted({word for name in names for word in name.split()})
+        self.wordCounts = [len(name.split()) for name in names]
+
+    def name(self) -> str:
+        count = self.rng.choice(self.wordCounts)
+        return " ".join(self.rng.choice(self.words) for _ in range(count))
+
+    def sentence(self, low: int, high: int) -> str:
+        words = [self.rng.choice(self.words) for _ in range(self.rng.randint(low, high))]
+        return " ".join(words).capitalize() + "."
+
+    def _pick(self, kind: str) -> dict[str, Any]:
+        return copy.deepcopy(self.rng.choice(self.bundled[kind]))
+
+    def spell(self, spellId: str) -> dict[str, Any]:
+        entry = self._pick("spells")
+        # mix independent fields of a second spell into the first
+        other = self._pick("spells")
+        for field in ("level", "duration", "range", "components", "target"):
+            if self.rng.random() < 0.5:
+                entry[field] = other[field]
+        entry["id"] = spellId
+        entry["name"] = self.name()
+        return entry
+
+    def weapon(self) -> dict[str, Any]:
+        # attributes, ranges and versatile damage stay together to remain valid
+        entry = self._pick("weapons")
+        entry["name"] = self.name()
+        entry["price"] = round(entry["price"] * self.rng.choice((0.5, 1, 1, 2, 10)), 2)
+        return entry
+
+    def armor(self) -> dict[str, Any]:
+        entry = self._pick("armor")
+        entry["name"] = self.name()
+        return entry
+
+    def item(self) -> dict[str, Any]:
+        if self.bundled["items"]:
+            entry = self._pick("items")
+            entry["name"] = self.name()
+            return entry
+        # no bundled items: price and weight like a weapon, plus a description
+        weapon = self._pick("weapons")
+        return {
+            "name": self.name(),
+            "price": weapon["price"],
+            "weight": weapon["weight"],
+            "description": self.sentence(4, 30),
+        }
+
+    def catalog(self, kind: str, size: int) -> dict[str, Any]:
+        """``size`` entries of ``kind`` keyed by unique ids."""
+        prefix = f"synthetic_{kind}"
+        if kind == "spells":
+            return {
+                f"{prefix}_{i:06d}": self.spell(f"{prefix}_{i:06d}") for i in range(size)
+            }
+        create = {"weapons": self.weapon, "armor": self.armor, "items": self.item}[kind]
+        return {f"{prefix}_{i:06d}": create() for i in range(size)}
+
+
+def writeCatalog(folder: str, sizes: dict[str, int], seed: int = 0) -> dict[str, str]:
+    """Write synthetic ``spells.json``/``weapons.json``/... with ``sizes[kind]`` entries.
+
+    Returns the written paths by kind; kinds missing from ``sizes`` get an
+    empty catalog so ``folder`` can replace the whole data directory.
+    """
+    generator = CatalogGenerator(seed)
+    os.makedirs(folder, exist_ok=True)
+    paths: dict[str, str] = {}
+    for kind, fileName in CATALOG_FILES.items():
+        path = join(folder, fileName)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                generator.catalog(kind, sizes.get(kind, 0)),
+                file,
+                ensure_ascii=False,
+                indent=4,
+            )
+        paths[kind] = path
+    return paths
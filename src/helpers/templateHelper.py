@@ -0,0 +1,185 @@
+import json
+import os
+from os.path import join
+from threading import Lock
+from typing import Any, Callable, Optional, TypeVar, Union, cast
+from config.constants import (
+    CARD,
+    FONT,
+    FONT_STYLE,
+    IMAGE,
+    PATHS,
+    SECONDARY_FONT_STYLE,
+    LayoutElement,
+)
+
+TEMPLATE_VERSION = 1
+CARD_KINDS = ("item", "spell")
+ELEMENT_TYPES = ("art", "icon", "text", "stats")
+
+T = TypeVar("T")
+
+_templates: dict[tuple[str, str], tuple[float, "CardTemplate"]] = {}
+_lock = Lock()
+
+
+def _assetPath(relative: str) -> str:
+    return join(IMAGE.PATHS.ASSETS, *relative.split("/"))
+
+
+def _lookup(owner: Any, name: str, what: str) -> Any:
+    try:
+        return getattr(owner, name.upper())
+    except AttributeError:
+        raise ValueError(f"unknown {what} '{name}' in card template") from None
+
+
+class ImageChoice:
+    """An asset path that is either fixed or selected by a card binding.
+
+    ``spec`` is a path relative to the assets folder, ``{"image": path}`` or
+    ``{"select": binding, "images": {value: path}, "default": value}``.
+    """
+
+    def __init__(self, spec: Union[str, dict[str, Any]]) -> None:
+        if isinstance(spec, dict) and "image" in spec:
+            spec = cast(str, spec["image"])
+        if isinstance(spec, str):
+            self.select: Optional[str] = None
+            self.images = {"": _assetPath(spec)}
+            self.default = ""
+            return
+        self.select = cast(str, spec["select"])
+        images = cast(dict[str, str], spec["images"])
+        self.images = {str(k): _assetPath(v) for k, v in images.items()}
+        self.default = str(spec.get("default", next(iter(self.images))))
+        if self.default not in self.images:
+            raise ValueError(f"default '{self.default}' is not one of the images")
+
+    def resolve(self, bindings: dict[str, Any]) -> str:
+        if self.select is None:
+            return self.images[""]
+        return self.images.get(str(bindings.get(self.select)), self.images[self.default])
+
+    def paths(self) -> list[str]:
+        return list(self.images.values())
+
+
+class TemplateElement:
+    """One element of a compiled template with its font and layout resolved."""
+
+    def __init__(self, spec: dict[str, Any], boxes: dict[str, LayoutElement]) -> None:
+        self.type: str = spec["type"]
+        if self.type not in ELEMENT_TYPES:
+            raise ValueError(f"unknown element type '{self.type}' in card template")
+        if spec["box"] not in boxes:
+            raise ValueError(f"unknown box '{spec['box']}' in card template")
+        self.layout = boxes[spec["box"]]
+        self.static = bool(spec.get("static", False))
+        self.when: Optional[str] = spec.get("when")
+        self.unless: Optional[str] = spec.get("unless")
+        self.value: Optional[str] = spec.get("value")
+        self.wrap = bool(spec.get("wrap", False))
+        self.primary = bool(spec.get("primary", True))
+        self.image = ImageChoice(spec["image"]) if self.type == "icon" else None
+        font = spec.get("font", "stats")
+        style = FONT_STYLE if self.primary else SECONDARY_FONT_STYLE
+        self.fontPath: str = _lookup(FONT, f"{font}_PATH", "font")
+        self.size: int = _lookup(style.SIZES, spec.get("size", font), "size")
+        if self.type == "text" and self.value is None:
+            raise ValueError("text elements need a 'value' binding")
+        if self.static and (
+            self.type != "icon"
+            or self.image is None
+            or self.image.select is not None
+            or self.when is not None
+            or self.unless is not None
+        ):
+            raise ValueError("only fixed, unconditional icons can be static")
+
+    def applies(self, bindings: dict[str, Any]) -> bool:
+        """Whether the element is drawn for a card with ``bindings``."""
+        if self.when is not None and bindings.get(self.when) in (None, False):
+            return False
+        if self.unless is not None and bindings.get(self.unless):
+            return False
+        return True
+
+
+class CardTemplate:
+    """The ``kind`` section of a template file, compiled once.
+
+    Boxes become :class:`LayoutElement` objects and asset paths and fonts are
+    resolved, so rendering a card only evaluates the per-card bindings.
+    ``static`` elements do not depend on the card and ``dynamic`` ones are in
+    drawing order, including the ``art`` element.
+    """
+
+    def __init__(self, path: str, kind: str, spec: dict[str, Any]) -> None:
+        self.path = path
+        self.kind = kind
+        self.boxes = {
+            name: LayoutElement(*box) for name, box in spec["boxes"].items()
+        }
+        self.background = ImageChoice(spec["background"])
+        elements = [TemplateElement(e, self.boxes) for e in spec["elements"]]
+        self.static = [e for e in elements if e.static]
+        self.dynamic = [e for e in elements if not e.static]
+        arts = [e for e in elements if e.type == "art"]
+        if len(arts) > 1:
+            raise ValueError("a card template can only place one artwork")
+        self.art: Optional[LayoutElement] = arts[0].layout if arts else None
+        self._factories: Optional[list[Any]] = None
+
+    def factories(self, compile: Callable[[TemplateElement], T]) -> list[Optional[T]]:
+        """Op factories of the ``dynamic`` elements, ``None`` for the art.
+
+        They are built by ``compile`` on first use and kept with the template,
+        which is shared by every renderer, so ``compile`` must only depend on
+        the element and the factories must not hold on to a renderer.
+        """
+        if self._factories is None:
+            self._factories = [
+                None if e.type == "art" else compile(e) for e in self.dynamic
+            ]
+        return self._factories
+
+    def icons(self) -> list[tuple[str, tuple[int, int]]]:
+        """Every (icon path, size) pair the template can draw."""
+        icons: list[tuple[str, tuple[int, int]]] = []
+        for element in [*self.static, *self.dynamic]:
+            if element.image is not None:
+                size = element.layout.SIZE.ABSOLUTE
+                icons.extend((path, size) for path in element.image.paths())
+        return icons
+
+
+def templatePath(name: str = "") -> str:
+    """Path of the template file ``name``, ``CARD.TEMPLATE`` by default."""
+    return join(PATHS.TEMPLATES, f"{name or CARD.TEMPLATE}.json")
+
+
+def _compile(path: str, kind: str) -> CardTemplate:
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    if data.get("version") != TEMPLATE_VERSION:
+        raise ValueError(f"{path}: unsupported template version {data.get('version')}")
+    if kind not in data:
+        raise ValueError(f"{path}: no '{kind}' card in template")
+    return CardTemplate(path, kind, data[kind])
+
+
+def getTemplate(kind: str, name: str = "") -> CardTemplate:
+    """Return the compiled ``kind`` card of template ``name``.
+
+    Templates are compiled once and recompiled when the file's mtime changes.
+    """
+    path = templatePath(name)
+    mtime = os.path.getmtime(path)
+    key = (path, kind)
+    with _lock:
+        cached = _templates.get(key)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, _compile(path, kind))
+            _templates[key] = cached
+        return cached[1]
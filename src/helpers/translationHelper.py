@@ -10,11 +10,12 @@ _current_lang = "en"
 _current_theme = "light"
 _skip_missing = False
 _print_missing = False
+_profile_render = False
 _translations: dict[str, dict[str, str]] = {}
 
 
 def _load_settings() -> None:
-    global _current_lang, _current_theme, _skip_missing, _print_missing
+    global _current_lang, _current_theme, _skip_missing, _print_missing, _profile_render
     if not os.path.exists(SETTINGS_PATH):
         with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
             json.dump(
@@ -23,6 +24,7 @@ def _load_settings() -> None:
                     "theme": "light",
                     "skip_missing": False,
                     "print_missing": False,
+                    "profile_render": False,
                 },
                 f,
                 ensure_ascii=False,
@@ -32,6 +34,7 @@ def _load_settings() -> None:
         _current_theme = "light"
         _skip_missing = False
         _print_missing = False
+        _profile_render = False
         return
     with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
         data = json.load(f)
@@ -39,6 +42,7 @@ def _load_settings() -> None:
     _current_theme = data.get("theme", "light")
     _skip_missing = data.get("skip_missing", False)
     _print_missing = data.get("print_missing", False)
+    _profile_render = data.get("profile_render", False)
 
 
 def _save_settings() -> None:
@@ -49,6 +53,7 @@ def _save_settings() -> None:
                 "theme": _current_theme,
                 "skip_missing": _skip_missing,
                 "print_missing": _print_missing,
+                "profile_render": _profile_render,
             },
             f,
             ensure_ascii=False,
@@ -56,12 +61,16 @@ def _save_settings() -> None:
         )
 
 
-def load_language(lang: str) -> None:
+def _read_language(lang: str) -> None:
     global _current_lang, _translations
     path = join(LANG_DIR, f"{lang}.json")
     with open(path, "r", encoding="utf-8") as f:
         _translations = json.load(f)
     _current_lang = lang
+
+
+def load_language(lang: str) -> None:
+    _read_language(lang)
     _save_settings()
 
 
@@ -103,6 +112,23 @@ def set_print_missing(value: bool) -> None:
     _save_settings()
 
 
+def use_missing_settings(skip_missing: bool, print_missing: bool) -> None:
+    """Handle missing art this way in this process without saving the settings."""
+    global _skip_missing, _print_missing
+    _skip_missing = skip_missing
+    _print_missing = print_missing
+
+
+def get_profile_render() -> bool:
+    return _profile_render
+
+
+def set_profile_render(value: bool) -> None:
+    global _profile_render
+    _profile_render = value
+    _save_settings()
+
+
 def translate(key: Enum) -> str:
     category = key.__class__.__name__
     return str(_translations.get(category, {}).get(key.name, key.value))
@@ -136,6 +162,7 @@ def to_enum(enum: Type[E], value: str | Enum | None) -> E:
     raise ValueError(f"Unknown value '{value}' for {enum.__name__}")
 
 
-# initialize with language from settings
+# initialize with language from settings; importing never rewrites them, so
+# render pool workers do not race on settings.json
 _load_settings()
-load_language(_current_lang)
+_read_language(_current_lang)
@@ -0,0 +1,15 @@
+import sys
+from helpers.normalizeHelper import normalizeAssets
+
+
+def main() -> None:
+    summary = normalizeAssets(force="--force" in sys.argv[1:])
+    print(
+        f"normalized {summary['normalized']}, "
+        f"up to date {summary['current']}, "
+        f"removed {summary['removed']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Sequence
+from classes.types import ArmorCategory, CasterClassType, SpellType
+from config.constants import PATHS
+from helpers.dataHelper import (
+    getArmors,
+    getItems,
+    getSpells,
+    getWeapons,
+    loadItemCache,
+    loadSpellCache,
+)
+from helpers.filterHelper import selectCards
+from helpers.normalizeHelper import artFolders
+from helpers.translationHelper import get_skip_missing
+
+CATALOGS: dict[str, Callable[[], Sequence[Any]]] = {
+    "spell": getSpells,
+    "weapon": getWeapons,
+    "armor": getArmors,
+    "item": getItems,
+}
+
+
+def _describeError(error: Exception) -> str:
+    """Summary text of ``error``; a missing file in an art folder is missing artwork."""
+    path = error.filename if isinstance(error, FileNotFoundError) else None
+    if isinstance(path, str):
+        folder = os.path.dirname(os.path.abspath(path))
+        if any(os.path.abspath(art) == folder for art in artFolders()):
+            return f"missing artwork: {path}"
+    return f"{type(error).__name__}: {error}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Render cards without the GUI and print a JSON summary."
+    )
+    parser.add_argument(
+        "--kind", nargs="+", choices=list(CATALOGS), default=list(CATALOGS)
+    )
+    parser.add_argument("--id", nargs="+", default=[], help="card ids")
+    parser.add_argument("--level", nargs="+", type=int, default=[], help="spell levels")
+    parser.add_argument(
+        "--caster-class",
+        nargs="+",
+        type=str.upper,
+        choices=[c.name for c in CasterClassType],
+        default=[],
+    )
+    parser.add_argument(
+        "--school", nargs="+", type=str.upper, choices=[s.name for s in SpellType], default=[]
+    )
+    parser.add_argument(
+        "--category",
+        nargs="+",
+        type=str.upper,
+        choices=[c.name for c in ArmorCategory],
+        default=[],
+        help="armor categories",
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes (0: all cores)")
+    parser.add_argument(
+        "--skip-missing",
+        action="store_true",
+        help="skip cards without artwork (default: the skip_missing setting)",
+    )
+    parser.add_argument("--force", action="store_true", help="render unchanged cards too")
+    parser.add_argument("--output", default=None, help="output folder (default: output/)")
+    parser.add_argument("--summary", default=None, help="also write the summary to this file")
+    args = parser.parse_args()
+
+    if args.output:
+        PATHS.setOutput(os.path.abspath(args.output))
+    from handlers.imageHandler import ImageHandler
+
+    start = time.perf_counter()
+    handler = ImageHandler()
+    transforms = {"spell": loadSpellCache(), "item": loadItemCache()}
+    skip_missing = args.skip_missing or get_skip_missing()
+    summary: dict[str, Any] = {"output": PATHS.OUTPUT, "jobs": args.jobs, "kinds": {}}
+    found: set[str] = set()
+    try:
+        for kind in args.kind:
+            kindStart = time.perf_counter()
+            cards = selectCards(
+                CATALOGS[kind](),
+                set(args.id),
+                set(args.level),
+                {CasterClassType[c] for c in args.caster_class},
+                {SpellType[s] for s in args.school},
+                {ArmorCategory[c] for c in args.category},
+            )
+            found.update(card.id for card in cards)
+            rendered, missing = handler.renderCards(
+                cards,
+                transforms["spell" if kind == "spell" else "item"],
+                skip_missing,
+                args.jobs,
+                args.force,
+            )
+            drawn = {card.id for card in rendered}
+            summary["kinds"][kind] = {
+                "selected": len(cards),
+                "rendered": len(rendered),
+                "current": len(cards) - len(rendered) - len(set(missing) - drawn),
+                "missing": missing,
+                "seconds": time.perf_counter() - kindStart,
+            }
+    except Exception as error:  # still print the summary
+        summary["error"] = _describeError(error)
+    summary["unknownIds"] = sorted(set(args.id) - found)
+    summary["seconds"] = time.perf_counter() - start
+    summary["ok"] = not (
+        "error" in summary
+        or summary["unknownIds"]
+        or any(k["missing"] for k in summary["kinds"].values())
+    )
+
+    text = json.dumps(summary, ensure_ascii=False, indent=4)
+    print(text)
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as file:
+            file.write(text)
+    sys.exit(0 if summary["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()